@@ -0,0 +1,74 @@
+"""Telemetry ring buffer: CircularQueue batch operations against one element at a time.
+
+A CircularQueue(mode="overwrite") of CAPACITY samples receives N samples in
+batches of BATCH and a reader drains half a batch after each one, so the
+buffer wraps and overwrites constantly. collections.deque(maxlen=...) is the
+reference.
+
+Usage:
+    python benchmarks/circular_queue_benchmark.py [samples]
+"""
+import sys
+import time
+from collections import deque
+
+from dsa_kuuking.queues.circular_queue.implementation.circular_queue_list import CircularQueue
+
+SAMPLES = 2_000_000
+CAPACITY = 4096
+BATCH = 256
+
+
+def run_single(samples: int) -> float:
+    queue = CircularQueue(maxsize=CAPACITY, mode="overwrite")
+    enqueue, dequeue = queue.enqueue, queue.dequeue
+    batch = list(range(BATCH))
+
+    start = time.perf_counter()
+    for _ in range(samples // BATCH):
+        for sample in batch:
+            enqueue(sample)
+        for _ in range(BATCH // 2):
+            dequeue()
+    return time.perf_counter() - start
+
+
+def run_many(samples: int) -> float:
+    queue = CircularQueue(maxsize=CAPACITY, mode="overwrite")
+    enqueue_many, dequeue_many = queue.enqueue_many, queue.dequeue_many
+    batch = list(range(BATCH))
+
+    start = time.perf_counter()
+    for _ in range(samples // BATCH):
+        enqueue_many(batch)
+        dequeue_many(BATCH // 2)
+    return time.perf_counter() - start
+
+
+def run_deque(samples: int) -> float:
+    queue = deque(maxlen=CAPACITY)
+    batch = list(range(BATCH))
+
+    start = time.perf_counter()
+    for _ in range(samples // BATCH):
+        queue.extend(batch)
+        for _ in range(BATCH // 2):
+            queue.popleft()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    samples = int(sys.argv[1]) if len(sys.argv) > 1 else SAMPLES
+    print(f"{samples:,} samples in batches of {BATCH}, ring of {CAPACITY}")
+
+    single = run_single(samples)
+    for label, elapsed in (
+        ("enqueue/dequeue", single),
+        ("enqueue_many/dequeue_many", run_many(samples)),
+        ("deque(maxlen)", run_deque(samples)),
+    ):
+        print(f"{label:>26}: {elapsed:.4f}s, {samples / elapsed:>14,.0f} samples/s ({single / elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Thread pipeline throughput of SPSCQueue and MPMCQueue against queue.Queue.
+
+N producer threads put ITEMS items in total through a queue of MAXSIZE slots
+and N consumer threads get them, for N in 1, 4 and 16. SPSCQueue only allows
+one producer and one consumer, so it only runs at N = 1.
+
+Usage:
+    python benchmarks/concurrent_queue_benchmark.py [items]
+"""
+import queue
+import sys
+import threading
+import time
+
+from dsa_kuuking.queues.concurrent_queue.implementation.concurrent_queue import MPMCQueue, SPSCQueue
+
+ITEMS = 400_000
+MAXSIZE = 1024
+THREADS = (1, 4, 16)
+
+
+def run(channel, threads: int, items: int) -> float:
+    per_thread = items // threads
+    put, get = channel.put, channel.get
+
+    def produce():
+        for item in range(per_thread):
+            put(item)
+
+    def consume():
+        for _ in range(per_thread):
+            get()
+
+    workers = [threading.Thread(target=produce) for _ in range(threads)]
+    workers += [threading.Thread(target=consume) for _ in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else ITEMS
+    print(f"{items:,} items through {MAXSIZE} slots")
+
+    for threads in THREADS:
+        channels = [("queue.Queue", queue.Queue), ("MPMCQueue", MPMCQueue)]
+        if threads == 1:
+            channels.append(("SPSCQueue", SPSCQueue))
+
+        baseline = None
+        for label, factory in channels:
+            elapsed = run(factory(MAXSIZE), threads, items)
+            baseline = baseline or elapsed
+            print(f"{threads:>2}+{threads:<2} threads | {label:>11}: {items / elapsed:>12,.0f} items/s ({baseline / elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Memory per element and enqueue throughput: block Deque against the node-based Deque.
+
+Both deques get N elements with enqueue_rear (the elements are allocated up
+front, so only the deque's own memory is counted); collections.deque is the
+reference. Memory and time are measured in separate runs, because tracemalloc
+slows allocation down.
+
+Usage:
+    python benchmarks/deque_block_benchmark.py [elements]
+"""
+import sys
+import time
+import tracemalloc
+from collections import deque
+
+from dsa_kuuking.queues.deque.implementation.deque_block import Deque as BlockDeque
+from dsa_kuuking.queues.deque.implementation.deque_linked_list import Deque as NodeDeque
+
+ELEMENTS = 200_000
+
+
+class ReferenceDeque:
+    def __init__(self):
+        self._deque = deque()
+        self.enqueue_rear = self._deque.append
+
+
+def fill(factory, elements: list[int]):
+    dq = factory()
+    enqueue_rear = dq.enqueue_rear
+    for element in elements:
+        enqueue_rear(element)
+    return dq
+
+
+def bytes_per_element(factory, elements: list[int]) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    dq = fill(factory, elements)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del dq
+    return used / len(elements)
+
+
+def seconds(factory, elements: list[int]) -> float:
+    start = time.perf_counter()
+    fill(factory, elements)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else ELEMENTS
+    elements = list(range(10**9, 10**9 + count))
+    print(f"{count:,} elements")
+
+    for label, factory in (("node Deque", NodeDeque), ("block Deque", BlockDeque), ("collections.deque", ReferenceDeque)):
+        per_element = bytes_per_element(factory, elements)
+        elapsed = seconds(factory, elements)
+        print(f"{label:>17}: {per_element:6.1f} bytes/element, {count / elapsed:>12,.0f} enqueues/s")
+
+
+if __name__ == "__main__":
+    main()
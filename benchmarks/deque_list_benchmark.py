@@ -0,0 +1,84 @@
+"""Front and rear operations of the list Deque against list insert(0)/pop(0).
+
+Each workload does N enqueues followed by N dequeues at one end. The legacy
+deque keeps a plain list: appends at the rear, insert(0)/pop(0) at the front,
+so its front operations are O(n); it is skipped above LEGACY_LIMIT elements.
+collections.deque is the reference.
+
+Usage:
+    python benchmarks/deque_list_benchmark.py [operations]
+"""
+import sys
+import time
+from collections import deque
+
+from dsa_kuuking.queues.deque.implementation.deque_list import Deque
+
+OPERATIONS = 200_000
+LEGACY_LIMIT = 100_000
+
+
+class LegacyDeque:
+    def __init__(self):
+        self._deque = []
+
+    def enqueue_front(self, element):
+        self._deque.insert(0, element)
+
+    def enqueue_rear(self, element):
+        self._deque.append(element)
+
+    def dequeue_front(self):
+        return self._deque.pop(0)
+
+    def dequeue_rear(self):
+        return self._deque.pop()
+
+
+class ReferenceDeque:
+    def __init__(self):
+        self._deque = deque()
+        self.enqueue_front = self._deque.appendleft
+        self.enqueue_rear = self._deque.append
+        self.dequeue_front = self._deque.popleft
+        self.dequeue_rear = self._deque.pop
+
+
+def run(dq, end: str, operations: int) -> float:
+    enqueue, dequeue = getattr(dq, f"enqueue_{end}"), getattr(dq, f"dequeue_{end}")
+    start = time.perf_counter()
+    for element in range(operations):
+        enqueue(element)
+    for _ in range(operations):
+        dequeue()
+    return time.perf_counter() - start
+
+
+def run_extend(operations: int) -> float:
+    dq = Deque()
+    batch = list(range(1024))
+    start = time.perf_counter()
+    for _ in range(operations // len(batch)):
+        dq.extend_front(batch)
+        dq.extend_rear(batch)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    operations = int(sys.argv[1]) if len(sys.argv) > 1 else OPERATIONS
+    print(f"{operations:,} enqueues + {operations:,} dequeues per end")
+
+    for end in ("front", "rear"):
+        for label, factory in (("list insert/pop", LegacyDeque), ("Deque", Deque), ("collections.deque", ReferenceDeque)):
+            if factory is LegacyDeque and operations > LEGACY_LIMIT:
+                print(f"{end:>5} | {label:>17}: skipped above {LEGACY_LIMIT:,} operations")
+                continue
+            elapsed = run(factory(), end, operations)
+            print(f"{end:>5} | {label:>17}: {elapsed:.4f}s, {2 * operations / elapsed:>12,.0f} ops/s")
+
+    elapsed = run_extend(operations)
+    print(f"extend_front + extend_rear in batches of 1024: {2 * operations / elapsed:,.0f} elements/s")
+
+
+if __name__ == "__main__":
+    main()
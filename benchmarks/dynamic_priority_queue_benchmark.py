@@ -0,0 +1,62 @@
+"""Time DynamicPriorityQueue.reprioritise against the original linear-scan step_aside.
+
+The legacy queue finds the person by scanning the heap list and re-pushes them
+(the original code also broke the heap by popping from its middle; this copy
+re-heapifies so that the comparison is fair to it).
+
+Usage:
+    python benchmarks/dynamic_priority_queue_benchmark.py [people] [changes]
+"""
+import heapq
+import random
+import sys
+import time
+
+from dsa_kuuking.queues.priority_queue.implementation.priority_queue import DynamicPriorityQueue
+
+PEOPLE = 20_000
+CHANGES = 2_000
+
+
+class LegacyDynamicPriorityQueue:
+    def __init__(self):
+        self.queue = []
+        self.time = 0
+
+    def add_person(self, name, priority):
+        heapq.heappush(self.queue, (priority, self.time, name))
+        self.time += 1
+
+    def reprioritise(self, name, priority):
+        for i, (_, _, person) in enumerate(self.queue):
+            if person == name:
+                _, time, person = self.queue.pop(i)
+                heapq.heapify(self.queue)
+                heapq.heappush(self.queue, (priority, time, person))
+                break
+
+
+def run(queue_class: type, people: int, changes: list[tuple[int, int]]) -> float:
+    pq = queue_class()
+    for person in range(people):
+        pq.add_person(person, random.randrange(10))
+
+    start = time.perf_counter()
+    for person, priority in changes:
+        pq.reprioritise(person, priority)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    people = int(sys.argv[1]) if len(sys.argv) > 1 else PEOPLE
+    changes = int(sys.argv[2]) if len(sys.argv) > 2 else CHANGES
+    moves = [(random.randrange(people), random.randrange(10)) for _ in range(changes)]
+
+    legacy = run(LegacyDynamicPriorityQueue, people, moves)
+    current = run(DynamicPriorityQueue, people, moves)
+    print(f"{people:,} people, {changes:,} priority changes")
+    print(f"legacy scan: {legacy:.4f}s, tombstones: {current:.4f}s, speedup {legacy / current:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
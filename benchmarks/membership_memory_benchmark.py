@@ -0,0 +1,60 @@
+"""Memory per element of the list Queue, Stack and CircularQueue with and without membership tracking.
+
+Each structure is filled with N distinct ints (allocated up front, so only the
+structure's own memory is counted) and the traced allocation is divided by N.
+The lean default keeps no index; track_membership=True keeps a count per
+element for O(1) `in`. The membership column times `in` for an element near the
+back, the worst case of the lean mode's scan.
+
+Usage:
+    python benchmarks/membership_memory_benchmark.py [elements]
+"""
+import sys
+import time
+import tracemalloc
+
+from dsa_kuuking.queues.circular_queue.implementation.circular_queue_list import CircularQueue
+from dsa_kuuking.queues.queue.implementation.queue_list import Queue
+from dsa_kuuking.stacks.implementation.stack_list import Stack
+
+ELEMENTS = 100_000
+LOOKUPS = 20
+
+
+def measure(factory, add_name: str, elements: list[int]) -> tuple[float, float]:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    structure = factory()
+    add = getattr(structure, add_name)
+    for element in elements:
+        add(element)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    target = elements[-1]
+    start = time.perf_counter()
+    for _ in range(LOOKUPS):
+        assert target in structure
+    lookup = (time.perf_counter() - start) / LOOKUPS
+    return used / len(elements), lookup
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else ELEMENTS
+    elements = list(range(10**9, 10**9 + count))
+    cases = (
+        ("Queue", lambda track: Queue(track_membership=track), "enqueue"),
+        ("Stack", lambda track: Stack(track_membership=track), "append"),
+        ("CircularQueue", lambda track: CircularQueue(maxsize=count, track_membership=track), "enqueue"),
+    )
+
+    print(f"{count:,} distinct elements")
+    for name, factory, add_name in cases:
+        for track in (False, True):
+            per_element, lookup = measure(lambda: factory(track), add_name, elements)
+            mode = "tracked" if track else "lean"
+            print(f"{name:>13} {mode:>7}: {per_element:6.1f} bytes/element, `in` {lookup * 1e6:9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
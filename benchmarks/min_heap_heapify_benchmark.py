@@ -0,0 +1,46 @@
+"""Compare MinHeap bulk construction with heapq.heapify.
+
+Usage:
+    python benchmarks/min_heap_heapify_benchmark.py [size]
+
+One-by-one insertion is O(n log n), so it only runs up to INSERT_LIMIT items.
+"""
+import heapq
+import random
+import sys
+import time
+
+from dsa_kuuking.heaps.min_heap.implementation.min_heap import MinHeap
+
+SIZE = 10_000_000
+INSERT_LIMIT = 1_000_000
+
+
+def measure(label: str, build) -> None:
+    start = time.perf_counter()
+    build()
+    print(f"{label:>28}: {time.perf_counter() - start:.4f}s")
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else SIZE
+    seed = random.random()
+    print(f"Building a heap of {size:,} ints")
+
+    def values():
+        generator = random.Random(seed)
+        return (generator.randrange(size) for _ in range(size))
+
+    data = list(values())
+
+    heapq_data = data.copy()
+    measure("heapq.heapify(list)", lambda: heapq.heapify(heapq_data))
+    measure("MinHeap.from_iterable(list)", lambda: MinHeap.from_iterable(data))
+    measure("MinHeap.from_iterable(gen)", lambda: MinHeap.from_iterable(values()))
+
+    if size <= INSERT_LIMIT:
+        measure("MinHeap.insert_many(list)", lambda: MinHeap().insert_many(data))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Micro-benchmark of the MinHeap sift loops.
+
+Compares MinHeap with a copy of the original loops, which went through
+is_leaf/has_left_child/has_right_child/left_child/right_child/swap on every
+level, on insert, pop, pushpop and replace. Both sides run the same
+operation: the legacy pushpop/replace do the same single sift as MinHeap's,
+only with the old loop, so every row compares sift loops and nothing else.
+
+Usage:
+    python benchmarks/min_heap_sift_benchmark.py [heap_size] [operations]
+"""
+import random
+import sys
+import time
+from typing import Callable
+
+from dsa_kuuking.heaps.min_heap.implementation.min_heap import MinHeap
+
+HEAP_SIZE = 100_000
+OPERATIONS = 200_000
+REPEAT = 5
+
+
+class LegacyMinHeap(MinHeap):
+    """MinHeap with the method-dispatching sift loops it used to have."""
+
+    def pop(self):
+        self.swap(0, len(self._min_heap) - 1)
+        result = self._min_heap.pop()
+        self.heapify_down(0)
+        return result
+
+    def insert(self, element):
+        self._min_heap.append(element)
+        self.heapify_up(len(self._min_heap) - 1)
+
+    def heapify_up(self, index):
+        while self.has_parent(index) and self._min_heap[self.parent(index)] > self._min_heap[index]:
+            parent_index = self.parent(index)
+            self.swap(index, parent_index)
+            index = parent_index
+
+    def heapify_down(self, index):
+        while not self.is_leaf(index):
+            smallest_element_index = self.left_child(index)
+
+            if self.has_right_child(index):
+                right_child_index = self.right_child(index)
+                if self._min_heap[smallest_element_index] > self._min_heap[right_child_index]:
+                    smallest_element_index = right_child_index
+
+            if not self._min_heap[index] > self._min_heap[smallest_element_index]:
+                break
+
+            self.swap(index, smallest_element_index)
+            index = smallest_element_index
+
+    def pushpop(self, element):
+        heap = self._min_heap
+        if heap and heap[0] < element:
+            element, heap[0] = heap[0], element
+            self.heapify_down(0)
+        return element
+
+    def replace(self, element):
+        result = self._min_heap[0]
+        self._min_heap[0] = element
+        self.heapify_down(0)
+        return result
+
+
+def time_operation(heap_class: type, name: str, seed_data: list[int], values: list[int]) -> float:
+    heap = heap_class().heapify(seed_data)
+
+    if name == "pop":
+        operation = heap.pop
+        start = time.perf_counter()
+        for _ in values:
+            operation()
+        return time.perf_counter() - start
+
+    operation: Callable = {
+        "insert": heap.insert,
+        "insert (to root)": heap.insert,
+        "pushpop": heap.pushpop,
+        "replace": heap.replace,
+    }[name]
+
+    start = time.perf_counter()
+    for value in values:
+        operation(value)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    heap_size = int(sys.argv[1]) if len(sys.argv) > 1 else HEAP_SIZE
+    operations = int(sys.argv[2]) if len(sys.argv) > 2 else OPERATIONS
+
+    seed_data = [random.randrange(heap_size * 10) for _ in range(heap_size + operations)]
+    values = [random.randrange(heap_size * 10) for _ in range(operations)]
+
+    print(f"heap size {heap_size:,}, {operations:,} operations each, best of {REPEAT}")
+    # every insert of a new minimum sifts all the way up to the root
+    descending = list(range(-1, -operations - 1, -1))
+
+    for name in ("insert", "insert (to root)", "pop", "pushpop", "replace"):
+        # pop needs enough elements to drain 'operations' of them
+        data = seed_data if name == "pop" else seed_data[:heap_size]
+        inputs = descending if name == "insert (to root)" else values
+
+        legacy = min(time_operation(LegacyMinHeap, name, data, inputs) for _ in range(REPEAT))
+        current = min(time_operation(MinHeap, name, data, inputs) for _ in range(REPEAT))
+        print(f"{name:>16}: legacy {legacy:.4f}s, current {current:.4f}s, speedup {legacy / current:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Replay the same operation traces against the Python and native (Rust) FIFO containers.
+
+Two seeded traces of N operations (1M by default) are generated up front:
+
+- deque: enqueue/dequeue at either end (list Deque, block Deque, native Deque)
+- ring: single and batched enqueue/dequeue on an "overwrite" ring of RING_SIZE
+  (CircularQueue, native RingBuffer)
+
+Every implementation replays a trace through the same method names, and the
+dequeued elements are checked to be identical before the timings are printed.
+The native rows are skipped when the extension is not built.
+
+Usage:
+    maturin develop --release
+    python benchmarks/native_fifo_benchmark.py [operations]
+"""
+import random
+import sys
+import time
+
+from dsa_kuuking.queues.circular_queue.implementation.circular_queue_list import CircularQueue
+from dsa_kuuking.queues.deque.implementation.deque_block import Deque as BlockDeque
+from dsa_kuuking.queues.deque.implementation.deque_list import Deque as ListDeque
+
+try:
+    from dsa_kuuking.burmese_native import Deque as NativeDeque, RingBuffer
+except ImportError:
+    NativeDeque = RingBuffer = None
+
+OPERATIONS = 1_000_000
+RING_SIZE = 1_024
+BATCH = 64
+SEED = 42
+
+
+def deque_trace(operations: int) -> list[tuple[str, int]]:
+    """Enqueue at either end, dequeue at either end when not empty."""
+    rng = random.Random(SEED)
+    trace, size = [], 0
+    for i in range(operations):
+        if size and rng.random() < 0.45:
+            trace.append((rng.choice(("dequeue_front", "dequeue_rear")), 0))
+            size -= 1
+        else:
+            trace.append((rng.choice(("enqueue_front", "enqueue_rear")), i))
+            size += 1
+    return trace
+
+
+def ring_trace(operations: int) -> list[tuple[str, object]]:
+    """Mostly single enqueues and dequeues, with a batch now and then; a batch counts as one operation."""
+    rng = random.Random(SEED)
+    trace = []
+    for i in range(operations):
+        roll = rng.random()
+        if roll < 0.05:
+            trace.append(("enqueue_many", list(range(i, i + BATCH))))
+        elif roll < 0.10:
+            trace.append(("dequeue_many", BATCH))
+        elif roll < 0.55:
+            trace.append(("enqueue", i))
+        else:
+            trace.append(("dequeue", 0))
+    return trace
+
+
+def replay_deque(dq, trace: list[tuple[str, int]]) -> tuple[float, list]:
+    methods = {name: getattr(dq, name) for name in ("enqueue_front", "enqueue_rear", "dequeue_front", "dequeue_rear")}
+    out = []
+
+    start = time.perf_counter()
+    for name, element in trace:
+        if name[0] == "e":
+            methods[name](element)
+        else:
+            out.append(methods[name]().unwrap())
+    return time.perf_counter() - start, out
+
+
+def replay_ring(ring, trace: list[tuple[str, object]]) -> tuple[float, list]:
+    methods = {name: getattr(ring, name) for name in ("enqueue", "enqueue_many", "dequeue", "dequeue_many")}
+    out = []
+
+    start = time.perf_counter()
+    for name, argument in trace:
+        if name == "dequeue":
+            # the trace does not know how full an overwrite ring is
+            if ring:
+                out.append(methods[name]().unwrap())
+        elif name == "dequeue_many":
+            out.extend(methods[name](argument))
+        else:
+            methods[name](argument)
+    return time.perf_counter() - start, out
+
+
+def report(title: str, operations: int, runs: list[tuple[str, float, list]]) -> None:
+    print(title)
+    _, baseline, expected = runs[0]
+    for name, elapsed, out in runs:
+        if out != expected:
+            raise AssertionError(f"{name} dequeued different elements than {runs[0][0]}")
+        print(f"{name:>22}: {elapsed:.4f}s ({operations / elapsed / 1e6:.2f}M ops/s, {baseline / elapsed:.2f}x)")
+
+
+def main() -> None:
+    operations = int(sys.argv[1]) if len(sys.argv) > 1 else OPERATIONS
+    if NativeDeque is None:
+        print("the native extension is not built: run `maturin develop --release` for the native rows")
+
+    trace = deque_trace(operations)
+    deques = [("Deque (list)", ListDeque), ("Deque (blocks)", BlockDeque), ("burmese_native.Deque", NativeDeque)]
+    report(
+        f"deque trace, {operations:,} operations",
+        operations,
+        [(name, *replay_deque(cls(), trace)) for name, cls in deques if cls is not None],
+    )
+
+    trace = ring_trace(operations)
+    rings = [("CircularQueue", CircularQueue), ("burmese_native.RingBuffer", RingBuffer)]
+    report(
+        f"ring trace, {operations:,} operations, maxsize {RING_SIZE}, overwrite",
+        operations,
+        [(name, *replay_ring(cls(maxsize=RING_SIZE, mode="overwrite"), trace)) for name, cls in rings if cls is not None],
+    )
+
+
+if __name__ == "__main__":
+    main()
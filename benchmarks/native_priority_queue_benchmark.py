@@ -0,0 +1,94 @@
+"""Compare the native (Rust) PriorityQueue with the Python one and heapq.
+
+Each run pushes N items with random priorities and pops them all again,
+i.e. 2N operations (1M by default). PriorityQueue(engine="native") measures
+the cost of the Python dispatch layer on top of the native heap. The native queue is also timed with its
+batch API (push_many, then pop_many in chunks of BATCH, or drain), which
+takes the lock once per call instead of once per item.
+
+Usage:
+    maturin develop --release
+    python benchmarks/native_priority_queue_benchmark.py [pushes]
+"""
+import heapq
+import random
+import sys
+import time
+
+from dsa_kuuking.queues.priority_queue.implementation.priority_queue import PriorityQueue
+
+try:
+    from dsa_kuuking.burmese_native import PriorityQueue as NativePriorityQueue
+except ImportError:
+    NativePriorityQueue = None
+
+PUSHES = 500_000
+BATCH = 1_000
+
+
+def run_python(priorities: list[int], engine: str = "heap") -> float:
+    pq = PriorityQueue(engine=engine)
+    start = time.perf_counter()
+    for index, priority in enumerate(priorities):
+        pq.enqueue(index, priority)
+    while not pq.is_empty():
+        pq.dequeue()
+    return time.perf_counter() - start
+
+
+def run_heapq(priorities: list[int]) -> float:
+    heap = []
+    start = time.perf_counter()
+    for index, priority in enumerate(priorities):
+        heapq.heappush(heap, (priority, index, index))
+    while heap:
+        heapq.heappop(heap)
+    return time.perf_counter() - start
+
+
+def run_native(priorities: list[int]) -> float:
+    pq = NativePriorityQueue()
+    start = time.perf_counter()
+    for index, priority in enumerate(priorities):
+        pq.push(priority, index)
+    while pq:
+        pq.pop()
+    return time.perf_counter() - start
+
+
+def run_native_batch(priorities: list[int]) -> float:
+    pq = NativePriorityQueue()
+    start = time.perf_counter()
+    pq.push_many(zip(priorities, range(len(priorities))))
+    while pq:
+        pq.pop_many(BATCH)
+    return time.perf_counter() - start
+
+
+def run_native_drain(priorities: list[int]) -> float:
+    pq = NativePriorityQueue()
+    start = time.perf_counter()
+    pq.push_many(zip(priorities, range(len(priorities))))
+    pq.drain()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    pushes = int(sys.argv[1]) if len(sys.argv) > 1 else PUSHES
+    priorities = [random.randint(0, pushes) for _ in range(pushes)]
+    print(f"{pushes:,} pushes + {pushes:,} pops")
+
+    print(f"{'heapq':>22}: {run_heapq(priorities):.4f}s")
+    print(f"{'PriorityQueue (heap)':>22}: {run_python(priorities):.4f}s")
+
+    if NativePriorityQueue is None:
+        print(f"{'burmese_native':>22}: skipped (extension not built, run 'maturin develop --release')")
+    else:
+        print(f"{'burmese_native':>22}: {run_native(priorities):.4f}s")
+        print(f"{'PriorityQueue (native)':>22}: {run_python(priorities, 'native'):.4f}s")
+        print(f"{'push_many + pop_many':>22}: {run_native_batch(priorities):.4f}s")
+        print(f"{'push_many + drain':>22}: {run_native_drain(priorities):.4f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Producer/consumer throughput of the native PriorityQueue against queue.PriorityQueue.
+
+For every thread count T, T producers push ITEMS items in total and T consumers
+pop them with blocking pops. The native consumers stop when close() has been
+called and the queue is drained; the queue.PriorityQueue consumers stop on a
+sentinel. The native queue's contention stats are printed after each run.
+
+Usage:
+    maturin develop --release
+    python benchmarks/native_priority_queue_threads_benchmark.py [items]
+"""
+import queue
+import random
+import sys
+import threading
+import time
+from typing import Callable
+
+try:
+    from dsa_kuuking.burmese_native import PriorityQueue as NativePriorityQueue
+except ImportError:
+    NativePriorityQueue = None
+
+ITEMS = 200_000
+THREAD_COUNTS = (1, 2, 4, 8, 16, 32)
+STOP = float("inf")
+
+
+def run_threads(producer: Callable[[list[int]], None], consumer: Callable[[], None], chunks: list[list[int]],
+                after_producers: Callable[[], None]) -> float:
+    producers = [threading.Thread(target=producer, args=(chunk,)) for chunk in chunks]
+    consumers = [threading.Thread(target=consumer) for _ in chunks]
+
+    start = time.perf_counter()
+    for thread in consumers + producers:
+        thread.start()
+    for thread in producers:
+        thread.join()
+    after_producers()
+    for thread in consumers:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def run_stdlib(chunks: list[list[int]]) -> float:
+    pq = queue.PriorityQueue()
+    sequence = iter(range(sys.maxsize))
+
+    def producer(priorities: list[int]) -> None:
+        for priority in priorities:
+            pq.put((priority, next(sequence), priority))
+
+    def consumer() -> None:
+        while pq.get()[0] != STOP:
+            pass
+
+    def stop() -> None:
+        for _ in chunks:
+            pq.put((STOP, next(sequence), None))
+
+    return run_threads(producer, consumer, chunks, stop)
+
+
+def run_native(chunks: list[list[int]]) -> tuple[float, dict]:
+    pq = NativePriorityQueue()
+
+    def producer(priorities: list[int]) -> None:
+        for priority in priorities:
+            pq.push(priority, priority)
+
+    def consumer() -> None:
+        while pq.pop(block=True) is not None:
+            pass
+
+    return run_threads(producer, consumer, chunks, pq.close), pq.stats()
+
+
+def main() -> None:
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else ITEMS
+    priorities = [random.randrange(items) for _ in range(items)]
+    print(f"{items:,} items through T producers and T consumers")
+
+    if NativePriorityQueue is None:
+        print("burmese_native: skipped (extension not built, run 'maturin develop --release')")
+
+    for threads in THREAD_COUNTS:
+        chunks = [priorities[index::threads] for index in range(threads)]
+        stdlib = run_stdlib(chunks)
+        line = f"T={threads:>2}: queue.PriorityQueue {items / stdlib:>12,.0f} items/s"
+
+        if NativePriorityQueue is not None:
+            native, stats = run_native(chunks)
+            line += (f", native {items / native:>12,.0f} items/s ({stdlib / native:.1f}x)"
+                     f" | max depth {stats['max_depth']:,}, contended locks {stats['contended_locks']:,}"
+                     f" ({stats['lock_wait_seconds']:.3f}s), blocked pops {stats['blocked_pops']:,}")
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Event-ingest benchmark for PriorityQueueDatetime.
+
+N events arrive slightly out of order (timestamps jittered by up to JITTER
+seconds). In the "streaming" run they are drained with pop_due once per
+simulated second, so the queue stays shallow; in the "backlog" run they all
+queue up before a single drain. The legacy queue is the original insort/pop(0)
+list: its memmove is cheap while the queue is shallow, but every dequeue is
+O(n) in the queue depth, so it is skipped above LEGACY_LIMIT events.
+
+Usage:
+    python benchmarks/priority_queue_datetime_benchmark.py [events]
+"""
+import random
+import sys
+import time
+from bisect import insort
+
+from dsa_kuuking.queues.priority_queue.implementation.priority_queue import PriorityQueueDatetime
+from dsa_kuuking.queues.priority_queue.implementation.priority_queue_engines import native_engine_available
+
+EVENTS = 1_000_000
+EVENTS_PER_SECOND = 10_000
+JITTER = 2.0
+LEGACY_LIMIT = 200_000
+
+
+class LegacyPriorityQueueDatetime:
+    def __init__(self):
+        self.queue = []
+
+    def enqueue(self, item, timestamp):
+        insort(self.queue, (timestamp, item), key=lambda x: x[0])
+
+    def pop_due(self, now):
+        due = []
+        while self.queue and self.queue[0][0] <= now:
+            due.append(self.queue.pop(0)[1])
+        return due
+
+
+def run_streaming(pq, timestamps: list[float]) -> float:
+    start = time.perf_counter()
+    second = 0.0
+    for index, timestamp in enumerate(timestamps):
+        pq.enqueue(index, timestamp)
+        if index % EVENTS_PER_SECOND == 0:
+            second += 1.0
+            pq.pop_due(second)
+    pq.pop_due(float("inf"))
+    return time.perf_counter() - start
+
+
+def run_backlog(pq, timestamps: list[float]) -> float:
+    start = time.perf_counter()
+    for index, timestamp in enumerate(timestamps):
+        pq.enqueue(index, timestamp)
+    pq.pop_due(float("inf"))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else EVENTS
+    timestamps = [index / EVENTS_PER_SECOND + random.uniform(0, JITTER) for index in range(events)]
+    print(f"{events:,} events, {EVENTS_PER_SECOND:,}/s, up to {JITTER}s out of order")
+
+    engines = ["heap"] + (["native"] if native_engine_available() else [])
+
+    for name, run in (("streaming", run_streaming), ("backlog", run_backlog)):
+        if events <= LEGACY_LIMIT:
+            print(f"{name:>9} | {'insort + pop(0)':>15}: {run(LegacyPriorityQueueDatetime(), timestamps):.4f}s")
+        else:
+            print(f"{name:>9} | {'insort + pop(0)':>15}: skipped above {LEGACY_LIMIT:,} events")
+
+        for engine in engines:
+            print(f"{name:>9} | {engine:>15}: {run(PriorityQueueDatetime(engine=engine), timestamps):.4f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Compare the PriorityQueue engines on enqueue + dequeue throughput.
+
+Usage:
+    python benchmarks/priority_queue_engines_benchmark.py [size ...]
+
+The linked-list engine is O(n) per enqueue, so it is skipped above
+LINKED_LIST_LIMIT items (1M enqueues would take hours).
+"""
+import random
+import sys
+import time
+
+from dsa_kuuking.queues.priority_queue.implementation.priority_queue import PriorityQueue
+
+SIZES = [10_000, 100_000, 1_000_000]
+LINKED_LIST_LIMIT = 100_000
+
+
+def run(engine: str, priorities: list[int]) -> tuple[float, float]:
+    pq = PriorityQueue(engine=engine)
+
+    start = time.perf_counter()
+    for index, priority in enumerate(priorities):
+        pq.enqueue(f"Task {index}", priority)
+    enqueue_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    while not pq.is_empty():
+        pq.dequeue()
+    dequeue_time = time.perf_counter() - start
+
+    return enqueue_time, dequeue_time
+
+
+def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or SIZES
+
+    for size in sizes:
+        priorities = [random.randint(0, size) for _ in range(size)]
+
+        for engine in ("heap", "linked_list"):
+            if engine == "linked_list" and size > LINKED_LIST_LIMIT:
+                print(f"{engine:>12} {size:>9,}: skipped (quadratic)")
+                continue
+
+            enqueue_time, dequeue_time = run(engine, priorities)
+            print(f"{engine:>12} {size:>9,}: enqueue {enqueue_time:.4f}s, dequeue {dequeue_time:.4f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Soak test of the linked Queue: N operations at a steady depth, with memory sampled along the way.
+
+The queue is filled to STEADY_SIZE elements, then alternates enqueue and
+dequeue (plus an enqueue_many/dequeue round every BATCH operations) for N
+operations in total. Every N / SAMPLES operations it records
+sys.getallocatedblocks(), which is cheap enough not to disturb the timing. A
+flat line means that dequeued nodes are released; the previous queue only
+peeked on dequeue and grew by one node per enqueue.
+
+Usage:
+    python benchmarks/queue_linked_list_soak_benchmark.py [operations]
+"""
+import sys
+import time
+
+from dsa_kuuking.queues.queue.implementation.queue_linked_list import Queue
+
+OPERATIONS = 10_000_000
+STEADY_SIZE = 10_000
+BATCH = 1_000
+SAMPLES = 10
+
+
+def main() -> None:
+    operations = int(sys.argv[1]) if len(sys.argv) > 1 else OPERATIONS
+    queue = Queue()
+    queue.enqueue_many(range(STEADY_SIZE))
+    enqueue, dequeue, enqueue_many = queue.enqueue, queue.dequeue, queue.enqueue_many
+    batch = list(range(BATCH))
+
+    print(f"{operations:,} operations at a depth of {STEADY_SIZE:,}")
+    baseline = sys.getallocatedblocks()
+    sample_every = operations // SAMPLES
+    done = 0
+    start = time.perf_counter()
+
+    while done < operations:
+        for element in range(sample_every // 2 - BATCH):
+            enqueue(element)
+            dequeue()
+        enqueue_many(batch)
+        for _ in range(BATCH):
+            dequeue()
+        done += sample_every
+
+        elapsed = time.perf_counter() - start
+        blocks = sys.getallocatedblocks() - baseline
+        print(f"{done:>12,} ops: {done / elapsed:>10,.0f} ops/s, depth {len(queue):,}, allocated blocks {blocks:+,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Throughput of the list Queue against collections.deque.
+
+Two workloads, each N enqueues and N dequeues: "batch" fills the queue and then
+drains it, "steady" keeps it at STEADY_SIZE elements with alternating
+enqueue/dequeue. The legacy queue is Queue with its original insert(0)/pop(0)
+list storage (O(n) per operation); it is skipped above LEGACY_LIMIT elements. The legacy queue
+prints a line per operation, as Queue used to, so stdout is sent to /dev/null while it runs.
+
+Usage:
+    python benchmarks/queue_list_benchmark.py [operations]
+"""
+import os
+import sys
+import time
+from collections import deque
+from contextlib import redirect_stdout
+
+from dsa_kuuking.queues.queue.implementation.queue_list import Queue
+from dsa_kuuking.types.ResultType import ResultType
+
+OPERATIONS = 200_000
+STEADY_SIZE = 10_000
+LEGACY_LIMIT = 50_000
+
+
+class LegacyQueue(Queue):
+    """Queue with its original storage: insert(0) to enqueue, pop(0) to dequeue."""
+
+    def __init__(self):
+        super().__init__()
+        self._legacy = []
+
+    def enqueue(self, element):
+        result = self.manage_size(action="enqueue", value=element)
+        print(result.unwrap())
+        self._legacy.insert(0, element)
+
+    def dequeue(self):
+        peek_result = self.get_peek()
+        result = self.manage_size(action="dequeue", value=peek_result.unwrap())
+        print(result.unwrap())
+        return ResultType(value=self._legacy.pop(0))
+
+    def get_peek(self):
+        return ResultType(value=self._legacy[0])
+
+
+class DequeQueue:
+    def __init__(self):
+        self._queue = deque()
+        self.enqueue = self._queue.append
+        self.dequeue = self._queue.popleft
+
+
+def run_batch(queue, operations: int) -> float:
+    enqueue, dequeue = queue.enqueue, queue.dequeue
+    start = time.perf_counter()
+    for element in range(operations):
+        enqueue(element)
+    for _ in range(operations):
+        dequeue()
+    return time.perf_counter() - start
+
+
+def run_steady(queue, operations: int) -> float:
+    enqueue, dequeue = queue.enqueue, queue.dequeue
+    for element in range(STEADY_SIZE):
+        enqueue(element)
+
+    start = time.perf_counter()
+    for element in range(STEADY_SIZE, STEADY_SIZE + operations):
+        enqueue(element)
+        dequeue()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    operations = int(sys.argv[1]) if len(sys.argv) > 1 else OPERATIONS
+    print(f"{operations:,} enqueues + {operations:,} dequeues")
+
+    for name, run in (("batch", run_batch), ("steady", run_steady)):
+        results = {"collections.deque": run(DequeQueue(), operations)}
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            results["Queue (ring buffer)"] = run(Queue(), operations)
+            if operations <= LEGACY_LIMIT:
+                results["insert(0)/pop(0)"] = run(LegacyQueue(), operations)
+
+        for label, elapsed in results.items():
+            print(f"{name:>6} | {label:>19}: {elapsed:.4f}s, {2 * operations / elapsed:>12,.0f} ops/s")
+        if operations > LEGACY_LIMIT:
+            print(f"{name:>6} | {'insert(0)/pop(0)':>19}: skipped above {LEGACY_LIMIT:,} operations")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Enqueue/dequeue throughput of Queue and CircularQueue with each observer against the old print().
+
+"print" is the behaviour before the observer hook: a print() per operation.
+Its stdout goes to /dev/null, the cheapest possible sink, so a terminal or a
+log collector only makes it slower. Each run does N enqueues followed by N dequeues.
+
+Usage:
+    python benchmarks/queue_observer_benchmark.py [operations]
+"""
+import logging
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+from typing import Any, override
+
+from dsa_kuuking.interfaces.queue_observer_interface import QueueObserverInterface
+from dsa_kuuking.queues.circular_queue.implementation.circular_queue_list import CircularQueue
+from dsa_kuuking.queues.queue.implementation.queue_list import Queue
+from dsa_kuuking.queues.queue.implementation.queue_observers import CountingObserver, LoggingObserver, NullObserver
+from dsa_kuuking.types.enums.queue_event import QueueEvent
+
+OPERATIONS = 200_000
+
+
+class PrintObserver(QueueObserverInterface):
+    """The old behaviour: one success line on stdout per operation."""
+
+    @override
+    def notify(self, event: QueueEvent, element: Any, size: int) -> None:
+        print(f"Success! The value has been {event.value}!")
+
+
+def run(queue, operations: int) -> float:
+    enqueue, dequeue = queue.enqueue, queue.dequeue
+    start = time.perf_counter()
+    for element in range(operations):
+        enqueue(element)
+    for _ in range(operations):
+        dequeue()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    operations = int(sys.argv[1]) if len(sys.argv) > 1 else OPERATIONS
+    # a logger nobody listens to at DEBUG, the usual production setting
+    logging.getLogger("dsa_kuuking.queues").setLevel(logging.INFO)
+    observers = (
+        ("print", PrintObserver),
+        ("null (default)", NullObserver),
+        ("counting", CountingObserver),
+        ("logging, disabled", LoggingObserver),
+    )
+
+    print(f"{operations:,} enqueues + {operations:,} dequeues")
+    for name, factory in (("Queue", Queue), ("CircularQueue", lambda observer: CircularQueue(operations, observer=observer))):
+        baseline = None
+        for label, observer in observers:
+            with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+                elapsed = run(factory(observer=observer()), operations)
+            baseline = baseline or elapsed
+            print(f"{name:>13} | {label:>17}: {2 * operations / elapsed:>12,.0f} ops/s ({baseline / elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Timeout scheduling with heavy cancellation: TimingWheel against a heap scheduler.
+
+Simulates a server that starts PER_MS requests per millisecond, each with a
+TIMEOUT-second timeout, and cancels CANCEL_RATIO of them when the request
+finishes shortly after. Time advances in 1 ms steps and due timeouts are
+drained with pop_due. The heap scheduler is PriorityQueueDatetime with a
+cancelled flag per timer (lazy deletion, like asyncio's TimerHandle): cancelled
+timers stay in the heap until they reach the top.
+
+Usage:
+    python benchmarks/timing_wheel_benchmark.py [timers]
+"""
+import random
+import sys
+import time
+from collections import deque
+
+from dsa_kuuking.queues.priority_queue.implementation.priority_queue import PriorityQueueDatetime
+from dsa_kuuking.queues.timing_wheel.implementation.timing_wheel import TimingWheel
+
+TIMERS = 1_000_000
+PER_MS = 100
+TIMEOUT = 5.0
+CANCEL_RATIO = 0.95
+FINISH_AFTER_MS = 20
+
+
+class HeapTimer:
+    __slots__ = ("item", "cancelled")
+
+    def __init__(self, item):
+        self.item = item
+        self.cancelled = False
+
+
+class HeapScheduler:
+    def __init__(self):
+        self.queue = PriorityQueueDatetime()
+
+    def schedule(self, item, deadline):
+        timer = HeapTimer(item)
+        self.queue.enqueue(timer, deadline)
+        return timer
+
+    def cancel(self, timer):
+        timer.cancelled = True
+
+    def pop_due(self, now):
+        return [timer.item for timer in self.queue.pop_due(now) if not timer.cancelled]
+
+    def __len__(self):
+        return len(self.queue)
+
+
+def run(scheduler, timers: int, finishes: list[bool]) -> tuple[float, int, int]:
+    in_flight = deque()
+    fired = 0
+    peak = 0
+    now_ms = 0
+
+    start = time.perf_counter()
+    scheduled = 0
+    while scheduled < timers or in_flight:
+        now_ms += 1
+        now = now_ms / 1000
+
+        for _ in range(min(PER_MS, timers - scheduled)):
+            handle = scheduler.schedule(scheduled, now + TIMEOUT)
+            in_flight.append((now_ms + FINISH_AFTER_MS, handle, finishes[scheduled]))
+            scheduled += 1
+
+        # requests that finish in time cancel their timeout
+        while in_flight and in_flight[0][0] <= now_ms:
+            _, handle, finished = in_flight.popleft()
+            if finished:
+                scheduler.cancel(handle)
+
+        fired += len(scheduler.pop_due(now))
+        peak = max(peak, len(scheduler))
+
+    fired += len(scheduler.pop_due(now_ms / 1000 + TIMEOUT + 1))
+    return time.perf_counter() - start, fired, peak
+
+
+def main() -> None:
+    timers = int(sys.argv[1]) if len(sys.argv) > 1 else TIMERS
+    finishes = [random.random() < CANCEL_RATIO for _ in range(timers)]
+    print(f"{timers:,} timeouts of {TIMEOUT}s, {PER_MS}/ms, {CANCEL_RATIO:.0%} cancelled")
+
+    for name, scheduler in (("heap", HeapScheduler()), ("timing wheel", TimingWheel(resolution=0.001))):
+        elapsed, fired, peak = run(scheduler, timers, finishes)
+        print(f"{name:>12}: {elapsed:.4f}s, {fired:,} fired, peak stored timers {peak:,}")
+
+
+if __name__ == "__main__":
+    main()
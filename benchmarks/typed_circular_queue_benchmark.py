@@ -0,0 +1,75 @@
+"""Float samples through CircularQueue against TypedCircularQueue.
+
+Fills each queue with N float samples in batches of BATCH (in overwrite mode,
+so the buffer wraps), then computes the mean of the queued samples. The list
+queue sums boxed floats; the typed queue sums its segments() views (with NumPy
+when it is installed, without copying them). Memory is the traced allocation
+per sample of a full queue, measured in a separate run.
+
+Usage:
+    python benchmarks/typed_circular_queue_benchmark.py [samples]
+"""
+import random
+import sys
+import time
+import tracemalloc
+
+from dsa_kuuking.queues.circular_queue.implementation.circular_queue_list import CircularQueue
+from dsa_kuuking.queues.circular_queue.implementation.typed_circular_queue import TypedCircularQueue, numpy
+
+SAMPLES = 1_000_000
+BATCH = 1024
+
+
+def mean_of_list(queue: CircularQueue) -> float:
+    return sum(queue.traverse()) / len(queue)
+
+
+def mean_of_segments(queue: TypedCircularQueue) -> float:
+    if numpy is not None:
+        total = sum(float(numpy.frombuffer(segment, dtype=queue.typecode).sum()) for segment in queue.segments())
+    else:
+        total = sum(sum(segment) for segment in queue.segments())
+    return total / len(queue)
+
+
+def run(queue, batches: list[list[float]], mean) -> tuple[float, float]:
+    start = time.perf_counter()
+    for batch in batches:
+        queue.enqueue_many(batch)
+    fill = time.perf_counter() - start
+
+    start = time.perf_counter()
+    mean(queue)
+    return fill, time.perf_counter() - start
+
+
+def bytes_per_sample(factory, samples: int) -> float:
+    # fresh floats per batch, as they would arrive: the list queue keeps them alive
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    queue = factory()
+    for _ in range(samples // BATCH):
+        queue.enqueue_many([random.random() for _ in range(BATCH)])
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used / len(queue)
+
+
+def main() -> None:
+    samples = int(sys.argv[1]) if len(sys.argv) > 1 else SAMPLES
+    # 1.5x the capacity so that the buffer wraps
+    batches = [[random.random() for _ in range(BATCH)] for _ in range(samples * 3 // 2 // BATCH)]
+    print(f"{samples:,} float samples, aggregation {'with NumPy' if numpy is not None else 'without NumPy'}")
+
+    for label, queue_class, mean in (
+        ("CircularQueue", CircularQueue, mean_of_list),
+        ("TypedCircularQueue", TypedCircularQueue, mean_of_segments),
+    ):
+        fill, aggregate = run(queue_class(maxsize=samples, mode="overwrite"), batches, mean)
+        per_sample = bytes_per_sample(lambda: queue_class(maxsize=samples, mode="overwrite"), samples)
+        print(f"{label:>18}: fill {fill:.4f}s, mean {aggregate:.4f}s, {per_sample:5.1f} bytes/sample")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,566 @@
+//! FIFO containers on a VecDeque: drop-in replacements for the Python Deque and CircularQueue.
+//!
+//! The method names, ResultType return values and exceptions match the Python
+//! classes, so the native ones can be swapped in. ResultType and the queue
+//! exceptions are imported from dsa_kuuking once and cached.
+
+use pyo3::exceptions::{PyIndexError, PyValueError};
+use pyo3::prelude::*;
+use pyo3::sync::GILOnceCell;
+use pyo3::types::{PyIterator, PyList, PyString, PyTuple};
+use std::collections::VecDeque;
+use std::sync::{Mutex, MutexGuard, TryLockError};
+
+static RESULT_TYPE: GILOnceCell<PyObject> = GILOnceCell::new();
+static EMPTY_QUEUE_EXCEPTION: GILOnceCell<PyObject> = GILOnceCell::new();
+static QUEUE_FULL_EXCEPTION: GILOnceCell<PyObject> = GILOnceCell::new();
+
+const EMPTY_QUEUE_PEEK: &str = "Cannot retrieve the peek from empty queue!";
+
+/// Import a Python class the first time it is needed.
+fn cached_class<'py>(
+    py: Python<'py>,
+    cell: &'static GILOnceCell<PyObject>,
+    module: &str,
+    name: &str,
+) -> PyResult<&'py Bound<'py, PyAny>> {
+    cell.get_or_try_init(py, || Ok::<_, PyErr>(py.import(module)?.getattr(name)?.unbind()))
+        .map(|class| class.bind(py))
+}
+
+/// ResultType(value=value)
+fn ok_result(py: Python<'_>, value: PyObject) -> PyResult<PyObject> {
+    let class = cached_class(py, &RESULT_TYPE, "dsa_kuuking.types.ResultType", "ResultType")?;
+    Ok(class.call1((value,))?.unbind())
+}
+
+/// ResultType(error=message)
+fn error_result(py: Python<'_>, message: &str) -> PyResult<PyObject> {
+    let class = cached_class(py, &RESULT_TYPE, "dsa_kuuking.types.ResultType", "ResultType")?;
+    Ok(class.call1((py.None(), message))?.unbind())
+}
+
+fn raise(py: Python<'_>, cell: &'static GILOnceCell<PyObject>, module: &str, name: &str, message: Option<&str>) -> PyErr {
+    let exception = cached_class(py, cell, module, name).and_then(|class| match message {
+        Some(message) => class.call1((message,)),
+        None => class.call0(),
+    });
+    match exception {
+        Ok(exception) => PyErr::from_value(exception),
+        Err(error) => error,
+    }
+}
+
+fn empty_queue_error(py: Python<'_>, message: &str) -> PyErr {
+    raise(
+        py,
+        &EMPTY_QUEUE_EXCEPTION,
+        "dsa_kuuking.types.errors.empty_queue_exception",
+        "EmptyQueueException",
+        Some(message),
+    )
+}
+
+fn queue_full_error(py: Python<'_>, message: Option<&str>) -> PyErr {
+    raise(
+        py,
+        &QUEUE_FULL_EXCEPTION,
+        "dsa_kuuking.types.errors.queue_full_exception",
+        "QueueFullException",
+        message,
+    )
+}
+
+/// Take a lock from a thread that holds the GIL, waiting for it with the GIL released.
+fn lock_released<'a, T: Send>(py: Python<'_>, mutex: &'a Mutex<T>) -> MutexGuard<'a, T> {
+    loop {
+        match mutex.try_lock() {
+            Ok(guard) => return guard,
+            Err(TryLockError::WouldBlock) => py.allow_threads(|| drop(mutex.lock())),
+            Err(TryLockError::Poisoned(error)) => panic!("queue lock poisoned: {error}"),
+        }
+    }
+}
+
+/// Collect an iterable before taking a lock: iterating may run Python code.
+fn collect(elements: &Bound<'_, PyAny>) -> PyResult<Vec<PyObject>> {
+    elements.try_iter()?.map(|element| element.map(Bound::unbind)).collect()
+}
+
+fn print(py: Python<'_>, args: Vec<PyObject>) -> PyResult<()> {
+    let args = PyTuple::new(py, args)?;
+    py.import("builtins")?.getattr("print")?.call1(args)?;
+    Ok(())
+}
+
+fn text(py: Python<'_>, text: &str) -> PyObject {
+    PyString::new(py, text).into_any().unbind()
+}
+
+fn contains(py: Python<'_>, items: Vec<PyObject>, element: &Bound<'_, PyAny>) -> PyResult<bool> {
+    // compared on a snapshot, so that __eq__ never runs under the lock
+    for item in items {
+        if item.bind(py).eq(element)? {
+            return Ok(true);
+        }
+    }
+    Ok(false)
+}
+
+fn joined(py: Python<'_>, items: &[PyObject], separator: &str) -> PyResult<String> {
+    let parts = items
+        .iter()
+        .map(|item| Ok(item.bind(py).str()?.to_string()))
+        .collect::<PyResult<Vec<String>>>()?;
+    Ok(parts.join(separator))
+}
+
+/// A double-ended queue on a VecDeque, with the methods of the Python Deque.
+#[pyclass]
+pub struct Deque {
+    items: Mutex<VecDeque<PyObject>>,
+}
+
+impl Deque {
+    fn lock(&self, py: Python<'_>) -> MutexGuard<'_, VecDeque<PyObject>> {
+        lock_released(py, &self.items)
+    }
+
+    fn snapshot(&self, py: Python<'_>) -> Vec<PyObject> {
+        self.lock(py).iter().map(|item| item.clone_ref(py)).collect()
+    }
+
+    fn index(&self, len: usize, index: isize) -> PyResult<usize> {
+        let index = if index < 0 { index + len as isize } else { index };
+        if index < 0 || index as usize >= len {
+            return Err(PyIndexError::new_err("deque index out of range"));
+        }
+        Ok(index as usize)
+    }
+}
+
+#[pymethods]
+impl Deque {
+    #[new]
+    #[pyo3(signature = (elements = None))]
+    fn new(elements: Option<&Bound<'_, PyAny>>) -> PyResult<Self> {
+        let items = match elements {
+            Some(elements) => VecDeque::from(collect(elements)?),
+            None => VecDeque::new(),
+        };
+        Ok(Deque { items: Mutex::new(items) })
+    }
+
+    fn enqueue_front(&self, py: Python, element: PyObject) {
+        self.lock(py).push_front(element);
+    }
+
+    fn enqueue_rear(&self, py: Python, element: PyObject) {
+        self.lock(py).push_back(element);
+    }
+
+    fn enqueue(&self, py: Python, element: PyObject) {
+        self.enqueue_rear(py, element);
+    }
+
+    /// Enqueue each element to the front in turn, so they end up in reverse order.
+    fn extend_front(&self, py: Python, elements: &Bound<'_, PyAny>) -> PyResult<()> {
+        let batch = collect(elements)?;
+        let mut items = self.lock(py);
+        items.reserve(batch.len());
+        for element in batch {
+            items.push_front(element);
+        }
+        Ok(())
+    }
+
+    /// Enqueue the elements to the rear in order, under a single lock.
+    fn extend_rear(&self, py: Python, elements: &Bound<'_, PyAny>) -> PyResult<()> {
+        let batch = collect(elements)?;
+        self.lock(py).extend(batch);
+        Ok(())
+    }
+
+    fn extend(&self, py: Python, elements: &Bound<'_, PyAny>) -> PyResult<()> {
+        self.extend_rear(py, elements)
+    }
+
+    fn dequeue_front(&self, py: Python) -> PyResult<PyObject> {
+        let element = self.lock(py).pop_front();
+        match element {
+            Some(element) => ok_result(py, element),
+            None => Err(empty_queue_error(py, "Cannot dequeue from the front of an empty deque!")),
+        }
+    }
+
+    fn dequeue_rear(&self, py: Python) -> PyResult<PyObject> {
+        let element = self.lock(py).pop_back();
+        match element {
+            Some(element) => ok_result(py, element),
+            None => Err(empty_queue_error(py, "Cannot dequeue from the rear of an empty deque!")),
+        }
+    }
+
+    fn dequeue(&self, py: Python) -> PyResult<PyObject> {
+        self.dequeue_front(py)
+    }
+
+    /// Remove up to `n` elements from the front under a single lock and return them as a list.
+    fn dequeue_many(&self, py: Python, n: usize) -> Vec<PyObject> {
+        let mut items = self.lock(py);
+        let count = n.min(items.len());
+        items.drain(..count).collect()
+    }
+
+    /// Remove every element and return them as a list, front to back.
+    fn drain(&self, py: Python) -> Vec<PyObject> {
+        Vec::from(std::mem::take(&mut *self.lock(py)))
+    }
+
+    fn get_peek_front(&self, py: Python) -> PyResult<PyObject> {
+        let front = self.lock(py).front().map(|element| element.clone_ref(py));
+        match front {
+            Some(element) => ok_result(py, element),
+            None => error_result(py, "Cannot retrieve the front peek from the empty deque!"),
+        }
+    }
+
+    fn get_peek_rear(&self, py: Python) -> PyResult<PyObject> {
+        let rear = self.lock(py).back().map(|element| element.clone_ref(py));
+        match rear {
+            Some(element) => ok_result(py, element),
+            None => error_result(py, "Cannot retrieve the rear peek from the empty deque!"),
+        }
+    }
+
+    fn get_peek(&self, py: Python) -> PyResult<PyObject> {
+        self.get_peek_front(py)
+    }
+
+    fn peek_front(&self, py: Python) -> PyResult<()> {
+        let front = self.lock(py).front().map(|element| element.clone_ref(py));
+        match front {
+            Some(element) => print(py, vec![text(py, "Front peek is "), element]),
+            None => print(py, vec![text(py, "Cannot retrieve the front peek from the empty deque!")]),
+        }
+    }
+
+    fn peek_rear(&self, py: Python) -> PyResult<()> {
+        let rear = self.lock(py).back().map(|element| element.clone_ref(py));
+        match rear {
+            Some(element) => print(py, vec![text(py, "Rear peek is "), element]),
+            None => print(py, vec![text(py, "Cannot retrieve the rear peek from the empty deque!")]),
+        }
+    }
+
+    fn peek(&self, py: Python) -> PyResult<()> {
+        self.peek_front(py)
+    }
+
+    fn is_empty(&self, py: Python) -> bool {
+        self.lock(py).is_empty()
+    }
+
+    /// Return the elements front to back as a list.
+    fn traverse(&self, py: Python) -> Vec<PyObject> {
+        self.snapshot(py)
+    }
+
+    fn display(&self, py: Python) -> PyResult<()> {
+        let items = self.snapshot(py);
+        if items.is_empty() {
+            print(py, vec![text(py, "The dequeue is empty: Deque()")])?;
+        }
+        let line = joined(py, &items, "<-->")?;
+        print(py, vec![text(py, &line)])
+    }
+
+    /// Rotate k steps to the right (the rear element becomes the front); negative k rotates left.
+    #[pyo3(signature = (k = 1))]
+    fn rotate(&self, py: Python, k: isize) {
+        let mut items = self.lock(py);
+        let n = items.len();
+        if n > 1 {
+            items.rotate_right(k.rem_euclid(n as isize) as usize);
+        }
+    }
+
+    fn __getitem__(&self, py: Python, index: isize) -> PyResult<PyObject> {
+        let items = self.lock(py);
+        let index = self.index(items.len(), index)?;
+        Ok(items[index].clone_ref(py))
+    }
+
+    fn __setitem__(&self, py: Python, index: isize, element: PyObject) -> PyResult<()> {
+        let previous = {
+            let mut items = self.lock(py);
+            let index = self.index(items.len(), index)?;
+            std::mem::replace(&mut items[index], element)
+        };
+        // released after the lock, in case its __del__ touches the deque
+        drop(previous);
+        Ok(())
+    }
+
+    fn __contains__(&self, py: Python, element: &Bound<'_, PyAny>) -> PyResult<bool> {
+        contains(py, self.snapshot(py), element)
+    }
+
+    fn __iter__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyIterator>> {
+        PyList::new(py, self.snapshot(py))?.as_any().try_iter()
+    }
+
+    fn __str__(&self, py: Python) -> PyResult<String> {
+        joined(py, &self.snapshot(py), "<-->")
+    }
+
+    fn __len__(&self, py: Python) -> usize {
+        self.lock(py).len()
+    }
+
+    fn __bool__(&self, py: Python) -> bool {
+        !self.is_empty(py)
+    }
+}
+
+#[derive(Clone, Copy, PartialEq)]
+enum Mode {
+    Fixed,
+    Grow,
+    Overwrite,
+}
+
+impl Mode {
+    fn name(self) -> &'static str {
+        match self {
+            Mode::Fixed => "fixed",
+            Mode::Grow => "grow",
+            Mode::Overwrite => "overwrite",
+        }
+    }
+}
+
+struct Ring {
+    items: VecDeque<PyObject>,
+    // the number of elements before the ring is full
+    size: usize,
+    // size rounded up to a power of two, as in CircularQueue
+    capacity: usize,
+    mode: Mode,
+}
+
+impl Ring {
+    /// Double the logical size until `needed` elements fit, as CircularQueue._grow does;
+    /// the capacity follows it to the next power of two.
+    fn grow(&mut self, needed: usize) {
+        while self.size < needed {
+            self.size *= 2;
+        }
+        self.capacity = self.capacity.max(self.size.next_power_of_two());
+        let additional = self.capacity - self.items.len();
+        self.items.reserve(additional);
+    }
+}
+
+/// What an enqueue did to make room.
+enum Room {
+    // the overwritten elements, if any
+    Made(Vec<PyObject>),
+    // QueueFullException, with a message for a batch
+    Full(Option<String>),
+}
+
+/// A bounded FIFO ring buffer on a VecDeque, with the methods and modes of the Python CircularQueue.
+#[pyclass]
+pub struct RingBuffer {
+    ring: Mutex<Ring>,
+}
+
+impl RingBuffer {
+    fn lock(&self, py: Python<'_>) -> MutexGuard<'_, Ring> {
+        lock_released(py, &self.ring)
+    }
+
+    fn snapshot(&self, py: Python<'_>) -> Vec<PyObject> {
+        self.lock(py).items.iter().map(|item| item.clone_ref(py)).collect()
+    }
+
+    /// Append a batch, making room for it according to the mode.
+    fn push(&self, py: Python<'_>, mut batch: Vec<PyObject>) -> PyResult<()> {
+        let n = batch.len();
+        if n == 0 {
+            return Ok(());
+        }
+
+        let room = {
+            let mut ring = self.lock(py);
+            let free = ring.size - ring.items.len();
+            let room = if n <= free {
+                Room::Made(Vec::new())
+            } else {
+                match ring.mode {
+                    Mode::Fixed if n == 1 => Room::Full(None),
+                    Mode::Fixed => Room::Full(Some(format!(
+                        "Queue is full: {n} elements do not fit in {free} free slots"
+                    ))),
+                    Mode::Grow => {
+                        let needed = ring.items.len() + n;
+                        ring.grow(needed);
+                        Room::Made(Vec::new())
+                    }
+                    Mode::Overwrite => {
+                        if n >= ring.size {
+                            // only the last `size` elements survive; the skipped
+                            // prefix is released with the overwritten elements
+                            let skipped: Vec<PyObject> = batch.drain(..n - ring.size).collect();
+                            let mut overwritten: Vec<PyObject> = ring.items.drain(..).collect();
+                            overwritten.extend(skipped);
+                            Room::Made(overwritten)
+                        } else {
+                            Room::Made(ring.items.drain(..n - free).collect())
+                        }
+                    }
+                }
+            };
+            if let Room::Made(_) = room {
+                ring.items.extend(batch);
+            }
+            room
+        };
+
+        // overwritten elements are released after the lock
+        match room {
+            Room::Made(_) => Ok(()),
+            Room::Full(message) => Err(queue_full_error(py, message.as_deref())),
+        }
+    }
+}
+
+#[pymethods]
+impl RingBuffer {
+    #[new]
+    #[pyo3(signature = (maxsize = 10, mode = "fixed"))]
+    fn new(maxsize: usize, mode: &str) -> PyResult<Self> {
+        if maxsize < 1 {
+            return Err(PyValueError::new_err("maxsize must be at least 1"));
+        }
+        let mode = match mode {
+            "fixed" => Mode::Fixed,
+            "grow" => Mode::Grow,
+            "overwrite" => Mode::Overwrite,
+            _ => {
+                return Err(PyValueError::new_err(format!(
+                    "Unknown circular queue mode: {mode:?}. Choose one of ['fixed', 'grow', 'overwrite']."
+                )))
+            }
+        };
+
+        let capacity = maxsize.next_power_of_two();
+        Ok(RingBuffer {
+            ring: Mutex::new(Ring { items: VecDeque::with_capacity(capacity), size: maxsize, capacity, mode }),
+        })
+    }
+
+    #[getter]
+    fn size(&self, py: Python) -> usize {
+        self.lock(py).size
+    }
+
+    #[getter]
+    fn mode(&self, py: Python) -> &'static str {
+        self.lock(py).mode.name()
+    }
+
+    /// Add an element; when the ring is full it raises, grows or drops the oldest element, by mode.
+    fn enqueue(&self, py: Python, element: PyObject) -> PyResult<()> {
+        self.push(py, vec![element])
+    }
+
+    /// Add every element in order under a single lock; in "fixed" mode nothing is added unless all fit.
+    fn enqueue_many(&self, py: Python, elements: &Bound<'_, PyAny>) -> PyResult<()> {
+        let batch = collect(elements)?;
+        self.push(py, batch)
+    }
+
+    fn extend(&self, py: Python, elements: &Bound<'_, PyAny>) -> PyResult<()> {
+        self.enqueue_many(py, elements)
+    }
+
+    fn dequeue(&self, py: Python) -> PyResult<PyObject> {
+        let element = self.lock(py).items.pop_front();
+        match element {
+            Some(element) => ok_result(py, element),
+            None => Err(empty_queue_error(py, EMPTY_QUEUE_PEEK)),
+        }
+    }
+
+    /// Remove up to `n` elements under a single lock and return them as a list.
+    fn dequeue_many(&self, py: Python, n: usize) -> Vec<PyObject> {
+        let mut ring = self.lock(py);
+        let count = n.min(ring.items.len());
+        ring.items.drain(..count).collect()
+    }
+
+    /// Remove every element and return them as a list, oldest first.
+    fn drain(&self, py: Python) -> Vec<PyObject> {
+        self.lock(py).items.drain(..).collect()
+    }
+
+    fn get_peek(&self, py: Python) -> PyResult<PyObject> {
+        let front = self.lock(py).items.front().map(|element| element.clone_ref(py));
+        match front {
+            Some(element) => ok_result(py, element),
+            None => error_result(py, EMPTY_QUEUE_PEEK),
+        }
+    }
+
+    fn peek(&self, py: Python) -> PyResult<()> {
+        let front = self.lock(py).items.front().map(|element| element.clone_ref(py));
+        match front {
+            Some(element) => print(py, vec![text(py, "The peek is "), element]),
+            None => print(py, vec![text(py, EMPTY_QUEUE_PEEK)]),
+        }
+    }
+
+    fn is_full(&self, py: Python) -> bool {
+        let ring = self.lock(py);
+        ring.items.len() == ring.size
+    }
+
+    fn is_empty(&self, py: Python) -> bool {
+        self.lock(py).items.is_empty()
+    }
+
+    /// Return the elements oldest first as a list.
+    fn traverse(&self, py: Python) -> Vec<PyObject> {
+        self.snapshot(py)
+    }
+
+    fn display(&self, py: Python) -> PyResult<()> {
+        let items = self.snapshot(py);
+        if items.is_empty() {
+            print(py, vec![text(py, "Queue is empty: Queue()")])?;
+        }
+        print(py, vec![PyList::new(py, items)?.into_any().unbind()])
+    }
+
+    fn __contains__(&self, py: Python, element: &Bound<'_, PyAny>) -> PyResult<bool> {
+        contains(py, self.snapshot(py), element)
+    }
+
+    fn __iter__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyIterator>> {
+        PyList::new(py, self.snapshot(py))?.as_any().try_iter()
+    }
+
+    fn __str__(&self, py: Python) -> PyResult<String> {
+        joined(py, &self.snapshot(py), "->")
+    }
+
+    fn __len__(&self, py: Python) -> usize {
+        self.lock(py).items.len()
+    }
+
+    fn __bool__(&self, py: Python) -> bool {
+        !self.is_empty(py)
+    }
+}
@@ -1,41 +1,776 @@
+use pyo3::create_exception;
+use pyo3::exceptions::{PyException, PyValueError};
 use pyo3::prelude::*;
-use std::sync::Mutex; // Add this for thread safety
+use pyo3::types::{PyBool, PyDict, PyFloat, PyInt};
+use std::cmp::Ordering;
+use std::collections::BinaryHeap;
+use std::sync::{Condvar, Mutex, MutexGuard, TryLockError}; // Add this for thread safety
+use std::time::{Duration, Instant};
+
+mod fifo;
+
+create_exception!(burmese_native, QueueClosed, PyException, "Raised when pushing to a closed queue.");
+
+// How long a blocked pop sleeps before it checks for KeyboardInterrupt & co.
+const SIGNAL_CHECK_INTERVAL: Duration = Duration::from_millis(100);
 
 // Burmese Python Queue
 
+/// A priority Rust can compare on its own: ints that fit in an i64 and floats.
+#[derive(Clone, Copy)]
+enum Number {
+    Int(i64),
+    Float(f64),
+}
+
+impl Number {
+    fn into_object(self, py: Python<'_>) -> PyObject {
+        match self {
+            Number::Int(value) => value.into_pyobject(py).unwrap().into_any().unbind(),
+            Number::Float(value) => PyFloat::new(py, value).into_any().unbind(),
+        }
+    }
+}
+
+/// Compare an int with a float exactly, the way Python does (no rounding through f64).
+/// NaN sorts after every number.
+fn compare_int_float(int: i64, float: f64) -> Ordering {
+    if float.is_nan() {
+        return Ordering::Less;
+    }
+    // 2^63 is the smallest float above i64::MAX
+    if float >= 9_223_372_036_854_775_808.0 {
+        return Ordering::Less;
+    }
+    if float < -9_223_372_036_854_775_808.0 {
+        return Ordering::Greater;
+    }
+    let whole = float.trunc();
+    int.cmp(&(whole as i64))
+        .then_with(|| 0.0_f64.partial_cmp(&(float - whole)).unwrap())
+}
+
+impl Ord for Number {
+    fn cmp(&self, other: &Self) -> Ordering {
+        match (*self, *other) {
+            (Number::Int(a), Number::Int(b)) => a.cmp(&b),
+            // -0.0 == 0.0 as in Python; NaNs tie with each other and sort last
+            (Number::Float(a), Number::Float(b)) => a
+                .partial_cmp(&b)
+                .unwrap_or_else(|| a.is_nan().cmp(&b.is_nan())),
+            (Number::Int(a), Number::Float(b)) => compare_int_float(a, b),
+            (Number::Float(a), Number::Int(b)) => compare_int_float(b, a).reverse(),
+        }
+    }
+}
+
+impl PartialOrd for Number {
+    fn partial_cmp(&self, other: &Self) -> Option<Ordering> {
+        Some(self.cmp(other))
+    }
+}
+
+impl PartialEq for Number {
+    fn eq(&self, other: &Self) -> bool {
+        self.cmp(other) == Ordering::Equal
+    }
+}
+
+impl Eq for Number {}
+
+/// A priority as it was pushed: a number for the fast path, anything else is
+/// compared with Python's `<` (datetimes, tuples, big ints, ...).
+enum Priority {
+    Number(Number),
+    Object(PyObject),
+}
+
+impl Priority {
+    fn classify(priority: &Bound<'_, PyAny>) -> Priority {
+        // exact types only: a subclass may override the comparison operators
+        if priority.is_exact_instance_of::<PyInt>() || priority.is_exact_instance_of::<PyBool>() {
+            if let Ok(value) = priority.extract::<i64>() {
+                return Priority::Number(Number::Int(value));
+            }
+        } else if let Ok(value) = priority.downcast_exact::<PyFloat>() {
+            return Priority::Number(Number::Float(value.value()));
+        }
+        Priority::Object(priority.clone().unbind())
+    }
+
+    fn is_number(&self) -> bool {
+        matches!(self, Priority::Number(_))
+    }
+
+    fn into_object(self, py: Python<'_>) -> PyObject {
+        match self {
+            Priority::Number(number) => number.into_object(py),
+            Priority::Object(object) => object,
+        }
+    }
+}
+
+/// One queued item with a numeric priority. `BinaryHeap` is a max-heap, so the
+/// ordering is reversed: the lowest priority wins, and among equal priorities
+/// the lowest sequence number (the oldest push) wins, which keeps them FIFO.
+struct Entry {
+    priority: Number,
+    sequence: u64,
+    item: PyObject,
+}
+
+impl PartialEq for Entry {
+    fn eq(&self, other: &Self) -> bool {
+        self.priority == other.priority && self.sequence == other.sequence
+    }
+}
+
+impl Eq for Entry {}
+
+impl PartialOrd for Entry {
+    fn partial_cmp(&self, other: &Self) -> Option<Ordering> {
+        Some(self.cmp(other))
+    }
+}
+
+impl Ord for Entry {
+    fn cmp(&self, other: &Self) -> Ordering {
+        other
+            .priority
+            .cmp(&self.priority)
+            .then_with(|| other.sequence.cmp(&self.sequence))
+    }
+}
+
+/// One queued item whose priority is compared by Python.
+struct ObjectEntry {
+    priority: PyObject,
+    sequence: u64,
+    item: PyObject,
+}
+
+impl ObjectEntry {
+    fn clone_ref(&self, py: Python<'_>) -> ObjectEntry {
+        ObjectEntry {
+            priority: self.priority.clone_ref(py),
+            sequence: self.sequence,
+            item: self.item.clone_ref(py),
+        }
+    }
+}
+
+fn object_less(py: Python<'_>, a: &ObjectEntry, b: &ObjectEntry) -> PyResult<bool> {
+    let (left, right) = (a.priority.bind(py), b.priority.bind(py));
+    if left.lt(right)? {
+        return Ok(true);
+    }
+    if right.lt(left)? {
+        return Ok(false);
+    }
+    Ok(a.sequence < b.sequence)
+}
+
+// The object heap is a plain min-heap in a Vec. The sifts swap instead of
+// moving a hole, so a comparison that raises leaves every entry in the Vec.
+
+fn sift_up(py: Python<'_>, heap: &mut [ObjectEntry], mut index: usize) -> PyResult<()> {
+    while index > 0 {
+        let parent = (index - 1) / 2;
+        if !object_less(py, &heap[index], &heap[parent])? {
+            break;
+        }
+        heap.swap(index, parent);
+        index = parent;
+    }
+    Ok(())
+}
+
+fn sift_down(py: Python<'_>, heap: &mut [ObjectEntry], mut index: usize) -> PyResult<()> {
+    let len = heap.len();
+    loop {
+        let mut child = 2 * index + 1;
+        if child >= len {
+            break;
+        }
+        if child + 1 < len && object_less(py, &heap[child + 1], &heap[child])? {
+            child += 1;
+        }
+        if !object_less(py, &heap[child], &heap[index])? {
+            break;
+        }
+        heap.swap(index, child);
+        index = child;
+    }
+    Ok(())
+}
+
+fn build_heap(py: Python<'_>, heap: &mut [ObjectEntry]) -> PyResult<()> {
+    for index in (0..heap.len() / 2).rev() {
+        sift_down(py, heap, index)?;
+    }
+    Ok(())
+}
+
+fn pop_object(py: Python<'_>, heap: &mut Vec<ObjectEntry>) -> PyResult<Option<ObjectEntry>> {
+    if heap.is_empty() {
+        return Ok(None);
+    }
+    let last = heap.len() - 1;
+    heap.swap(0, last);
+    let top = heap.pop();
+    sift_down(py, heap, 0)?;
+    Ok(top)
+}
+
+enum Store {
+    // every priority is a Number: pure Rust comparisons, the GIL can be released
+    Numbers(BinaryHeap<Entry>),
+    // at least one priority needs Python comparisons
+    Objects(Vec<ObjectEntry>),
+}
+
+/// Contention metrics, updated while holding the lock.
+#[derive(Clone, Copy, Default)]
+struct Stats {
+    pushes: u64,
+    pops: u64,
+    max_depth: usize,
+    // lock acquisitions that found the lock taken, and how long they waited
+    contended_locks: u64,
+    lock_wait: Duration,
+    // pops that had to wait for an item, and how long they waited
+    blocked_pops: u64,
+    blocked_wait: Duration,
+}
+
+struct Inner {
+    store: Store,
+    // next insertion sequence number (the FIFO tiebreaker)
+    sequence: u64,
+    closed: bool,
+    stats: Stats,
+}
+
+/// What a blocking pop found once it stopped waiting.
+enum Waited {
+    Item(PyObject),
+    // the store compares with Python, so the pop has to be retried with the GIL
+    NeedsPython,
+    // timed out, or the queue is closed and empty
+    Empty,
+    // nothing yet; check for signals and keep waiting
+    Again,
+}
+
+impl Inner {
+    fn len(&self) -> usize {
+        match &self.store {
+            Store::Numbers(heap) => heap.len(),
+            Store::Objects(heap) => heap.len(),
+        }
+    }
+
+    fn record_push(&mut self, count: usize) {
+        let depth = self.len();
+        self.stats.pushes += count as u64;
+        self.stats.max_depth = self.stats.max_depth.max(depth);
+    }
+
+    /// Pop without touching Python; the outer None means the store needs Python comparisons.
+    fn try_pop_number(&mut self) -> Option<Option<PyObject>> {
+        let Store::Numbers(heap) = &mut self.store else {
+            return None;
+        };
+        let item = heap.pop().map(|entry| entry.item);
+        if item.is_some() {
+            self.stats.pops += 1;
+        }
+        Some(item)
+    }
+
+    /// Push a batch without touching Python, or hand it back if it needs Python comparisons.
+    fn try_push_numbers(&mut self, batch: Vec<(Priority, PyObject)>) -> Option<Vec<(Priority, PyObject)>> {
+        if let Store::Objects(heap) = &self.store {
+            if !heap.is_empty() {
+                return Some(batch);
+            }
+            // the queue ran empty, so it can go back to the fast path
+            self.store = Store::Numbers(BinaryHeap::new());
+        }
+        if !batch.iter().all(|(priority, _)| priority.is_number()) {
+            return Some(batch);
+        }
+        let Store::Numbers(heap) = &mut self.store else {
+            unreachable!()
+        };
+
+        let first_sequence = self.sequence;
+        self.sequence += batch.len() as u64;
+
+        let added = batch.len();
+        if added == 1 {
+            if let Some((Priority::Number(priority), item)) = batch.into_iter().next() {
+                heap.push(Entry { priority, sequence: first_sequence, item });
+            }
+            self.record_push(added);
+            return None;
+        }
+
+        // Vec -> BinaryHeap is an O(n) heapify; append then picks the cheaper
+        // of pushing the smaller heap into the larger one or rebuilding both.
+        let mut incoming: BinaryHeap<Entry> = batch
+            .into_iter()
+            .zip(first_sequence..)
+            .filter_map(|((priority, item), sequence)| match priority {
+                Priority::Number(priority) => Some(Entry { priority, sequence, item }),
+                Priority::Object(_) => None,
+            })
+            .collect::<Vec<Entry>>()
+            .into();
+        heap.append(&mut incoming);
+        self.record_push(added);
+        None
+    }
+
+    /// Switch to Python comparisons (once) and return the object heap.
+    fn objects(&mut self, py: Python<'_>) -> PyResult<&mut Vec<ObjectEntry>> {
+        if let Store::Numbers(heap) = &mut self.store {
+            let mut entries: Vec<ObjectEntry> = std::mem::take(heap)
+                .into_vec()
+                .into_iter()
+                .map(|entry| ObjectEntry {
+                    priority: entry.priority.into_object(py),
+                    sequence: entry.sequence,
+                    item: entry.item,
+                })
+                .collect();
+            // install the entries before heapifying, so an error loses nothing
+            self.store = Store::Objects(Vec::new());
+            let result = build_heap(py, &mut entries);
+            self.store = Store::Objects(entries);
+            result?;
+        }
+        match &mut self.store {
+            Store::Objects(heap) => Ok(heap),
+            Store::Numbers(_) => unreachable!(),
+        }
+    }
+
+    fn push(&mut self, py: Python<'_>, batch: Vec<(Priority, PyObject)>) -> PyResult<()> {
+        let Some(batch) = self.try_push_numbers(batch) else {
+            return Ok(());
+        };
+
+        let first_sequence = self.sequence;
+        self.sequence += batch.len() as u64;
+
+        let heap = self.objects(py)?;
+        let start = heap.len();
+        let added = batch.len();
+        heap.extend(batch.into_iter().zip(first_sequence..).map(|((priority, item), sequence)| {
+            ObjectEntry { priority: priority.into_object(py), sequence, item }
+        }));
+
+        let result = if added == 1 {
+            sift_up(py, heap, start)
+        } else {
+            build_heap(py, heap)
+        };
+        self.record_push(added);
+        result
+    }
+
+    fn pop(&mut self, py: Python<'_>) -> PyResult<Option<PyObject>> {
+        if let Some(item) = self.try_pop_number() {
+            return Ok(item);
+        }
+        let Store::Objects(heap) = &mut self.store else {
+            unreachable!()
+        };
+        let item = pop_object(py, heap)?.map(|entry| entry.item);
+        if item.is_some() {
+            self.stats.pops += 1;
+        }
+        Ok(item)
+    }
+}
+
+/// Items of a store in priority order.
+fn sorted_items(py: Python<'_>, store: Store) -> PyResult<Vec<PyObject>> {
+    match store {
+        Store::Numbers(heap) => Ok(py.allow_threads(move || {
+            // into_sorted_vec is ascending by Ord, i.e. lowest priority last
+            heap.into_sorted_vec()
+                .into_iter()
+                .rev()
+                .map(|entry| entry.item)
+                .collect()
+        })),
+        Store::Objects(mut heap) => {
+            let mut items = Vec::with_capacity(heap.len());
+            while let Some(entry) = pop_object(py, &mut heap)? {
+                items.push(entry.item);
+            }
+            Ok(items)
+        }
+    }
+}
+
 #[pyclass]
 pub struct PriorityQueue {
-    // Wrap the Vec in a Mutex so multiple threads can't corrupt it
-    queue: Mutex<Vec<(i32, PyObject)>>, 
+    // Wrap the heap in a Mutex so multiple threads can't corrupt it
+    queue: Mutex<Inner>,
+    // signalled on every push and on close(), for blocked pops
+    ready: Condvar,
+}
+
+impl PriorityQueue {
+    /// Take the lock without the GIL (inside allow_threads), recording contention.
+    fn acquire(&self) -> MutexGuard<'_, Inner> {
+        match self.queue.try_lock() {
+            Ok(guard) => guard,
+            Err(TryLockError::WouldBlock) => {
+                let start = Instant::now();
+                let mut guard = self.queue.lock().unwrap();
+                guard.stats.contended_locks += 1;
+                guard.stats.lock_wait += start.elapsed();
+                guard
+            }
+            Err(TryLockError::Poisoned(error)) => panic!("priority queue lock poisoned: {error}"),
+        }
+    }
+
+    /// Take the lock from a thread that holds the GIL.
+    ///
+    /// Whoever holds the lock may be running Python comparisons and need the GIL
+    /// back to finish, so never block on the lock while holding the GIL.
+    fn lock(&self, py: Python<'_>) -> MutexGuard<'_, Inner> {
+        let mut waited: Option<Instant> = None;
+        loop {
+            match self.queue.try_lock() {
+                Ok(mut guard) => {
+                    if let Some(start) = waited {
+                        guard.stats.contended_locks += 1;
+                        guard.stats.lock_wait += start.elapsed();
+                    }
+                    return guard;
+                }
+                Err(TryLockError::WouldBlock) => {
+                    waited.get_or_insert_with(Instant::now);
+                    py.allow_threads(|| drop(self.queue.lock()));
+                }
+                Err(TryLockError::Poisoned(error)) => panic!("priority queue lock poisoned: {error}"),
+            }
+        }
+    }
+
+    fn insert(&self, py: Python<'_>, batch: Vec<(Priority, PyObject)>) -> PyResult<()> {
+        let added = batch.len();
+        if added == 0 {
+            return Ok(());
+        }
+
+        let batch = if batch.iter().all(|(priority, _)| priority.is_number()) {
+            // ALLOW-THREADS: Releasing the GIL so other threads can run Python code
+            // while Rust is busy sifting the heap.
+            let pending = py.allow_threads(move || {
+                let mut data = self.acquire();
+                if data.closed {
+                    return Err(());
+                }
+                Ok(data.try_push_numbers(batch))
+            });
+            match pending {
+                Err(()) => return Err(QueueClosed::new_err("push to a closed queue")),
+                Ok(None) => {
+                    self.notify(added);
+                    return Ok(());
+                }
+                Ok(Some(batch)) => batch,
+            }
+        } else {
+            batch
+        };
+
+        {
+            let mut data = self.lock(py);
+            if data.closed {
+                return Err(QueueClosed::new_err("push to a closed queue"));
+            }
+            data.push(py, batch)?;
+        }
+        self.notify(added);
+        Ok(())
+    }
+
+    fn notify(&self, added: usize) {
+        if added == 1 {
+            self.ready.notify_one();
+        } else {
+            self.ready.notify_all();
+        }
+    }
+
+    /// Wait (without the GIL) for an item, close() or the deadline, for at most one signal-check interval.
+    fn wait_for_item(&self, deadline: Option<Instant>, first_attempt: bool) -> Waited {
+        let mut data = self.acquire();
+        let start = Instant::now();
+        let slice_end = match deadline {
+            Some(deadline) => deadline.min(start + SIGNAL_CHECK_INTERVAL),
+            None => start + SIGNAL_CHECK_INTERVAL,
+        };
+
+        let blocked = data.len() == 0 && !data.closed;
+        while data.len() == 0 && !data.closed {
+            let now = Instant::now();
+            if now >= slice_end {
+                break;
+            }
+            data = self.ready.wait_timeout(data, slice_end - now).unwrap().0;
+        }
+        if blocked {
+            if first_attempt {
+                data.stats.blocked_pops += 1;
+            }
+            data.stats.blocked_wait += start.elapsed();
+        }
+
+        if data.len() == 0 {
+            let timed_out = deadline.is_some_and(|deadline| Instant::now() >= deadline);
+            return if data.closed || timed_out { Waited::Empty } else { Waited::Again };
+        }
+        match data.try_pop_number() {
+            Some(Some(item)) => Waited::Item(item),
+            Some(None) => Waited::Again,
+            None => Waited::NeedsPython,
+        }
+    }
 }
 
 #[pymethods]
 impl PriorityQueue {
     #[new]
     fn new() -> Self {
-        PriorityQueue { queue: Mutex::new(Vec::new()) }
+        PriorityQueue {
+            queue: Mutex::new(Inner {
+                store: Store::Numbers(BinaryHeap::new()),
+                sequence: 0,
+                closed: false,
+                stats: Stats::default(),
+            }),
+            ready: Condvar::new(),
+        }
     }
 
-    fn push(&self, py: Python, priority: i32, item: PyObject) {
-        // ALLOW-THREADS: Releasing the GIL so other threads can run Python code
-        // while Rust is busy sorting the Vec.
-        py.allow_threads(move || {
-            let mut data = self.queue.lock().unwrap();
-            data.push((priority, item));
-            data.sort_unstable_by(|a, b| b.0.cmp(&a.0));
+    /// Add an item in O(log n).
+    ///
+    /// Ints (that fit in 64 bits) and floats are compared in Rust with the GIL
+    /// released. Any other priority (datetime, tuple, ...) switches the queue to
+    /// Python's `<` until it runs empty again.
+    fn push(&self, py: Python, priority: &Bound<'_, PyAny>, item: PyObject) -> PyResult<()> {
+        self.insert(py, vec![(Priority::classify(priority), item)])
+    }
+
+    /// Remove and return the item with the lowest priority in O(log n).
+    ///
+    /// By default an empty queue returns None right away. With block=True the
+    /// call waits (with the GIL released) until an item is pushed, close() is
+    /// called or `timeout` seconds have passed, and returns None in the last two
+    /// cases. Items pushed before close() are still handed out.
+    #[pyo3(signature = (block = false, timeout = None))]
+    fn pop(&self, py: Python, block: bool, timeout: Option<f64>) -> PyResult<Option<PyObject>> {
+        if !block {
+            return match py.allow_threads(|| self.acquire().try_pop_number()) {
+                Some(item) => Ok(item),
+                None => self.lock(py).pop(py),
+            };
+        }
+
+        let deadline = match timeout {
+            Some(seconds) if !(seconds >= 0.0) => {
+                return Err(PyValueError::new_err("'timeout' must be a non-negative number"));
+            }
+            // a timeout too large for an Instant means wait forever
+            Some(seconds) => Duration::try_from_secs_f64(seconds)
+                .ok()
+                .and_then(|timeout| Instant::now().checked_add(timeout)),
+            None => None,
+        };
+
+        let mut first_attempt = true;
+        loop {
+            let waited = py.allow_threads(|| self.wait_for_item(deadline, first_attempt));
+            first_attempt = false;
+            match waited {
+                Waited::Item(item) => return Ok(Some(item)),
+                Waited::Empty => return Ok(None),
+                Waited::NeedsPython => {
+                    // another consumer may have taken it in between; then wait again
+                    if let Some(item) = self.lock(py).pop(py)? {
+                        return Ok(Some(item));
+                    }
+                }
+                Waited::Again => py.check_signals()?,
+            }
+        }
+    }
+
+    /// Refuse further pushes and wake every blocked pop.
+    fn close(&self, py: Python) {
+        self.lock(py).closed = true;
+        self.ready.notify_all();
+    }
+
+    #[getter]
+    fn closed(&self, py: Python) -> bool {
+        self.lock(py).closed
+    }
+
+    /// Return the contention metrics as a dict: current and maximum depth, push
+    /// and pop counts, contended lock acquisitions and the total time spent
+    /// waiting for the lock, and blocked pops and the total time they waited.
+    fn stats<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
+        // copy the numbers out first: building the dict may run arbitrary Python (gc)
+        let (depth, current) = {
+            let data = self.lock(py);
+            (data.len(), data.stats)
+        };
+        let stats = PyDict::new(py);
+        stats.set_item("depth", depth)?;
+        stats.set_item("max_depth", current.max_depth)?;
+        stats.set_item("pushes", current.pushes)?;
+        stats.set_item("pops", current.pops)?;
+        stats.set_item("contended_locks", current.contended_locks)?;
+        stats.set_item("lock_wait_seconds", current.lock_wait.as_secs_f64())?;
+        stats.set_item("blocked_pops", current.blocked_pops)?;
+        stats.set_item("blocked_wait_seconds", current.blocked_wait.as_secs_f64())?;
+        Ok(stats)
+    }
+
+    /// Add every (priority, item) pair of an iterable.
+    ///
+    /// The pairs are converted while holding the GIL, then the lock is taken once
+    /// and the batch is heapified and merged into the queue in one step.
+    fn push_many(&self, py: Python, pairs: &Bound<'_, PyAny>) -> PyResult<()> {
+        let mut batch: Vec<(Priority, PyObject)> = Vec::new();
+        for pair in pairs.try_iter()? {
+            let (priority, item): (Bound<'_, PyAny>, PyObject) = pair?.extract()?;
+            batch.push((Priority::classify(&priority), item));
+        }
+
+        self.insert(py, batch)
+    }
+
+    /// Remove up to `n` items in priority order under a single lock and return them as a list.
+    fn pop_many(&self, py: Python, n: usize) -> PyResult<Vec<PyObject>> {
+        let popped = py.allow_threads(|| {
+            let mut data = self.acquire();
+            let Store::Numbers(heap) = &mut data.store else {
+                return None;
+            };
+            let count = n.min(heap.len());
+            let mut items = Vec::with_capacity(count);
+            for _ in 0..count {
+                if let Some(entry) = heap.pop() {
+                    items.push(entry.item);
+                }
+            }
+            data.stats.pops += items.len() as u64;
+            Some(items)
         });
+
+        if let Some(items) = popped {
+            return Ok(items);
+        }
+
+        let mut data = self.lock(py);
+        let mut items = Vec::new();
+        while items.len() < n {
+            match data.pop(py)? {
+                Some(item) => items.push(item),
+                None => break,
+            }
+        }
+        Ok(items)
+    }
+
+    /// Remove every item and return them as a list in priority order.
+    fn drain(&self, py: Python) -> PyResult<Vec<PyObject>> {
+        let store = py.allow_threads(|| {
+            let mut data = self.acquire();
+            let drained = data.len() as u64;
+            data.stats.pops += drained;
+            std::mem::replace(&mut data.store, Store::Numbers(BinaryHeap::new()))
+        });
+        sorted_items(py, store)
+    }
+
+    /// Return the item with the lowest priority without removing it, or None when empty.
+    fn peek(&self, py: Python) -> Option<PyObject> {
+        let data = self.lock(py);
+        match &data.store {
+            Store::Numbers(heap) => heap.peek().map(|entry| entry.item.clone_ref(py)),
+            Store::Objects(heap) => heap.first().map(|entry| entry.item.clone_ref(py)),
+        }
+    }
+
+    /// Return the lowest priority without removing its item, or None when empty.
+    fn peek_priority(&self, py: Python) -> Option<PyObject> {
+        let data = self.lock(py);
+        match &data.store {
+            Store::Numbers(heap) => heap.peek().map(|entry| entry.priority.into_object(py)),
+            Store::Objects(heap) => heap.first().map(|entry| entry.priority.clone_ref(py)),
+        }
     }
 
-    fn pop(&self, py: Python) -> Option<PyObject> {
-        py.allow_threads(move || {
-            let mut data = self.queue.lock().unwrap();
-            data.pop().map(|(_prio, item)| item)
-        })
+    /// Return every (priority, item) pair in priority order without removing anything.
+    fn snapshot(&self, py: Python) -> PyResult<Vec<(PyObject, PyObject)>> {
+        let mut heap: Vec<ObjectEntry> = {
+            let data = self.lock(py);
+            match &data.store {
+                Store::Numbers(heap) => {
+                    let mut entries: Vec<&Entry> = heap.iter().collect();
+                    // Ord is reversed, so descending by Ord is lowest priority first
+                    entries.sort_unstable_by(|a, b| b.cmp(a));
+                    return Ok(entries
+                        .into_iter()
+                        .map(|entry| (entry.priority.into_object(py), entry.item.clone_ref(py)))
+                        .collect());
+                }
+                // sort a copy, so the lock is not held while Python compares
+                Store::Objects(heap) => heap.iter().map(|entry| entry.clone_ref(py)).collect(),
+            }
+        };
+
+        let mut entries = Vec::with_capacity(heap.len());
+        while let Some(entry) = pop_object(py, &mut heap)? {
+            entries.push((entry.priority, entry.item));
+        }
+        Ok(entries)
+    }
+
+    /// Remove every item.
+    fn clear(&self, py: Python) {
+        // take the store out first, so the items are dropped after the lock is released
+        let store = std::mem::replace(&mut self.lock(py).store, Store::Numbers(BinaryHeap::new()));
+        drop(store);
+    }
+
+    fn __len__(&self, py: Python) -> usize {
+        self.lock(py).len()
+    }
+
+    fn __bool__(&self, py: Python) -> bool {
+        self.__len__(py) > 0
     }
 }
 
-#[pymodule]
+// gil_used = false: the queue does its own locking, so it is safe on free-threaded builds
+#[pymodule(gil_used = false)]
 fn burmese_native(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<PriorityQueue>()?;
+    m.add_class::<fifo::Deque>()?;
+    m.add_class::<fifo::RingBuffer>()?;
+    m.add("QueueClosed", m.py().get_type::<QueueClosed>())?;
     Ok(())
-}
\ No newline at end of file
+}
@@ -1,25 +1,19 @@
-from typing import override, List
+from typing import Any, Callable, Optional, override
 
 from dsa_kuuking.interfaces.max_heap_interface import MaxHeapInterface
 from dsa_kuuking.heaps.min_heap.implementation.min_heap import MinHeap
 
 
 class MaxHeap[T](MinHeap, MaxHeapInterface):
-    def __init__(self):
-        super().__init__()
-        self._max_heap: List[T] = []
+    """A MinHeap with the order reversed: pop returns the largest element.
 
-    @override
-    def heapify_down(self, index: int) -> None:
-        while self.has_left_child(index):
-            ...
+    It is a MinHeap built with reverse=True: the module-level _sift_up/_sift_down
+    loops take that flag and compare the other way round, so larger entries rise.
+    """
 
-    @override
-    def heapify_up(self, index: int) -> None: ...
+    def __init__(self, key: Optional[Callable[[T], Any]] = None):
+        super().__init__(key=key, reverse=True)
 
     @override
     def get_largest_index(self, index: int) -> int:
-        if self.has_right_child(index):
-            return max(self.left_child(index), self.right_child(index), key=lambda i: self._max_heap[i])
-
-        return self.left_child(index)
+        return self.get_smallest_child_index(index)
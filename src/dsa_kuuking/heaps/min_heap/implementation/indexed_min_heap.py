@@ -0,0 +1,204 @@
+from itertools import count
+from typing import Any, Dict, Iterable, List, Tuple, override
+
+from dsa_kuuking.heaps.min_heap.implementation.min_heap import MinHeap
+from dsa_kuuking.types.errors.duplicate_item_exception import DuplicateItemException
+
+
+class IndexedMinHeap[T](MinHeap):
+    """A MinHeap of (priority, sequence, item) entries that knows where every item lives.
+
+    Alongside the usual array layout it keeps an item -> slot map, which makes
+    membership O(1) and lets update/remove find their entry without a scan.
+    Items must be hashable and unique.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._min_heap: List[Tuple[Any, int, T]] = []
+        self._positions: Dict[T, int] = {}
+        self._sequence = count()
+
+    @override
+    def swap(self, i: int, j: int) -> None:
+        heap = self._min_heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self._positions[heap[i][2]] = i
+        self._positions[heap[j][2]] = j
+
+    @override
+    def get_peek(self) -> T:
+        return self._min_heap[0][2]
+
+    def get_peek_priority(self) -> Any:
+        return self._min_heap[0][0]
+
+    def priority_of(self, item: T) -> Any:
+        return self._min_heap[self._position(item)][0]
+
+    @override
+    def insert(self, element: T) -> None:
+        # without an explicit priority the element is its own priority
+        self.push(element, element)
+
+    def push(self, item: T, priority: Any) -> None:
+        if item in self._positions:
+            raise DuplicateItemException(item)
+
+        index = len(self._min_heap)
+        self._min_heap.append((priority, next(self._sequence), item))
+        self._positions[item] = index
+        self.heapify_up(index)
+
+    @override
+    def heapify(self, list_of_elements: Iterable[T]) -> 'IndexedMinHeap[T]':
+        heap = self._min_heap
+        positions = self._positions
+        elements = list(list_of_elements)
+
+        # check the whole batch first, so a duplicate leaves the heap as it was
+        seen = set()
+        for element in elements:
+            if element in positions or element in seen:
+                raise DuplicateItemException(element)
+            seen.add(element)
+
+        # register every element in its appended slot, then rebuild bottom-up
+        for element in elements:
+            positions[element] = len(heap)
+            heap.append((element, next(self._sequence), element))
+
+        self._build()
+
+        return self
+
+    @override
+    def pop(self) -> T:
+        heap = self._min_heap
+        last = heap.pop()
+
+        if not heap:
+            del self._positions[last[2]]
+            return last[2]
+
+        # move the last entry to the root and sift it down
+        top = heap[0]
+        heap[0] = last
+        self._positions[last[2]] = 0
+        del self._positions[top[2]]
+        self.heapify_down(0)
+
+        return top[2]
+
+    @override
+    def pushpop(self, element: T) -> T:
+        self.insert(element)
+        return self.pop()
+
+    @override
+    def replace(self, element: T) -> T:
+        if self.is_empty():
+            raise IndexError("replace on an empty heap")
+
+        result = self.pop()
+        self.insert(element)
+        return result
+
+    def update(self, item: T, priority: Any) -> None:
+        """Change the priority of an item in O(log n).
+
+        The item gets a fresh sequence number, so it queues behind items that
+        already have the new priority (same as removing and re-inserting it).
+        """
+        index = self._position(item)
+        old_entry = self._min_heap[index]
+        new_entry = (priority, next(self._sequence), item)
+        self._min_heap[index] = new_entry
+
+        if new_entry < old_entry:
+            self.heapify_up(index)
+        else:
+            self.heapify_down(index)
+
+    def remove(self, item: T) -> Any:
+        """Remove an item in O(log n) and return its priority."""
+        index = self._position(item)
+        heap = self._min_heap
+        removed = heap[index]
+        del self._positions[item]
+
+        last = heap.pop()
+        if index < len(heap):
+            # fill the hole with the last entry and restore the heap property
+            heap[index] = last
+            self._positions[last[2]] = index
+
+            if last < removed:
+                self.heapify_up(index)
+            else:
+                self.heapify_down(index)
+
+        return removed[0]
+
+    def clear(self) -> None:
+        self._min_heap = []
+        self._positions = {}
+
+    def _position(self, item: T) -> int:
+        try:
+            return self._positions[item]
+        except KeyError:
+            raise ValueError("Item not found in the priority queue") from None
+
+    @override
+    def heapify_up(self, index: int) -> None:
+        heap = self._min_heap
+        positions = self._positions
+        entry = heap[index]
+
+        # move parents down into the hole until the entry fits
+        while index > 0:
+            parent_index = (index - 1) >> 1
+            parent = heap[parent_index]
+
+            if not entry < parent:
+                break
+
+            heap[index] = parent
+            positions[parent[2]] = index
+            index = parent_index
+
+        heap[index] = entry
+        positions[entry[2]] = index
+
+    @override
+    def heapify_down(self, index: int) -> None:
+        heap = self._min_heap
+        positions = self._positions
+        size = len(heap)
+        entry = heap[index]
+
+        # move the smaller child up into the hole until the entry fits
+        child_index = 2 * index + 1
+        while child_index < size:
+            right_index = child_index + 1
+            if right_index < size and heap[right_index] < heap[child_index]:
+                child_index = right_index
+
+            child = heap[child_index]
+            if not child < entry:
+                break
+
+            heap[index] = child
+            positions[child[2]] = index
+            index = child_index
+            child_index = 2 * index + 1
+
+        heap[index] = entry
+        positions[entry[2]] = index
+
+    def __contains__(self, item: T) -> bool:
+        return item in self._positions
+
+    def __len__(self) -> int:
+        return len(self._min_heap)
@@ -1,12 +1,94 @@
+from itertools import count, islice
 from math import floor, log2
-from typing import List, override, Iterable
+from operator import gt, lt
+from typing import Any, Callable, Iterator, List, Optional, override, Iterable
 
 from dsa_kuuking.interfaces.min_heap_interface import MinHeapInterface
 
 
+def _sift_up(heap: List[Any], index: int, reverse: bool) -> None:
+    """Move heap[index] up while it ranks higher than its parent.
+
+    Shared by every heap in the package: a min-heap ranks smaller entries
+    higher, a reverse (max) heap ranks larger ones higher. Instead of swapping
+    at every level, the entry is lifted out, parents are shifted down into the
+    hole, and the entry is written once into its final slot.
+    """
+    entry = heap[index]
+
+    # the comparison is inlined in both branches: an operator function call
+    # per level would cost more than the rest of the loop body
+    if reverse:
+        while index > 0:
+            parent_index = (index - 1) >> 1
+            parent = heap[parent_index]
+            if not parent < entry:
+                break
+            heap[index] = parent
+            index = parent_index
+    else:
+        while index > 0:
+            parent_index = (index - 1) >> 1
+            parent = heap[parent_index]
+            if not entry < parent:
+                break
+            heap[index] = parent
+            index = parent_index
+
+    heap[index] = entry
+
+
+def _sift_down(heap: List[Any], index: int, reverse: bool) -> None:
+    """Move heap[index] down while one of its children ranks higher than it (hole technique)."""
+    size = len(heap)
+    entry = heap[index]
+    child_index = 2 * index + 1
+
+    if reverse:
+        while child_index < size:
+            # pick the larger child
+            child = heap[child_index]
+            right_index = child_index + 1
+            if right_index < size and child < heap[right_index]:
+                child_index = right_index
+                child = heap[right_index]
+            if not entry < child:
+                break
+            heap[index] = child
+            index = child_index
+            child_index = 2 * index + 1
+    else:
+        while child_index < size:
+            # pick the smaller child
+            child = heap[child_index]
+            right_index = child_index + 1
+            if right_index < size and heap[right_index] < child:
+                child_index = right_index
+                child = heap[right_index]
+            if not child < entry:
+                break
+            heap[index] = child
+            index = child_index
+            child_index = 2 * index + 1
+
+    heap[index] = entry
+
+
 class MinHeap[T](MinHeapInterface):
-    def __init__(self):
+    def __init__(self, key: Optional[Callable[[T], Any]] = None, reverse: bool = False):
+        """Create an empty heap.
+
+        Args:
+            key (Optional[Callable[[T], Any]]): computes the value elements are ordered by.
+                It runs once per element on insertion; the heap then stores
+                (key, sequence, element) entries and only compares those.
+            reverse (bool): pop the largest element first instead of the smallest.
+        """
         self._min_heap: List[T] = []
+        self._key = key
+        self._reverse = reverse
+        self._higher = gt if reverse else lt
+        self._sequence = count()
 
     @override
     def size(self) -> int:
@@ -55,10 +137,10 @@ class MinHeap[T](MinHeapInterface):
     @override
     def display(self) -> None:
         levels = self._level(self.size() - 1) + 1
-        symbols = max(len(str(x)) for x in self._min_heap)
+        symbols = max(len(str(self._undecorate(x))) for x in self._min_heap)
         row = ""
 
-        for index, element in enumerate(self._min_heap):
+        for index, element in enumerate(map(self._undecorate, self._min_heap)):
             current_level = self._level(index)
             distance = 2 ** ((levels - current_level) * symbols)
 
@@ -98,26 +180,72 @@ class MinHeap[T](MinHeapInterface):
 
     @override
     def get_peek(self) -> T:
-        return self._min_heap[0]
+        return self._undecorate(self._min_heap[0])
 
     @override
     def pop(self) -> T:
-        # swap root with the last index
-        self.swap(0, len(self._min_heap) - 1)
+        heap = self._min_heap
 
-        # pop the last element
-        result = self._min_heap.pop()
+        # take the last entry out and, unless it was the root, put it at the root
+        last = heap.pop()
+        if not heap:
+            return last if self._key is None else last[2]
 
-        # restore the min heap property
-        self.heapify_down(0)
+        result = heap[0]
+        heap[0] = last
+
+        # restore the heap property (hot path: call the sift loop directly)
+        _sift_down(heap, 0, self._reverse)
 
         # return extracted element
-        return result
+        return result if self._key is None else result[2]
 
     @override
     def insert(self, element: T) -> None:
-        self._min_heap.append(element)
-        self.heapify_up(len(self._min_heap) - 1)
+        heap = self._min_heap
+        entry = element if self._key is None else self._decorate(element)
+        index = len(heap)
+        heap.append(entry)
+
+        # most random inserts stay where they land, so the first parent is
+        # checked inline and the sift loop is only called when the entry moves
+        if index:
+            parent = heap[(index - 1) >> 1]
+            if parent < entry if self._reverse else entry < parent:
+                _sift_up(heap, index, self._reverse)
+
+    @override
+    def pushpop(self, element: T) -> T:
+        """Insert an element, then pop and return the top one, with a single sift.
+
+        If the new element would be the top itself, it is returned straight away
+        and the heap is not touched.
+        """
+        heap = self._min_heap
+        entry = element if self._key is None else self._decorate(element)
+
+        # does the current top rank higher than the new entry?
+        if heap and (entry < heap[0] if self._reverse else heap[0] < entry):
+            entry, heap[0] = heap[0], entry
+            _sift_down(heap, 0, self._reverse)
+
+        return entry if self._key is None else entry[2]
+
+    @override
+    def replace(self, element: T) -> T:
+        """Pop and return the top element, then insert a new one, with a single sift.
+
+        Unlike pushpop, the returned element may rank lower than the inserted one.
+        """
+        heap = self._min_heap
+        if not heap:
+            raise IndexError("replace on an empty heap")
+
+        result = heap[0]
+        heap[0] = element if self._key is None else self._decorate(element)
+        _sift_down(heap, 0, self._reverse)
+
+        return result if self._key is None else result[2]
 
     @override
     def insert_many(self, elements: Iterable[T]) -> None:
@@ -135,70 +263,39 @@ class MinHeap[T](MinHeapInterface):
         #      4   5
         #
         # How to go from 3 to 1? Using the parent index!
-
-        while self.has_parent(index) and self._min_heap[self.parent(index)] > self._min_heap[index]:
-            # get parent index
-            parent_index = self.parent(index)
-
-            # swap (condition is in the while loop)
-            self.swap(index, parent_index)
-
-            # to next iteration
-            index = parent_index
+        _sift_up(self._min_heap, index, self._reverse)
 
     @override
     def heapify_down(self, index: int) -> None:
         # after we extracted the least element
         # our root is not balanced: not the smallest
-        # also we should traverse the heap in the way find the smallest
-
-        # define the smallest
-        smallest_element_index = None
+        # so we move smaller children up until it fits
+        _sift_down(self._min_heap, index, self._reverse)
 
-        # traverse the heap until we end up
-        # in leaf
-        while not self.is_leaf(index):
-            if self.has_left_child(index):
-                # we have the left child
-                smallest_element_index = self.left_child(index)
+    def _decorate(self, element: T) -> Any:
+        """Wrap an element into the entry stored in the heap."""
+        if self._key is None:
+            return element
 
-            if self.has_right_child(index):
-                # get the right child
-                right_child_index = self.right_child(index)
+        # the sequence number breaks ties, so elements are never compared;
+        # it is negated for reverse heaps to keep equal keys FIFO
+        sequence = next(self._sequence)
+        return self._key(element), -sequence if self._reverse else sequence, element
 
-                # now we have to check if it is the smallest
-                if self._min_heap[smallest_element_index] > self._min_heap[right_child_index]:
-                    smallest_element_index = right_child_index
-
-            # swap if parent is greater than the smallest child
-            if self._min_heap[smallest_element_index] > self._min_heap[index]:
-                # swap
-                self.swap(index, smallest_element_index)
-
-            # next iteration
-            index = smallest_element_index
-
-    def _heapify_down(self, index):
-        while self.has_left_child(index):
-            # retrieve the smallest index
-            smallest_index = self.get_smallest_child_index(index)
-
-            # exit loop when is_leaf
-            if self.is_leaf(index):
-                break
-
-            # swap
-            self.swap(index, smallest_index)
-
-            # to the next iteration
-            index = smallest_index
+    def _undecorate(self, entry: Any) -> T:
+        return entry if self._key is None else entry[2]
 
     @override
-    def heapify(self, list_of_elements: List[T]) -> 'MinHeap[T]':
-        """Heapify the list to make a MinHeap from an input list.
+    def heapify(self, list_of_elements: Iterable[T]) -> 'MinHeap[T]':
+        """Heapify the elements to make a MinHeap from an input iterable.
+
+        The elements are appended straight into the heap's storage and the whole
+        array is rebuilt bottom-up (Floyd's algorithm), which is O(n + m) instead
+        of the O(m log(n + m)) of inserting them one by one.
 
         Args:
-            list_of_elements (list[int]): the list of data to heapify.
+            list_of_elements (Iterable[T]): the data to heapify. Any iterable works,
+                including a generator, which is consumed without being copied first.
 
         Examples:
             Example 1.
@@ -212,56 +309,104 @@ class MinHeap[T](MinHeapInterface):
                 1, 2, 3, 4, 5, 6, 7, 8, 9,
                 10, 11, 12, 13, 14, 15]
             returns: MinHeap([
-                1, 1, 3, 2, 3, 6, 7, 4,
-                9, 5, 11, 12, 13, 14, 15,
-                8, 12, 15, 25, 16, 10])
+                1, 3, 2, 4, 5, 7, 3, 11, 12, 15,
+                6, 25, 8, 9, 10, 16, 12, 13, 14, 15])
 
         Returns:
             It returns the MinHeap (self).
         """
 
-        self.insert_many(list_of_elements)
+        # extend the storage in place (no intermediate list)
+        if self._key is None:
+            self._min_heap.extend(list_of_elements)
+        else:
+            self._min_heap.extend(map(self._decorate, list_of_elements))
+
+        # sift down every internal node, starting from the last one
+        self._build()
 
         return self
 
-    def _heapify(self, list_of_elements: List[T]) -> 'MinHeap[T]':
-        """Heapify the list to make a MinHeap from an input list.
+    @classmethod
+    def from_iterable(cls, elements: Iterable[T], **options: Any) -> 'MinHeap[T]':
+        """Build a new heap from any iterable in O(n); options go to the constructor."""
+        return cls(**options).heapify(elements)
 
-        Args:
-            list_of_elements (list[int]): the list of data to heapify.
+    def _build(self) -> None:
+        # leaves already satisfy the heap property, so start at the last parent
+        for index in range(len(self._min_heap) // 2 - 1, -1, -1):
+            self.heapify_down(index)
 
-        Examples:
-            Example 1.
-            MinHeap([]) - empty heap
-            list_of_elements = [12, 15, 25, 16, 3] - input array
-            returns: MinHeap([3, 12, 25, 16, 15]) - result
+    @override
+    def get_smallest_child_index(self, index: int) -> int:
+        # the child that moves up first: the smallest one, or the largest for reverse heaps
+        left, right = self.left_child(index), self.right_child(index)
 
-            Example 2.
-            MinHeap([3, 12, 25, 16, 15]) - not empty heap
-            arr = [
-                1, 2, 3, 4, 5, 6, 7, 8, 9,
-                10, 11, 12, 13, 14, 15]
-            returns: MinHeap([
-                1, 1, 3, 2, 3, 6, 7, 4,
-                9, 5, 11, 12, 13, 14, 15,
-                8, 12, 15, 25, 16, 10])
+        if self.has_right_child(index) and self._higher(self._min_heap[right], self._min_heap[left]):
+            return right
 
-        Returns:
-            It returns the MinHeap (self).
+        return left
+
+    @staticmethod
+    def nsmallest(k: int, iterable: Iterable[T], key: Optional[Callable[[T], Any]] = None) -> List[T]:
+        """Return the k smallest elements of any iterable, smallest first.
+
+        Only a bounded max-heap of the k best candidates is kept, so memory is O(k)
+        and each element costs at most O(log k): this works on streams that do not
+        fit in memory. Equal elements keep their input order, like sorted(iterable, key=key)[:k].
         """
+        if k <= 0:
+            return []
+
+        iterator = iter(iterable)
+        # entries are (key, order, element): order breaks ties, so elements are never compared
+        if key is None:
+            entries = ((element, order, element) for order, element in enumerate(islice(iterator, k)))
+        else:
+            entries = ((key(element), order, element) for order, element in enumerate(islice(iterator, k)))
+
+        candidates = MinHeap[tuple](reverse=True).heapify(entries)
+        heap = candidates._min_heap
+
+        # replace the worst candidate whenever a strictly better element shows up
+        order = len(heap)
+        for element in iterator:
+            element_key = element if key is None else key(element)
+            if element_key < heap[0][0]:
+                heap[0] = (element_key, order, element)
+                _sift_down(heap, 0, True)
+            order += 1
+
+        heap.sort()
+        return [element for _, _, element in heap]
 
-        # modify the heap
-        self._min_heap = self._min_heap + list_of_elements
+    @staticmethod
+    def merge(*sorted_iterables: Iterable[T], key: Optional[Callable[[T], Any]] = None) -> Iterator[T]:
+        """Lazily merge sorted iterables into one sorted stream.
 
-        # traverse backward and apply heapify_app
-        for index in self.traverse_backwards():
-            self.heapify_up(index)
+        The heap holds one [key, run, element, iterator] entry per unfinished run,
+        so memory is O(k) for k runs and every element costs O(log k). On equal
+        keys, elements from earlier runs come first.
+        """
+        entries = []
+        for run, iterable in enumerate(sorted_iterables):
+            iterator = iter(iterable)
+            for element in iterator:
+                entries.append([element if key is None else key(element), run, element, iterator])
+                break
 
-        return self
+        frontier = MinHeap[list]().heapify(entries)
+        heap = frontier._min_heap
 
-    @override
-    def get_smallest_child_index(self, index: int) -> int:
-        if self.has_right_child(index):
-            return min(self.left_child(index), self.right_child(index), key=lambda i: self._min_heap[i])
+        while heap:
+            entry = heap[0]
+            yield entry[2]
 
-        return self.left_child(index)
+            # advance the run in place and sift it back down, or drop the run when exhausted
+            for element in entry[3]:
+                entry[0] = element if key is None else key(element)
+                entry[2] = element
+                _sift_down(heap, 0, False)
+                break
+            else:
+                frontier.pop()
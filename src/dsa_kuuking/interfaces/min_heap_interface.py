@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Iterable, List
+from typing import Iterable
 
 
 class MinHeapInterface[T](ABC):
@@ -48,6 +48,12 @@ class MinHeapInterface[T](ABC):
     @abstractmethod
     def insert_many(self, elements: Iterable[T]) -> None: ...
 
+    @abstractmethod
+    def pushpop(self, element: T) -> T: ...
+
+    @abstractmethod
+    def replace(self, element: T) -> T: ...
+
     @abstractmethod
     def heapify_up(self, index: int) -> None: ...
 
@@ -55,7 +61,7 @@ class MinHeapInterface[T](ABC):
     def heapify_down(self, index: int) -> None: ...
 
     @abstractmethod
-    def heapify(self, list_of_elements: List[T]) -> None: ...
+    def heapify(self, list_of_elements: Iterable[T]) -> None: ...
 
     @abstractmethod
     def get_smallest_child_index(self, index: int) -> int: ...
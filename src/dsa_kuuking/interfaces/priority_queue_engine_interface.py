@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from typing import Any, Iterable, Tuple
+
+
+class PriorityQueueEngineInterface[T](ABC):
+    @abstractmethod
+    def push(self, item: T, priority: Any) -> None: ...
+
+    @abstractmethod
+    def push_many(self, entries: Iterable[Tuple[Any, T]]) -> None: ...
+
+    @abstractmethod
+    def pop(self) -> T: ...
+
+    @abstractmethod
+    def peek(self) -> T: ...
+
+    @abstractmethod
+    def peek_priority(self) -> Any: ...
+
+    @abstractmethod
+    def remove(self, item: T) -> Any: ...
+
+    @abstractmethod
+    def entries(self) -> Iterable[Tuple[Any, T]]: ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+    @abstractmethod
+    def __len__(self) -> int: ...
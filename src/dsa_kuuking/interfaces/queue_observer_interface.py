@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+from dsa_kuuking.types.enums.queue_event import QueueEvent
+
+
+class QueueObserverInterface(ABC):
+    @abstractmethod
+    def notify(self, event: QueueEvent, element: Any, size: int) -> None: ...
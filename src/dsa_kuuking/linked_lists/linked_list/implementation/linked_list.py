@@ -180,7 +180,7 @@ class LinkedList[T](LinkedListInterface):
 
         return ResultType(value=new_node)
 
-    def insert_before(self, target_data: Union[T, Node[T]], data: Union[T, Node[T]]) -> Optional[ResultType[Node[T], str]]:
+    def insert_before(self, target_data: Union[T, NodeType[T]], data: Union[T, NodeType[T]]) -> Optional[ResultType[NodeType[T], str]]:
         if self.is_empty():
             raise LinkedListEmptyException("Cannot insert before in an empty linked list.")
 
@@ -926,7 +926,7 @@ class LinkedList[T](LinkedListInterface):
     def swap_two_nodes(self, a: NodeType[T], b: NodeType[T]) -> Optional[ResultType[T, str]]:
         raise NotImplemented("Not supported yet!")
 
-    def to_list(self) -> List[Node[T]]:
+    def to_list(self) -> List[NodeType[T]]:
         """
         Converts the current linked list instance to a Python list.
 
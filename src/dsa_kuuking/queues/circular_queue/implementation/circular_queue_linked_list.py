@@ -1,14 +1,16 @@
-from typing import override
+from typing import override, Optional
 
 from dsa_kuuking.linked_lists.circular_linked_list.implementation.circular_linked_list import CircularLinkedList
 from dsa_kuuking.types.ResultType import ResultType
+from dsa_kuuking.types.enums.queue_event import QueueEvent
 from dsa_kuuking.interfaces.circular_queue_interface import CircularQueueInterface
+from dsa_kuuking.interfaces.queue_observer_interface import QueueObserverInterface
 from dsa_kuuking.queues.queue.implementation.queue_linked_list import Queue
 
 
 class CircularQueue[T](CircularQueueInterface, Queue):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, observer: Optional[QueueObserverInterface] = None):
+        super().__init__(observer=observer)
         self._circular_queue = CircularLinkedList[int]()
 
     @override
@@ -16,7 +18,7 @@ class CircularQueue[T](CircularQueueInterface, Queue):
         result = self._circular_queue.add_to_front(element)
 
         if result.is_ok():
-            print("Success! The element has been added: ", result.unwrap().data)
+            self.observer.notify(QueueEvent.ENQUEUED, element, self._circular_queue.size)
         else:
             raise Exception(result.unwrap_err())
 
@@ -25,7 +27,7 @@ class CircularQueue[T](CircularQueueInterface, Queue):
         result = self._circular_queue.remove_head()
 
         if result is not None:
-            print("Success! The element has been dequeued: ", result.data)
+            self.observer.notify(QueueEvent.DEQUEUED, result.data, self._circular_queue.size)
 
         return ResultType(error="Failure! Cannot remove the element!")
 
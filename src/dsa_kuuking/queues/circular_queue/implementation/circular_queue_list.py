@@ -1,66 +1,137 @@
-from typing import List, Set, override
+from collections import Counter
+from typing import Iterable, List, Optional, Tuple, override
 
-from dsa_kuuking.types.ResultType import ResultType
-from dsa_kuuking.types.errors.size_management_exception import SizeManagementException
+from dsa_kuuking.types.enums.queue_event import QueueEvent
+from dsa_kuuking.types.errors.queue_full_exception import QueueFullException
 from dsa_kuuking.interfaces.circular_queue_interface import CircularQueueInterface
+from dsa_kuuking.interfaces.queue_observer_interface import QueueObserverInterface
 from dsa_kuuking.queues.queue.implementation.queue_list import Queue
 
+MODES: Tuple[str, ...] = ("fixed", "grow", "overwrite")
+
 
 class CircularQueue[T](CircularQueueInterface, Queue):
-    def __init__(self, maxsize: int = 10):
-        super().__init__()
-        self._circular_queue: List[T] = [0] * maxsize
-        self._hash_set: Set[T] = set()
+    """A bounded FIFO queue on Queue's power-of-two ring buffer.
+
+    What happens to an enqueue when `size` elements are queued depends on the mode:
+
+    - "fixed": QueueFullException is raised
+    - "grow": `size` doubles
+    - "overwrite": the oldest element is dropped (a telemetry ring buffer) and
+      reported to the observer in an OVERWRITTEN event
+
+    `size` is the logical bound; the buffer behind it is rounded up to a power of
+    two. The buffer is allocated up front and never shrinks. enqueue_many/dequeue_many
+    move a batch with at most two slice copies, one on each side of the wrap.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10,
+        track_membership: bool = False,
+        observer: Optional[QueueObserverInterface] = None,
+        mode: str = "fixed",
+    ):
+        """Create an empty circular queue.
+
+        Args:
+            maxsize (int): the number of elements the queue holds before it is full;
+                the buffer is rounded up to a power of two.
+            track_membership (bool): see Queue.
+            observer (QueueObserverInterface): see Queue.
+            mode (str): "fixed", "grow" or "overwrite".
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if mode not in MODES:
+            raise ValueError(f"Unknown circular queue mode: {mode!r}. Choose one of {list(MODES)}.")
+
+        super().__init__(track_membership=track_membership, observer=observer)
+        self.mode: str = mode
         self.size: int = maxsize
 
-        # pointer to the head
-        self._front = 0
-
-        # numbers of enqueued elements
-        self.count = 0
+        capacity = 1 << (maxsize - 1).bit_length()
+        self._queue: List[Optional[T]] = [None] * capacity
+        self._mask = capacity - 1
 
     @override
     def enqueue(self, element: T) -> None:
         if self.is_full():
-            # handle when circular queue is full
-            raise Exception("Queue is full")
-
-        # enqueue the element
-        self._circular_queue[(self._front + self.count) % self.size] = element
-
-        # manage the size
-        result = self.manage_size(action="enqueue", value=element)
-
-        if result.is_ok():
-            print(result.unwrap())
-        else:
-            print("An error happened: ", result.unwrap_err())
-
-    @override
-    def dequeue(self) -> ResultType[T, str]:
-        # defined the element to deque
-        dequeued_element = self._circular_queue[self._front]
-
-        # remove it
-        self._circular_queue[self._front] = None
-
-        # update the circular queue's front pointer
-        self._front = (self._front + 1) % self.size
-
-        # update the size and hash_set
-        manage_size_result = self.manage_size(action="dequeue", value=dequeued_element)
-
-        if manage_size_result.is_ok():
-            print(manage_size_result.unwrap())
-        else:
-            raise SizeManagementException(manage_size_result.unwrap_err())
-
-        # return the dequeued element
-        return ResultType(value=dequeued_element)
+            # making room changes the queue, so the element must fit the buffer first
+            element = self._convert(element)
+            if self._counts is not None:
+                hash(element)  # an element that cannot be tracked fails before the queue changes
+            match self.mode:
+                case "grow":
+                    self._grow(self.count + 1)
+                case "overwrite":
+                    self.observer.notify(QueueEvent.OVERWRITTEN, self._take(1), self.count)
+                case _:
+                    raise QueueFullException()
+
+        # CircularQueueInterface comes first in the MRO, so call Queue directly;
+        # the buffer holds at least `size` slots, so it never resizes here
+        Queue.enqueue(self, element)
+
+    def enqueue_many(self, elements: Iterable[T]) -> None:
+        """Enqueue the elements in order with at most two slice copies.
+
+        Raises:
+            QueueFullException: in "fixed" mode if they do not all fit; nothing is enqueued then.
+        """
+        elements = self._block(elements)
+        n = len(elements)
+        if not n:
+            return
+
+        overflow = self.count + n - self.size
+        full = overflow > 0
+        if full and self.mode == "fixed":
+            raise QueueFullException(f"Queue is full: {n} elements do not fit in {self.size - self.count} free slots")
+
+        skipped = []
+        if full and self.mode == "overwrite" and n > self.size:
+            # only the last `size` elements survive: the ones before
+            # them are overwritten by the same batch, after everything queued
+            skipped = self._unblock(elements[:n - self.size])
+            elements = elements[n - self.size:]
+            overflow = self.count
+            n = self.size
+
+        # count the elements in before anything moves, and through a Counter of
+        # their own, so an element that cannot be tracked leaves the queue as it was
+        if self._counts is not None:
+            self._counts.update(Counter(elements))
+
+        if full:
+            if self.mode == "grow":
+                self._grow(self.count + n)
+            else:
+                self.observer.notify(QueueEvent.OVERWRITTEN, self._take(overflow) + skipped, self.count)
+
+        capacity = len(self._queue)
+        tail = (self._head + self.count) & self._mask
+        first = min(n, capacity - tail)
+        self._queue[tail:tail + first] = elements[:first]
+        self._queue[:n - first] = elements[first:]
+
+        self.count += n
+        self.observer.notify(QueueEvent.ENQUEUED_MANY, elements, self.count)
+
+    def dequeue_many(self, n: int) -> List[T]:
+        """Dequeue up to n elements in order with at most two slice copies.
+
+        Returns:
+            List[T]: fewer than n elements if the queue runs out, empty if it is empty.
+        """
+        elements = self._take(min(max(n, 0), self.count))
+        if elements:
+            self.observer.notify(QueueEvent.DEQUEUED_MANY, elements, self.count)
+        return elements
 
     @override
     def is_full(self) -> bool:
-        return self.size == self.count
+        return self.count == self.size
 
     @override
     def peek(self) -> None:
@@ -72,9 +143,51 @@ class CircularQueue[T](CircularQueueInterface, Queue):
             print(result.unwrap_err())
 
     @override
-    def get_peek(self) -> ResultType[T, str]:
-        if self.is_empty():
-            return ResultType(error="Cannot retrieve the peek from empty queue!")
-
-        return ResultType(value=self._circular_queue[self._front])
-
+    def _pop_head(self) -> T:
+        # like Queue._pop_head, but the buffer keeps its capacity
+        element = self._queue[self._head]
+        self._queue[self._head] = None
+        self._head = (self._head + 1) & self._mask
+        return element
+
+    def _block(self, elements: Iterable[T]) -> List[T]:
+        # the elements as something the buffer accepts in a slice assignment
+        return list(elements)
+
+    def _unblock(self, block: List[T]) -> List[T]:
+        # the inverse of _block: a slice of a block as a list of elements
+        return block
+
+    def _convert(self, element: T) -> T:
+        # a single element as the buffer stores it; raises if the buffer cannot
+        return element
+
+    def _grow(self, needed: int) -> None:
+        # double the logical size until the elements fit; the buffer follows it
+        # to the next power of two
+        size = self.size
+        while size < needed:
+            size *= 2
+
+        capacity = 1 << (size - 1).bit_length()
+        if capacity > len(self._queue):
+            self._resize(capacity)
+        self.size = size
+
+    def _take(self, n: int) -> List[T]:
+        # remove the n oldest elements: at most two slices, cleared with two slice assignments
+        if not n:
+            return []
+
+        head, capacity = self._head, len(self._queue)
+        first = min(n, capacity - head)
+        elements = self._queue[head:head + first] + self._queue[:n - first]
+        self._queue[head:head + first] = [None] * first
+        self._queue[:n - first] = [None] * (n - first)
+
+        self._head = (head + n) & self._mask
+        self.count -= n
+        if self._counts is not None:
+            for element in elements:
+                self._untrack(element)
+        return elements
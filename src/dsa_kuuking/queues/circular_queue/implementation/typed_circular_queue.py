@@ -0,0 +1,159 @@
+from array import array, typecodes
+from typing import Any, Iterable, List, Optional, Tuple, override
+
+from dsa_kuuking.types.ResultType import ResultType
+from dsa_kuuking.interfaces.queue_observer_interface import QueueObserverInterface
+from dsa_kuuking.queues.circular_queue.implementation.circular_queue_list import CircularQueue
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+BACKENDS: Tuple[str, ...] = ("array", "numpy")
+
+
+class TypedCircularQueue[T](CircularQueue[T]):
+    """A CircularQueue of unboxed numbers in an array.array (or a NumPy array).
+
+    Works like CircularQueue, but the elements are stored as raw machine values
+    of one typecode ("d" for float64, "f", "i", "q", ... as in the array module):
+    8 bytes per float sample instead of a pointer plus a boxed float. An element
+    of the wrong type is rejected before anything is enqueued.
+
+    segments() exposes the queued elements through the buffer protocol without
+    copying them, for vectorised aggregation downstream. Elements handed out
+    one by one (dequeue, get_peek, traverse, ...) are Python numbers with
+    either backend.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        typecode: str = "d",
+        backend: str = "array",
+        track_membership: bool = False,
+        observer: Optional[QueueObserverInterface] = None,
+        mode: str = "fixed",
+    ):
+        """Create an empty typed circular queue.
+
+        Args:
+            maxsize (int): see CircularQueue.
+            typecode (str): an array module typecode, e.g. "d" for float64.
+                The numpy backend takes the numeric ones, which map to a NumPy
+                dtype of the same item size.
+            backend (str): "array" for array.array, "numpy" for a NumPy array
+                (raises ImportError when NumPy is not installed).
+            track_membership (bool): see Queue.
+            observer (QueueObserverInterface): see Queue.
+            mode (str): "fixed", "grow" or "overwrite", see CircularQueue.
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend!r}. Choose one of {list(BACKENDS)}.")
+        if backend == "numpy" and numpy is None:
+            raise ImportError("NumPy is not installed. Use backend='array' or install numpy.")
+        if typecode not in typecodes:
+            raise ValueError(f"Unknown typecode: {typecode!r}. Choose one of {list(typecodes)}.")
+        if backend == "numpy" and not self._numpy_matches(typecode):
+            raise ValueError(f"Typecode {typecode!r} has no matching NumPy dtype.")
+
+        self.typecode: str = typecode
+        self.backend: str = backend
+        super().__init__(maxsize=maxsize, track_membership=track_membership, observer=observer, mode=mode)
+        self._queue = self._allocate(len(self._queue))
+
+    def segments(self) -> Tuple[memoryview, ...]:
+        """Return the queued elements, front to back, as views into the buffer.
+
+        There are two segments when the elements wrap around the end of the
+        buffer, one when they do not and none when the queue is empty. Nothing
+        is copied: the views see the buffer as it is, so read them before the
+        next enqueue or dequeue.
+        """
+        if not self.count:
+            return ()
+
+        view = memoryview(self._queue)
+        head = self._head
+        first = min(self.count, len(self._queue) - head)
+        if first == self.count:
+            return (view[head:head + first],)
+        return view[head:], view[:self.count - first]
+
+    @override
+    def get_peek(self) -> ResultType[T, str]:
+        result = super().get_peek()
+        if result.is_ok():
+            return ResultType(value=self._value(result.unwrap()))
+        return result
+
+    @override
+    def traverse(self) -> Iterable[T]:
+        # front to back, one segment at a time
+        for segment in self.segments():
+            yield from segment.tolist()
+
+    @staticmethod
+    def _numpy_matches(typecode: str) -> bool:
+        try:
+            dtype = numpy.dtype(typecode)
+        except TypeError:
+            return False
+        return dtype.kind in "iuf" and dtype.itemsize == array(typecode).itemsize
+
+    def _value(self, element: Any) -> T:
+        # NumPy hands out its own scalar types; convert them like array.array does
+        return element.item() if self.backend == "numpy" else element
+
+    def _allocate(self, capacity: int) -> Any:
+        if self.backend == "numpy":
+            return numpy.zeros(capacity, dtype=self.typecode)
+        return array(self.typecode, [0]) * capacity
+
+    @override
+    def _block(self, elements: Iterable[T]) -> Any:
+        if self.backend == "numpy":
+            return numpy.asarray(list(elements), dtype=self.typecode)
+        return array(self.typecode, elements)
+
+    @override
+    def _unblock(self, block: Any) -> List[T]:
+        return block.tolist()
+
+    @override
+    def _convert(self, element: T) -> T:
+        return self._unblock(self._block([element]))[0]
+
+    @override
+    def _pop_head(self) -> T:
+        # nothing to clear: the slots hold numbers, not references
+        element = self._queue[self._head]
+        self._head = (self._head + 1) & self._mask
+        return self._value(element)
+
+    @override
+    def _take(self, n: int) -> List[T]:
+        head = self._head
+        first = min(n, len(self._queue) - head)
+        elements = self._queue[head:head + first].tolist() + self._queue[:n - first].tolist()
+
+        self._head = (head + n) & self._mask
+        self.count -= n
+        if self._counts is not None:
+            for element in elements:
+                self._untrack(element)
+        return elements
+
+    @override
+    def _resize(self, capacity: int) -> None:
+        # unroll the elements to the front of a new buffer (at most two block copies)
+        buffer = self._allocate(capacity)
+        head = self._head
+        first = min(self.count, len(self._queue) - head)
+        buffer[:first] = self._queue[head:head + first]
+        buffer[first:self.count] = self._queue[:self.count - first]
+
+        self._queue = buffer
+        self._head = 0
+        self._mask = capacity - 1
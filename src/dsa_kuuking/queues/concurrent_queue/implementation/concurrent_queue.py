@@ -0,0 +1,272 @@
+import threading
+import time
+from typing import Callable, List, Optional, Type
+
+from dsa_kuuking.types.errors.empty_queue_exception import EmptyQueueException
+from dsa_kuuking.types.errors.queue_full_exception import QueueFullException
+
+# GIL hand-overs a blocked SPSCQueue side tries before it sleeps
+SPINS = 16
+
+
+def _ring_capacity(maxsize: int) -> int:
+    if maxsize < 1:
+        raise ValueError("maxsize must be at least 1")
+    return 1 << (maxsize - 1).bit_length()
+
+
+class SPSCQueue[T]:
+    """A bounded queue between exactly one producer thread and one consumer thread.
+
+    It uses CircularQueue's ring layout (a power-of-two list indexed with a
+    mask), but the producer only writes _tail and the consumer only writes
+    _head, both counting up forever. Each side reads the other's counter to
+    tell full from empty, and under the GIL a slot is written before the counter
+    that publishes it, so put_nowait/get_nowait take no lock.
+
+    Blocking put/get only wait when the queue is full/empty: the waiting side
+    first yields the GIL to the other side up to SPINS times (time.sleep(0)),
+    then raises a flag and sleeps on an Event, which the other side sets as soon
+    as it has published an item/freed a slot. The Event is only touched while the
+    flag is up, so a side that is not blocked pays one attribute read per call.
+    With more than one producer or consumer use MPMCQueue.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """Create an empty queue that holds up to maxsize items (rounded up to a power of two)."""
+        capacity = _ring_capacity(maxsize)
+        self.maxsize: int = capacity
+        self._ring: List[Optional[T]] = [None] * capacity
+        self._mask: int = capacity - 1
+        self._head: int = 0  # written by the consumer only
+        self._tail: int = 0  # written by the producer only
+
+        self._consumer_waiting: bool = False
+        self._producer_waiting: bool = False
+        self._not_empty: threading.Event = threading.Event()
+        self._not_full: threading.Event = threading.Event()
+
+    def put_nowait(self, item: T) -> None:
+        """Add an item without blocking (producer thread only).
+
+        Raises:
+            QueueFullException: if the queue is full.
+        """
+        tail = self._tail
+        if tail - self._head == self.maxsize:
+            raise QueueFullException()
+
+        self._ring[tail & self._mask] = item
+        self._tail = tail + 1  # publishes the slot
+
+        if self._consumer_waiting:
+            self._not_empty.set()
+
+    def get_nowait(self) -> T:
+        """Remove and return the oldest item without blocking (consumer thread only).
+
+        Raises:
+            EmptyQueueException: if the queue is empty.
+        """
+        head = self._head
+        if head == self._tail:
+            raise EmptyQueueException()
+
+        index = head & self._mask
+        item = self._ring[index]
+        self._ring[index] = None  # drop the reference
+        self._head = head + 1  # hands the slot back
+
+        if self._producer_waiting:
+            self._not_full.set()
+        return item
+
+    def put(self, item: T, block: bool = True, timeout: Optional[float] = None) -> None:
+        """Add an item, waiting up to timeout seconds (forever if None) for a free slot if block is set.
+
+        Raises:
+            QueueFullException: if the queue is full and block is False or the timeout expires.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                return self.put_nowait(item)
+            except QueueFullException:
+                if not block:
+                    raise
+
+            if self._yield_until(self.full):
+                continue
+
+            # the flag is raised before the check, so the consumer cannot miss it
+            self._producer_waiting = True
+            self._not_full.clear()
+            if self._tail - self._head < self.maxsize:
+                self._producer_waiting = False
+                continue
+
+            signalled = self._not_full.wait(None if deadline is None else max(deadline - time.monotonic(), 0))
+            self._producer_waiting = False
+            if not signalled and self.full():
+                raise QueueFullException(f"Timed out after {timeout}s")
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> T:
+        """Remove and return the oldest item, waiting up to timeout seconds (forever if None) if block is set.
+
+        Raises:
+            EmptyQueueException: if the queue is empty and block is False or the timeout expires.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                return self.get_nowait()
+            except EmptyQueueException:
+                if not block:
+                    raise
+
+            if self._yield_until(self.empty):
+                continue
+
+            # the flag is raised before the check, so the producer cannot miss it
+            self._consumer_waiting = True
+            self._not_empty.clear()
+            if self._head != self._tail:
+                self._consumer_waiting = False
+                continue
+
+            signalled = self._not_empty.wait(None if deadline is None else max(deadline - time.monotonic(), 0))
+            self._consumer_waiting = False
+            if not signalled:
+                raise EmptyQueueException(f"Timed out after {timeout}s")
+
+    @staticmethod
+    def _yield_until(blocked: Callable[[], bool]) -> bool:
+        # hand the GIL to the other side a few times before going to sleep on an Event
+        for _ in range(SPINS):
+            time.sleep(0)
+            if not blocked():
+                return True
+        return False
+
+    def qsize(self) -> int:
+        """Return the number of items (a snapshot when the other side is running)."""
+        return self._tail - self._head
+
+    def empty(self) -> bool:
+        return self._tail == self._head
+
+    def full(self) -> bool:
+        return self._tail - self._head == self.maxsize
+
+    def __len__(self) -> int:
+        return self.qsize()
+
+
+class MPMCQueue[T]:
+    """A bounded queue for any number of producer and consumer threads.
+
+    A ring buffer guarded by one lock, with not-empty and not-full conditions
+    for blocking put/get. Compared with queue.Queue it keeps no task_done
+    bookkeeping and only notifies a condition when a thread is waiting on it,
+    so an uncontended put or get is one lock round trip.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """Create an empty queue that holds up to maxsize items."""
+        capacity = _ring_capacity(maxsize)
+        self.maxsize: int = maxsize
+        self._ring: List[Optional[T]] = [None] * capacity
+        self._mask: int = capacity - 1
+        self._head: int = 0
+        self._count: int = 0
+
+        self._lock: threading.Lock = threading.Lock()
+        self._not_empty: threading.Condition = threading.Condition(self._lock)
+        self._not_full: threading.Condition = threading.Condition(self._lock)
+        self._getters: int = 0  # threads waiting in get
+        self._putters: int = 0  # threads waiting in put
+
+    def put(self, item: T, block: bool = True, timeout: Optional[float] = None) -> None:
+        """Add an item, waiting up to timeout seconds (forever if None) for a free slot if block is set.
+
+        Raises:
+            QueueFullException: if the queue is full and block is False or the timeout expires.
+        """
+        with self._lock:
+            if self._count == self.maxsize:
+                if not block:
+                    raise QueueFullException()
+                self._putters += 1
+                try:
+                    self._wait(self._not_full, self._is_full, timeout, QueueFullException)
+                finally:
+                    self._putters -= 1
+
+            self._ring[(self._head + self._count) & self._mask] = item
+            self._count += 1
+            if self._getters:
+                self._not_empty.notify()
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> T:
+        """Remove and return the oldest item, waiting up to timeout seconds (forever if None) if block is set.
+
+        Raises:
+            EmptyQueueException: if the queue is empty and block is False or the timeout expires.
+        """
+        with self._lock:
+            if not self._count:
+                if not block:
+                    raise EmptyQueueException()
+                self._getters += 1
+                try:
+                    self._wait(self._not_empty, self._is_empty, timeout, EmptyQueueException)
+                finally:
+                    self._getters -= 1
+
+            head = self._head
+            item = self._ring[head]
+            self._ring[head] = None  # drop the reference
+            self._head = (head + 1) & self._mask
+            self._count -= 1
+            if self._putters:
+                self._not_full.notify()
+            return item
+
+    def put_nowait(self, item: T) -> None:
+        self.put(item, block=False)
+
+    def get_nowait(self) -> T:
+        return self.get(block=False)
+
+    def qsize(self) -> int:
+        return self._count
+
+    def empty(self) -> bool:
+        return self._count == 0
+
+    def full(self) -> bool:
+        return self._count == self.maxsize
+
+    def _is_empty(self) -> bool:
+        return self._count == 0
+
+    def _is_full(self) -> bool:
+        return self._count == self.maxsize
+
+    @staticmethod
+    def _wait(
+        condition: threading.Condition,
+        blocked: Callable[[], bool],
+        timeout: Optional[float],
+        error: Type[Exception],
+    ) -> None:
+        # called with the lock held; returns with it held once blocked() is false
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while blocked():
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise error(f"Timed out after {timeout}s")
+            condition.wait(remaining)
+
+    def __len__(self) -> int:
+        return self._count
@@ -0,0 +1,285 @@
+from typing import Iterable, Iterator, List, Optional, Tuple, override
+
+from dsa_kuuking.types.ResultType import ResultType
+from dsa_kuuking.types.enums.queue_event import QueueEvent
+from dsa_kuuking.types.errors.empty_queue_exception import EmptyQueueException
+from dsa_kuuking.interfaces.deque_interface import DequeInterface
+from dsa_kuuking.interfaces.queue_observer_interface import QueueObserverInterface
+from dsa_kuuking.queues.queue.implementation.queue_observers import NULL_OBSERVER
+
+BLOCK_SIZE = 64
+# an empty deque starts in the middle of its block, so that it can grow either way
+CENTER = (BLOCK_SIZE - 1) // 2
+
+
+class Block[T]:
+    """A fixed-size run of slots, linked to its neighbouring blocks."""
+
+    __slots__ = ("slots", "prev", "next")
+
+    def __init__(self):
+        self.slots: List[Optional[T]] = [None] * BLOCK_SIZE
+        self.prev: Optional['Block[T]'] = None
+        self.next: Optional['Block[T]'] = None
+
+
+class Deque[T](DequeInterface):
+    """A double-ended queue on a doubly linked list of blocks, like CPython's deque.
+
+    The elements run from slot _left_index of the _left block to slot
+    _right_index of the _right block. A block holds BLOCK_SIZE elements, so
+    there is one allocation and two links per BLOCK_SIZE elements instead of
+    one node per element.
+
+    - enqueue/dequeue at either end is O(1)
+    - indexing walks blocks from the nearer end: O(n / BLOCK_SIZE)
+    - rotate(k) moves min(k, n - k) elements
+    """
+
+    def __init__(self, elements: Iterable[T] = (), observer: Optional[QueueObserverInterface] = None):
+        block = Block()
+        self._left: Block[T] = block
+        self._right: Block[T] = block
+        self._left_index: int = CENTER + 1
+        self._right_index: int = CENTER
+        self._length: int = 0
+        self.observer: QueueObserverInterface = observer or NULL_OBSERVER
+
+        for element in elements:
+            self._append(element)
+
+    @override
+    def enqueue_front(self, element: T) -> None:
+        self._append_left(element)
+        self.observer.notify(QueueEvent.ENQUEUED, element, self._length)
+
+    @override
+    def enqueue_rear(self, element: T) -> None:
+        self._append(element)
+        self.observer.notify(QueueEvent.ENQUEUED, element, self._length)
+
+    @override
+    def dequeue_front(self) -> ResultType[T, str]:
+        if not self._length:
+            raise EmptyQueueException("Cannot dequeue from the front of an empty deque!")
+
+        element = self._pop_left()
+        self.observer.notify(QueueEvent.DEQUEUED, element, self._length)
+        return ResultType(value=element)
+
+    @override
+    def dequeue_rear(self) -> ResultType[T, str]:
+        if not self._length:
+            raise EmptyQueueException("Cannot dequeue from the rear of an empty deque!")
+
+        element = self._pop()
+        self.observer.notify(QueueEvent.DEQUEUED, element, self._length)
+        return ResultType(value=element)
+
+    @override
+    def enqueue(self, element: T) -> None:
+        self.enqueue_rear(element)
+
+    @override
+    def dequeue(self) -> ResultType[T, str]:
+        return self.dequeue_front()
+
+    @override
+    def get_peek_front(self) -> ResultType[T, str]:
+        if not self._length:
+            return ResultType(error="Cannot retrieve the front peek from the empty deque!")
+
+        return ResultType(value=self._left.slots[self._left_index])
+
+    @override
+    def get_peek_rear(self) -> ResultType[T, str]:
+        if not self._length:
+            return ResultType(error="Cannot retrieve the rear peek from the empty deque!")
+
+        return ResultType(value=self._right.slots[self._right_index])
+
+    @override
+    def get_peek(self) -> ResultType[T, str]:
+        return self.get_peek_front()
+
+    @override
+    def peek_front(self) -> None:
+        result = self.get_peek_front()
+
+        if result.is_ok():
+            print("Front peek is ", result.unwrap())
+        else:
+            print(result.unwrap_err())
+
+    @override
+    def peek_rear(self) -> None:
+        result = self.get_peek_rear()
+
+        if result.is_ok():
+            print("Rear peek is ", result.unwrap())
+        else:
+            print(result.unwrap_err())
+
+    @override
+    def peek(self) -> None:
+        self.peek_front()
+
+    @override
+    def is_empty(self) -> bool:
+        return self._length == 0
+
+    @override
+    def traverse(self) -> Iterable[T]:
+        # front to back, block by block
+        block, index = self._left, self._left_index
+        for _ in range(self._length):
+            yield block.slots[index]
+            index += 1
+            if index == BLOCK_SIZE:
+                block, index = block.next, 0
+
+    @override
+    def display(self) -> None:
+        if self.is_empty():
+            print("The dequeue is empty: Deque()")
+
+        print("<-->".join(map(str, self.traverse())))
+
+    @override
+    def manage_size(self, action: str = "") -> ResultType[str, str]:
+        """Refuse to change the length by hand: it is the number of filled slots in the blocks.
+
+        Returns:
+            ResultType[str, str]: always an error; the length is left as it is.
+        """
+        match action:
+            case "enqueue" | "dequeue":
+                return ResultType(error=f"The block deque counts its own elements: {self._length}")
+            case _:
+                return ResultType(error="Wrong action!")
+
+    def rotate(self, k: int = 1) -> None:
+        """Rotate k steps to the right (the rear element becomes the front); negative k rotates left."""
+        n = self._length
+        if n <= 1:
+            return
+
+        # move the elements the short way round
+        k %= n
+        if k > n // 2:
+            k -= n
+
+        while k > 0:
+            self._append_left(self._pop())
+            k -= 1
+        while k < 0:
+            self._append(self._pop_left())
+            k += 1
+
+    def _append(self, element: T) -> None:
+        if self._right_index == BLOCK_SIZE - 1:
+            block = Block()
+            block.prev = self._right
+            self._right.next = block
+            self._right = block
+            self._right_index = -1
+
+        self._right_index += 1
+        self._right.slots[self._right_index] = element
+        self._length += 1
+
+    def _append_left(self, element: T) -> None:
+        if self._left_index == 0:
+            block = Block()
+            block.next = self._left
+            self._left.prev = block
+            self._left = block
+            self._left_index = BLOCK_SIZE
+
+        self._left_index -= 1
+        self._left.slots[self._left_index] = element
+        self._length += 1
+
+    def _pop(self) -> T:
+        block = self._right
+        element = block.slots[self._right_index]
+        block.slots[self._right_index] = None  # drop the reference
+        self._right_index -= 1
+        self._length -= 1
+
+        if not self._length:
+            self._recenter()
+        elif self._right_index < 0:
+            # the block is empty: unlink it
+            self._right = block.prev
+            self._right.next = None
+            self._right_index = BLOCK_SIZE - 1
+
+        return element
+
+    def _pop_left(self) -> T:
+        block = self._left
+        element = block.slots[self._left_index]
+        block.slots[self._left_index] = None  # drop the reference
+        self._left_index += 1
+        self._length -= 1
+
+        if not self._length:
+            self._recenter()
+        elif self._left_index == BLOCK_SIZE:
+            # the block is empty: unlink it
+            self._left = block.next
+            self._left.prev = None
+            self._left_index = 0
+
+        return element
+
+    def _recenter(self) -> None:
+        # empty again: keep one block and start from its middle
+        self._left = self._right
+        self._left.prev = self._left.next = None
+        self._left_index = CENTER + 1
+        self._right_index = CENTER
+
+    def _locate(self, index: int) -> Tuple[Block[T], int]:
+        # the block and slot of an element, walking from the nearer end
+        n = self._length
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("deque index out of range")
+
+        if index < n // 2:
+            position = self._left_index + index
+            block = self._left
+            for _ in range(position // BLOCK_SIZE):
+                block = block.next
+            return block, position % BLOCK_SIZE
+
+        # count back from the rear: position of the element relative to the start of the rear block
+        position = self._right_index - (n - 1 - index)
+        block = self._right
+        while position < 0:
+            block = block.prev
+            position += BLOCK_SIZE
+        return block, position
+
+    def __getitem__(self, index: int) -> T:
+        block, slot = self._locate(index)
+        return block.slots[slot]
+
+    def __setitem__(self, index: int, element: T) -> None:
+        block, slot = self._locate(index)
+        block.slots[slot] = element
+
+    def __contains__(self, element: T) -> bool:
+        return element in self.traverse()
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.traverse())
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __str__(self) -> str:
+        return "<-->".join(map(str, self.traverse()))
@@ -1,15 +1,17 @@
-from typing import override, Iterable
+from typing import override, Iterable, Optional
 
 from dsa_kuuking.types.errors.LinkedListEmptyException import LinkedListEmptyException
 from dsa_kuuking.linked_lists.doubly_linked_list.implementation.doubly_linked_list import DoublyLinkedList
 from dsa_kuuking.types.ResultType import ResultType
+from dsa_kuuking.types.enums.queue_event import QueueEvent
 from dsa_kuuking.interfaces.deque_interface import DequeInterface
+from dsa_kuuking.interfaces.queue_observer_interface import QueueObserverInterface
 from dsa_kuuking.queues.queue.implementation.queue_linked_list import Queue
 
 
 class Deque[T](DequeInterface, Queue):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, observer: Optional[QueueObserverInterface] = None):
+        super().__init__(observer=observer)
         self._deque = DoublyLinkedList[T]()
 
     @override
@@ -17,7 +19,7 @@ class Deque[T](DequeInterface, Queue):
         result = self._deque.add_to_front(element)
 
         if result.is_ok():
-            print("Success! The element has been enqueued to front!")
+            self.observer.notify(QueueEvent.ENQUEUED, element, self._deque.size)
         else:
             print(f"An error occurred: {result.unwrap_err()}")
 
@@ -26,7 +28,7 @@ class Deque[T](DequeInterface, Queue):
         result = self._deque.add_to_end(element)
 
         if result.is_ok():
-            print("Success! The element has been enqueued to rear!")
+            self.observer.notify(QueueEvent.ENQUEUED, element, self._deque.size)
         else:
             print(f"An error occurred: {result.unwrap_err()}")
 
@@ -35,7 +37,7 @@ class Deque[T](DequeInterface, Queue):
         result = ResultType(value=self._deque.remove_head())
 
         if result.is_ok():
-            print("Success! The element has been dequeued from front!")
+            self.observer.notify(QueueEvent.DEQUEUED, result.unwrap().data, self._deque.size)
             return result
         else:
             # Handle exceptions
@@ -48,6 +50,7 @@ class Deque[T](DequeInterface, Queue):
         if not result.is_ok():
             raise LinkedListEmptyException(message=result.unwrap_err())
 
+        self.observer.notify(QueueEvent.DEQUEUED, result.unwrap().data, self._deque.size)
         return result
 
     @override
@@ -1,33 +1,64 @@
-from typing import Set, List, override
+from collections import Counter
+from typing import Iterable, List, Optional, override
 
 from dsa_kuuking.types.ResultType import ResultType
+from dsa_kuuking.types.enums.queue_event import QueueEvent
 from dsa_kuuking.types.errors.empty_queue_exception import EmptyQueueException
 from dsa_kuuking.types.errors.size_management_exception import SizeManagementException
 from dsa_kuuking.interfaces.deque_interface import DequeInterface
+from dsa_kuuking.interfaces.queue_observer_interface import QueueObserverInterface
 from dsa_kuuking.queues.queue.implementation.queue_list import Queue
 
 
 class Deque[T](DequeInterface, Queue):
-    def __init__(self):
-        super().__init__()
-        self.count = 0
-        self._hash_set: Set[T] = set()
-        self._deque: List[T] = []
+    """A double-ended queue on Queue's growable ring buffer.
+
+    The front is the ring's head, the rear is head + count - 1 (mod capacity),
+    so every end operation and both peeks are amortised O(1): the front moves
+    the head back, the rear moves the tail forward. extend_front/extend_rear
+    resize at most once per batch and copy it in at most two slices.
+    """
+
+    def __init__(self, track_membership: bool = False, observer: Optional[QueueObserverInterface] = None):
+        super().__init__(track_membership=track_membership, observer=observer)
 
     @override
     def enqueue_front(self, element: T) -> None:
-        super().enqueue(element)
+        if self.count == len(self._queue):
+            self._resize(2 * len(self._queue))
+        head = (self._head - 1) & self._mask
+        self._queue[head] = element
 
-    @override
-    def enqueue_rear(self, element: T) -> None:
         # update the size
-        result = super().manage_size(action="enqueue", value=element)
+        result = self.manage_size(action="enqueue", value=element)
 
         if result.is_ok():
-            print(result.unwrap())
-            self._deque.append(element)
+            self._head = head
+            self.observer.notify(QueueEvent.ENQUEUED, element, self.count)
         else:
-            raise Exception(result.unwrap_err())
+            raise SizeManagementException(result.unwrap_err())
+
+    @override
+    def enqueue_rear(self, element: T) -> None:
+        super().enqueue(element)
+
+    def extend_front(self, elements: Iterable[T]) -> None:
+        """Enqueue each element to the front in turn, so they end up in reverse order (like deque.extendleft)."""
+        block = list(elements)
+        block.reverse()
+        if block:
+            self._track(block)
+            self._reserve(self.count + len(block))
+            self._head = (self._head - len(block)) & self._mask
+            self._write(self._head, block)
+
+    def extend_rear(self, elements: Iterable[T]) -> None:
+        """Enqueue the elements to the rear in order."""
+        block = list(elements)
+        if block:
+            self._track(block)
+            self._reserve(self.count + len(block))
+            self._write((self._head + self.count) & self._mask, block)
 
     @override
     def dequeue_front(self) -> ResultType[T, str]:
@@ -40,11 +71,16 @@ class Deque[T](DequeInterface, Queue):
 
         if peek_rear_result.is_ok():
             # update the size
-            result = super().manage_size(action="dequeue", value=peek_rear)
+            result = self.manage_size(action="dequeue", value=peek_rear_result.unwrap())
 
             if result.is_ok():
-                print(result.unwrap())
-                return ResultType(value=self._deque.pop())
+                # manage_size has already decremented the count, so this is the old rear slot
+                tail = (self._head + self.count) & self._mask
+                element = self._queue[tail]
+                self._queue[tail] = None  # drop the reference
+                self._shrink()
+                self.observer.notify(QueueEvent.DEQUEUED, element, self.count)
+                return ResultType(value=element)
             else:
                 raise SizeManagementException(result.unwrap_err())
         else:
@@ -52,7 +88,7 @@ class Deque[T](DequeInterface, Queue):
 
     @override
     def get_peek_front(self) -> ResultType[T, str]:
-        return ResultType(value=super().peek())
+        return super().get_peek()
 
     @override
     def get_peek_rear(self) -> ResultType[T, str]:
@@ -60,7 +96,7 @@ class Deque[T](DequeInterface, Queue):
             return ResultType(error="Cannot retrieve the rear peek from the empty dequeue!")
 
         # get peek
-        peek_rear = self._deque[-1]
+        peek_rear = self._queue[(self._head + self.count - 1) & self._mask]
 
         if peek_rear is None:
             return ResultType(error=f"Rear peek is not defined: {peek_rear}")
@@ -87,4 +123,25 @@ class Deque[T](DequeInterface, Queue):
         if self.is_empty():
             print("The dequeue is empty: Deque()")
 
-        print("<-->".join(map(str, self._deque)))
+        print("<-->".join(map(str, self.traverse())))
+
+    def _reserve(self, needed: int) -> None:
+        # a single resize to the next power of two that fits
+        if needed > len(self._queue):
+            self._resize(1 << (needed - 1).bit_length())
+
+    def _track(self, block: List[T]) -> None:
+        # count a batch in before anything moves, and through a Counter of its
+        # own, so an element that cannot be tracked leaves the deque as it was
+        if self._counts is not None:
+            self._counts.update(Counter(block))
+
+    def _write(self, start: int, block: List[T]) -> None:
+        # copy a batch into the ring from start on (at most two slices) and account for it
+        n = len(block)
+        first = min(n, len(self._queue) - start)
+        self._queue[start:start + first] = block[:first]
+        self._queue[:n - first] = block[first:]
+
+        self.count += n
+        self.observer.notify(QueueEvent.ENQUEUED_MANY, block, self.count)
@@ -0,0 +1,119 @@
+import asyncio
+from collections import deque
+from typing import Any, Callable, Deque
+
+from dsa_kuuking.interfaces.priority_queue_engine_interface import PriorityQueueEngineInterface
+from dsa_kuuking.queues.priority_queue.implementation.priority_queue_engines import create_engine, resolve_engine
+
+
+class AsyncPriorityQueue[T]:
+    """An asyncio priority queue on top of the priority queue engines.
+
+    Works like asyncio.Queue, except that get() returns the item with the lowest
+    priority (FIFO among equal priorities). Blocked put()/get() calls wait on
+    futures that are resolved by the opposite operation, so nothing polls.
+    Like asyncio.Queue it is not thread-safe: use it from one event loop.
+    """
+
+    def __init__(self, maxsize: int = 0, engine: str = "native"):
+        """Create an empty queue.
+
+        Args:
+            maxsize (int): put() waits while the queue holds this many items;
+                0 or less means unbounded.
+            engine (str): the storage engine, see PriorityQueue. "native" (the
+                default) falls back to "heap" when the extension is not built.
+        """
+        self.maxsize: int = maxsize
+        self.engine: str = resolve_engine(engine)
+        self._engine: PriorityQueueEngineInterface[T] = create_engine(self.engine)
+        self._getters: Deque[asyncio.Future] = deque()
+        self._putters: Deque[asyncio.Future] = deque()
+
+    def qsize(self) -> int:
+        """Return the number of items in the queue."""
+        return len(self._engine)
+
+    def empty(self) -> bool:
+        """Check if the queue is empty."""
+        return len(self._engine) == 0
+
+    def full(self) -> bool:
+        """Check if the queue holds maxsize items (never true when unbounded)."""
+        return 0 < self.maxsize <= len(self._engine)
+
+    async def put(self, item: T, priority: Any) -> None:
+        """Add an item with a given priority, waiting for a free slot if the queue is full."""
+        while self.full():
+            await self._wait(self._putters, self.full)
+        self.put_nowait(item, priority)
+
+    def put_nowait(self, item: T, priority: Any) -> None:
+        """Add an item with a given priority.
+
+        Raises:
+            asyncio.QueueFull: if the queue holds maxsize items.
+        """
+        if self.full():
+            raise asyncio.QueueFull
+        self._engine.push(item, priority)
+        self._wake_next(self._getters)
+
+    async def get(self) -> T:
+        """Remove and return the item with the lowest priority, waiting for one if the queue is empty."""
+        while self.empty():
+            await self._wait(self._getters, self.empty)
+        return self.get_nowait()
+
+    def get_nowait(self) -> T:
+        """Remove and return the item with the lowest priority.
+
+        Raises:
+            asyncio.QueueEmpty: if the queue is empty.
+        """
+        if self.empty():
+            raise asyncio.QueueEmpty
+        item = self._engine.pop()
+        self._wake_next(self._putters)
+        return item
+
+    def peek_nowait(self) -> T:
+        """Return the item with the lowest priority without removing it.
+
+        Raises:
+            asyncio.QueueEmpty: if the queue is empty.
+        """
+        if self.empty():
+            raise asyncio.QueueEmpty
+        return self._engine.peek()
+
+    async def _wait(self, waiters: Deque[asyncio.Future], still_blocked: Callable[[], bool]) -> None:
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                pass
+            # we were woken up but got cancelled: pass the wake-up on
+            if not still_blocked() and not waiter.cancelled():
+                self._wake_next(waiters)
+            raise
+
+    @staticmethod
+    def _wake_next(waiters: Deque[asyncio.Future]) -> None:
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    def __len__(self) -> int:
+        return len(self._engine)
+
+    def __repr__(self) -> str:
+        return (f"AsyncPriorityQueue(maxsize={self.maxsize}, engine={self.engine!r}, size={len(self)}, "
+                f"getters={len(self._getters)}, putters={len(self._putters)})")
@@ -0,0 +1,83 @@
+from typing import Any, Iterable
+
+from dsa_kuuking.heaps.min_heap.implementation.indexed_min_heap import IndexedMinHeap
+
+
+class IndexedPriorityQueue[T]:
+    """A priority queue with O(log n) change_priority/remove and O(1) contains.
+
+    Unlike PriorityQueue, every item may be queued only once: enqueueing an
+    item that is already present raises DuplicateItemException.
+    """
+
+    def __init__(self) -> None:
+        self._heap: IndexedMinHeap[T] = IndexedMinHeap()
+
+    def enqueue(self, item: T, priority: Any) -> None:
+        """Add an item to the queue with a given priority."""
+        self._heap.push(item, priority)
+
+    def dequeue(self) -> T:
+        """Remove and return the item with the highest priority (lowest priority number)."""
+        if self._heap.is_empty():
+            raise IndexError("Dequeue from an empty priority queue")
+        return self._heap.pop()
+
+    def peek(self) -> T:
+        """Return the item with the highest priority without removing it from the queue."""
+        if self._heap.is_empty():
+            raise IndexError("Peek from an empty priority queue")
+        return self._heap.get_peek()
+
+    def change_priority(self, item: T, new_priority: Any) -> None:
+        """Change the priority of an existing item in the queue."""
+        self._heap.update(item, new_priority)
+
+    def remove(self, item: T) -> Any:
+        """Remove an item from the queue and return its priority."""
+        return self._heap.remove(item)
+
+    def contains(self, item: T) -> bool:
+        """Check if the item is in the queue."""
+        return item in self._heap
+
+    def priority_of(self, item: T) -> Any:
+        """Return the current priority of an item."""
+        return self._heap.priority_of(item)
+
+    def is_empty(self) -> bool:
+        """Check if the priority queue is empty."""
+        return self._heap.is_empty()
+
+    def clear(self) -> None:
+        """Remove all items from the priority queue."""
+        self._heap.clear()
+
+    def entries(self) -> Iterable[tuple[Any, T]]:
+        """Yield (priority, item) pairs in priority order."""
+        for priority, _, item in sorted(self._heap._min_heap):
+            yield priority, item
+
+    def print_queue(self) -> None:
+        """Print the contents of the queue for debugging purposes."""
+        print("Priority Queue Contents:")
+        for priority, item in self.entries():
+            print(f" - {item} (Priority: {priority})")
+
+    def __contains__(self, item: T) -> bool:
+        return self.contains(item)
+
+    def __len__(self) -> int:
+        """Return the number of items in the priority queue."""
+        return len(self._heap)
+
+    def __iter__(self):
+        """Allow iteration over the items in the priority queue (in priority order)."""
+        for _, item in self.entries():
+            yield item
+
+    def __str__(self) -> str:
+        return " -> ".join([f"{item} (P: {priority})" for priority, item in self.entries()])
+
+    def __repr__(self) -> str:
+        return f"IndexedPriorityQueue({list(self.entries())})"
@@ -1,138 +1,176 @@
 from dsa_kuuking.interfaces.priority_queue_interface import PriorityQueueInterface
-from dsa_kuuking.linked_lists.doubly_linked_list.implementation.doubly_linked_list import DoublyLinkedList
+from dsa_kuuking.interfaces.priority_queue_engine_interface import PriorityQueueEngineInterface
+from dsa_kuuking.queues.priority_queue.implementation.priority_queue_engines import (
+    create_engine,
+    native_engine_available,
+    resolve_engine,
+)
 from datetime import datetime
-import heapq
-from bisect import insort
-from typing import Tuple
+from typing import Any, Callable, List, Optional
+
 
 class PriorityQueue[T]:
-    def __init__(self):
-        self.queue: DoublyLinkedList[Tuple[int, T]] = DoublyLinkedList()
+    def __init__(self, engine: str = "heap", migrate_threshold: Optional[int] = None):
+        """Create an empty priority queue.
+
+        Args:
+            engine (str): the storage engine, "heap" (O(log n) enqueue/dequeue, default),
+                "linked_list" (sorted doubly linked list, O(n) enqueue) or "native"
+                (the Rust burmese_native heap). "native" falls back to "heap" when
+                the extension is not built.
+            migrate_threshold (Optional[int]): once the queue holds this many items,
+                enqueue moves it to the native engine (see migrate_to_rust). None
+                disables it; it is ignored when the extension is not built.
+        """
+        self.engine: str = resolve_engine(engine)
+        self._engine: PriorityQueueEngineInterface[T] = create_engine(self.engine)
+        self.migrate_threshold: Optional[int] = migrate_threshold if native_engine_available() else None
 
     def enqueue(self, item: T, priority: int):
         """Add an item to the queue with a given priority."""
-        # Insert the item in the correct position based on its priority
-        current = self.queue._head
-        while current and current.data[0] <= priority:
-            current = current.next
-        if current:
-            self.queue.insert_before(current, (priority, item))
-        else:
-            self.queue.add_to_end((priority, item)) # will create our first node
+        self._engine.push(item, priority)
+
+        threshold = self.migrate_threshold
+        if threshold is not None and len(self._engine) >= threshold:
+            # migrate once; if the data cannot move (e.g. non-int priorities) stay put
+            self.migrate_threshold = None
+            self.migrate_to_rust()
 
     def dequeue(self) -> T:
         """Remove and return the item with the highest priority (lowest priority number)."""
-        if self.queue.is_empty():
+        if len(self._engine) == 0:
             raise IndexError("Dequeue from an empty priority queue")
-        return self.queue.remove_head().data[1]  # Return the item, not the priority
+        return self._engine.pop()  # Return the item, not the priority
     
     def peek(self) -> T:
         """Return the item with the highest priority without removing it from the queue."""
-        if self.queue.is_empty():
+        if len(self._engine) == 0:
             raise IndexError("Peek from an empty priority queue")
-        return self.queue._head.data[1]  # Return the item, not the priority
+        return self._engine.peek()  # Return the item, not the priority
     
     def is_empty(self) -> bool:
         """Check if the priority queue is empty."""
-        return self.queue.is_empty()
+        return len(self._engine) == 0
     
     def print_queue(self):
         """Print the contents of the queue for debugging purposes."""
         print("Priority Queue Contents:")
-        current = self.queue._head
-        # Also: self.queue.display() is available
-        # but messy since this one handle both print 
-        # but we can do it too
-        for _, node in enumerate(self.queue.traverse()):
-            priority, item = node.data
+        for priority, item in self._engine.entries():
             print(f" - {item} (Priority: {priority})")
 
     def __len__(self):
         """Return the number of items in the priority queue."""
-        # alternatively: return self.queue.size
-        return len(self.queue) # Yes becuase our dll implements this too 
+        return len(self._engine)
     
     def __str__(self):
         """Return a string representation of the priority queue."""
-        return " -> ".join([f"{node.data[1]} (P: {node.data[0]})" for _, node in enumerate(self.queue.traverse())])
+        return " -> ".join([f"{item} (P: {priority})" for priority, item in self._engine.entries()])
     
     def __repr__(self):
         """Detailed representation for developers."""
-        items = [node.data for node in self.queue.traverse()]
+        items = list(self._engine.entries())
         return f"PriorityQueue({items})"
 
     def __iter__(self):
-        """Allow iteration over the items in the priority queue."""
-        for node in self.queue.traverse():
-            yield node.data[1]  # Yield the item, not the priority
+        """Allow iteration over the items in the priority queue (in priority order)."""
+        for _, item in self._engine.entries():
+            yield item  # Yield the item, not the priority
     
     def clear(self):        
         """Remove all items from the priority queue."""
-        self.queue.clear()
+        self._engine.clear()
 
     def change_priority(self, item: T, new_priority: int):
         """Change the priority of an existing item in the queue."""
-        current = self.queue._head
-        while current:
-            priority, current_item = current.data
-            if current_item == item:
-                # Remove the item and reinsert it with the new priority
-                self.queue.remove_by_data(current.data)
-                self.enqueue(item, new_priority)
-                return
-            current = current.next
-        raise ValueError("Item not found in the priority queue")
-
-    def migrate_to_rust(self):
-        """The Burmese Eating Protocol."""
-        try:
-            from burmese_native import PriorityQueue as RustPQ
-            rust_pq = RustPQ()
-            
-            # Batch collect the data
-            # We extract (priority, item) tuples
-            for node in self.queue.traverse():
-                priority, item = node.data
-                rust_pq.push(priority, item)
-                
-            # Swap the engines
-            self.engine = "RUST"
-            self.native_queue = rust_pq
-            
-            # Nuke the old swamp to save memory
-            self.queue.clear() 
+        # Remove the item and reinsert it with the new priority
+        self._engine.remove(item)
+        self._engine.push(item, new_priority)
+
+    def migrate_to_rust(self) -> bool:
+        """The Burmese Eating Protocol: move every item to the native (Rust) engine.
+
+        Items keep their priority order and FIFO order among equal priorities.
+        Every public method keeps working afterwards, it just runs on the new engine.
+
+        Returns:
+            bool: True if the queue now runs on the native engine, False if the
+                extension is not built or the data could not be moved, in which
+                case the queue is left untouched.
+        """
+        if self.engine == "native":
             return True
+
+        try:
+            native_engine = create_engine("native")
         except ImportError:
             print("Burmese Native module not found. Build the crate first!")
             return False
 
+        try:
+            # entries() is in priority order, so the batch keeps FIFO ties
+            native_engine.push_many(self._engine.entries())
+        except TypeError:
+            # e.g. priorities that cannot be compared with each other
+            return False
+
+        # Swap the engines and nuke the old swamp to save memory
+        self._engine.clear()
+        self._engine = native_engine
+        self.engine = "native"
+        return True
+
 class PriorityQueueDatetime:
-    """A simple implementation of a priority queue using a list and datetime for priority.
-    
-    In this implementation, each item is stored as a tuple of (datetime, item), and the queue is sorted based on the datetime to ensure that items with earlier timestamps are processed first.
+    """A priority queue ordered by time: the earliest timestamp is processed first.
+
+    Each item is stored in an engine with its timestamp as the priority, so
+    enqueue and dequeue are O(log n) and equal timestamps keep FIFO order. Timestamps come from the clock unless they are passed explicitly; any
+    clock works as long as its values compare with each other, e.g.
+    datetime.now (default) or time.monotonic (floats, the native engine's fast path).
     """
 
-    def __init__(self):
-        self.queue = []
+    def __init__(self, engine: str = "heap", clock: Callable[[], Any] = datetime.now):
+        """Create an empty queue.
 
-    def enqueue(self, item):
-        """Add an item to the queue with the current datetime as its priority."""
-        # Sort the queue based on datetime to maintain the priority order
-        # Using insort is better than sort after every insertion for efficiency
-        insort(self.queue, (datetime.now(), item), key=lambda x: x[0])  # Sort by datetime
+        Args:
+            engine (str): the storage engine, see PriorityQueue.
+            clock (Callable[[], Any]): returns the current time, used by enqueue
+                and pop_due when they are not given one.
+        """
+        self.queue: PriorityQueueEngineInterface = create_engine(resolve_engine(engine))
+        self.clock: Callable[[], Any] = clock
 
+    def enqueue(self, item, timestamp=None):
+        """Add an item with the given timestamp (the current clock time by default)."""
+        if timestamp is None:
+            timestamp = self.clock()
+        self.queue.push(item, timestamp)
 
     def dequeue(self):
-        """Remove and return the item with the highest priority (earliest datetime)."""
-        if not self.queue:
+        """Remove and return the item with the highest priority (earliest timestamp)."""
+        if len(self.queue) == 0:
             raise IndexError("Dequeue from an empty priority queue")
-        return self.queue.pop(0)[1]  # Return the item, not the datetime
+        return self.queue.pop()
     
     def peek(self):
         """Return the item with the highest priority without removing it from the queue."""
-        if not self.queue:
+        if len(self.queue) == 0:
             raise IndexError("Peek from an empty priority queue")
-        return self.queue[0][1]  # Return the item, not the datetime
+        return self.queue.peek()
+
+    def pop_due(self, now=None) -> List:
+        """Remove and return every item whose timestamp is <= now, earliest first.
+
+        Args:
+            now: the cut-off time (the current clock time by default).
+        """
+        if now is None:
+            now = self.clock()
+
+        queue = self.queue
+        due = []
+        while len(queue) > 0 and queue.peek_priority() <= now:
+            due.append(queue.pop())
+        return due
     
     def is_empty(self):
         """Check if the priority queue is empty."""
@@ -141,42 +179,131 @@ class PriorityQueueDatetime:
     def print_queue(self):
         """Print the contents of the queue for debugging purposes."""
         print("Priority Queue Contents:")
-        for priority, item in self.queue:
+        for priority, item in self.queue.entries():
             print(f" - {item} (Priority: {priority})")
 
+    def __len__(self):
+        return len(self.queue)
+
+
+# Marks an entry that was replaced or removed (a tombstone)
+_REMOVED = object()
+
 
 class DynamicPriorityQueue:
-    def __init__(self):
-        self.queue = []
+    """A priority queue of people whose priority can change while they wait.
+
+    Every person has one live entry [priority, arrival time, name] in the engine,
+    keyed by (priority, arrival time), plus a name -> entry index. Changing or
+    removing a person never searches the heap: the old entry is turned into a
+    tombstone and skipped when it reaches the top. Once tombstones make up more
+    than compaction_threshold of the heap, it is rebuilt from the live entries.
+    """
+
+    def __init__(self, engine: str = "heap", compaction_threshold: float = 0.5):
+        if not 0 < compaction_threshold <= 1:
+            raise ValueError("compaction_threshold must be in (0, 1]")
+
+        self.queue: PriorityQueueEngineInterface = create_engine(resolve_engine(engine))
+        self.entries = {}  # name -> live entry
+        self.stale = 0  # tombstones still in the heap
+        self.compaction_threshold = compaction_threshold
         self.time = 0  # Simulates the ongoing nature of the system
 
     def add_person(self, name, priority):
-        # Add a person to the queue with their initial priority
-        heapq.heappush(self.queue, (priority, self.time, name))
+        """Add a person to the queue with their initial priority.
+
+        Every name has a single entry, so adding a name that is already queued
+        moves that person to the new priority, behind everybody already there;
+        the list-backed queue used to hold both entries.
+        """
+        if name in self.entries:
+            self._invalidate(self.entries.pop(name))
+        self._push([priority, self.time, name])
         self.time += 1  # Increment time to track order of addition
+        self._maybe_compact()
 
     def step_aside(self, name):
         # Simulate stepping aside and rejoining with a lower priority
         print(f"{name} steps aside to help someone!")
-        for i, (_, _, person) in enumerate(self.queue):
-            if person == name:
-                # Reduce priority and update
-                _, time, person = self.queue.pop(i)
-                heapq.heappush(self.queue, (2, time, person))  # Lower priority to 2
-                break
+        if name not in self.entries:
+            return  # nobody by that name is waiting
+        self.reprioritise(name, 2)  # Lower priority to 2
+
+    def reprioritise(self, name, priority):
+        """Change the priority of a person in O(log n).
+
+        The person keeps their arrival time, so they stay ahead of everybody with
+        the same priority who arrived after them.
+        """
+        entry = self._entry(name)
+        self._invalidate(entry)
+        self._push([priority, entry[1], name])
+        self._maybe_compact()
+
+    def remove(self, name):
+        """Remove a person in O(1) (amortised) and return their priority."""
+        entry = self._entry(name)
+        del self.entries[name]
+        self._invalidate(entry)
+        self._maybe_compact()
+        return entry[0]
 
     def process(self):
         # Continuously process the highest-priority person
-        if self.queue:
-            priority, _, person = heapq.heappop(self.queue)
+        while len(self.queue) > 0:
+            priority, _, person = self.queue.pop()
+            if person is _REMOVED:
+                self.stale -= 1
+                continue
+
+            del self.entries[person]
             print(f"{person} with priority {priority} keeps moving forward!")
+            return person
 
     def print_queue(self):
         print("\nCurrent Queue:")
-        for priority, _, name in sorted(self.queue):
-            print(f" - {name} (Priority {priority})")
+        for name in self:
+            print(f" - {name} (Priority {self.entries[name][0]})")
         print()
 
+    def compact(self):
+        """Drop every tombstone by rebuilding the heap from the live entries in O(n)."""
+        live = [((entry[0], entry[1]), entry) for entry in self.entries.values()]
+        self.queue.clear()
+        self.queue.push_many(live)
+        self.stale = 0
+
+    def _push(self, entry):
+        self.entries[entry[2]] = entry
+        self.queue.push(entry, (entry[0], entry[1]))
+
+    def _entry(self, name):
+        try:
+            return self.entries[name]
+        except KeyError:
+            raise ValueError(f"{name!r} is not in the queue") from None
+
+    def _invalidate(self, entry):
+        entry[2] = _REMOVED
+        self.stale += 1
+
+    def _maybe_compact(self):
+        if self.stale and self.stale >= self.compaction_threshold * len(self.queue):
+            self.compact()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def __iter__(self):
+        """Iterate over the names in processing order."""
+        for _, entry in self.queue.entries():
+            if entry[2] is not _REMOVED:
+                yield entry[2]
+
 # Simulating your dream
 def main():
     pq = PriorityQueue()
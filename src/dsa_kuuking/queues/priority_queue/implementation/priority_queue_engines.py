@@ -0,0 +1,276 @@
+"""Storage engines used by the PriorityQueue.
+
+Every engine keeps (priority, item) pairs, pops the lowest priority first and
+keeps FIFO order among equal priorities.
+"""
+from itertools import count
+from typing import Any, Dict, Iterable, Tuple, Type, override
+
+from dsa_kuuking.heaps.min_heap.implementation.min_heap import MinHeap
+from dsa_kuuking.interfaces.priority_queue_engine_interface import PriorityQueueEngineInterface
+from dsa_kuuking.linked_lists.doubly_linked_list.implementation.doubly_linked_list import DoublyLinkedList
+from dsa_kuuking.types.nodes.DoublyLinkedListNode import DoublyLinkedListNode
+
+try:
+    from dsa_kuuking.burmese_native import PriorityQueue as NativePriorityQueue
+except ImportError:
+    # the Rust extension is optional: build it with 'maturin develop --release'
+    NativePriorityQueue = None
+
+
+class LinkedListEngine[T](PriorityQueueEngineInterface):
+    """Sorted doubly linked list: O(n) push, O(1) pop."""
+
+    def __init__(self) -> None:
+        self.queue: DoublyLinkedList[Tuple[Any, T]] = DoublyLinkedList()
+
+    @override
+    def push(self, item: T, priority: Any) -> None:
+        # walk past every entry with a priority <= the new one (FIFO among equals)
+        current = self.queue._head
+        while current and current.data[0] <= priority:
+            current = current.next
+
+        if current is None:
+            self.queue.add_to_end((priority, item))
+            return
+
+        # splice the new node in front of 'current'
+        node = DoublyLinkedListNode((priority, item))
+        node.next = current
+        node.prev = current.prev
+
+        if current.prev is None:
+            self.queue._head = node
+        else:
+            current.prev.next = node
+
+        current.prev = node
+        self.queue.size += 1
+
+    @override
+    def push_many(self, entries: Iterable[Tuple[Any, T]]) -> None:
+        for priority, item in entries:
+            self.push(item, priority)
+
+    @override
+    def pop(self) -> T:
+        node = self.queue.remove_head()
+
+        # the doubly-linked list does not reset these on remove_head
+        if self.queue._head is None:
+            self.queue._tail = None
+        else:
+            self.queue._head.prev = None
+
+        return node.data[1]
+
+    @override
+    def peek(self) -> T:
+        return self.queue._head.data[1]
+
+    @override
+    def peek_priority(self) -> Any:
+        return self.queue._head.data[0]
+
+    @override
+    def remove(self, item: T) -> Any:
+        current = self.queue._head
+        while current and current.data[1] != item:
+            current = current.next
+
+        if current is None:
+            raise ValueError("Item not found in the priority queue")
+
+        # unlink the node
+        if current.prev is None:
+            self.queue._head = current.next
+        else:
+            current.prev.next = current.next
+
+        if current.next is None:
+            self.queue._tail = current.prev
+        else:
+            current.next.prev = current.prev
+
+        current.next = None
+        current.prev = None
+        self.queue.size -= 1
+
+        return current.data[0]
+
+    @override
+    def entries(self) -> Iterable[Tuple[Any, T]]:
+        for node in self.queue.traverse():
+            yield node.data
+
+    @override
+    def clear(self) -> None:
+        self.queue.clear()
+
+    @override
+    def __len__(self) -> int:
+        return len(self.queue)
+
+
+class HeapEngine[T](PriorityQueueEngineInterface):
+    """Binary min-heap of (priority, sequence, item): O(log n) push and pop.
+
+    The sequence number breaks ties between equal priorities, so the items
+    themselves are never compared and equal priorities stay FIFO.
+    """
+
+    def __init__(self) -> None:
+        self._heap: MinHeap[Tuple[Any, int, T]] = MinHeap()
+        self._sequence = count()
+
+    @override
+    def push(self, item: T, priority: Any) -> None:
+        self._heap.insert((priority, next(self._sequence), item))
+
+    @override
+    def push_many(self, entries: Iterable[Tuple[Any, T]]) -> None:
+        # one O(n) bottom-up build instead of n inserts
+        sequence = self._sequence
+        self._heap.heapify((priority, next(sequence), item) for priority, item in entries)
+
+    @override
+    def pop(self) -> T:
+        return self._heap.pop()[2]
+
+    @override
+    def peek(self) -> T:
+        return self._heap.get_peek()[2]
+
+    @override
+    def peek_priority(self) -> Any:
+        return self._heap.get_peek()[0]
+
+    @override
+    def remove(self, item: T) -> Any:
+        heap = self._heap._min_heap
+
+        for index, (priority, _, current_item) in enumerate(heap):
+            if current_item == item:
+                break
+        else:
+            raise ValueError("Item not found in the priority queue")
+
+        # move the last entry into the hole and restore the heap property
+        last = heap.pop()
+        if index < len(heap):
+            heap[index] = last
+            self._heap.heapify_down(index)
+            self._heap.heapify_up(index)
+
+        return priority
+
+    @override
+    def entries(self) -> Iterable[Tuple[Any, T]]:
+        for priority, _, item in sorted(self._heap._min_heap):
+            yield priority, item
+
+    @override
+    def clear(self) -> None:
+        self._heap = MinHeap()
+
+    @override
+    def __len__(self) -> int:
+        return self._heap.size()
+
+
+class NativeEngine[T](PriorityQueueEngineInterface):
+    """The Rust burmese_native.PriorityQueue: O(log n) push and pop.
+
+    Int and float priorities are compared in Rust with the GIL released; any
+    other comparable priority (datetime, tuple, ...) falls back to Python's <.
+    Removing an arbitrary item needs Python equality, so remove() rebuilds the
+    native heap in O(n).
+    """
+
+    def __init__(self) -> None:
+        if NativePriorityQueue is None:
+            raise ImportError("Burmese Native module not found. Build the crate first!")
+
+        self._queue = NativePriorityQueue()
+
+    @override
+    def push(self, item: T, priority: Any) -> None:
+        self._queue.push(priority, item)
+
+    @override
+    def push_many(self, entries: Iterable[Tuple[Any, T]]) -> None:
+        self._queue.push_many(entries)
+
+    @override
+    def pop(self) -> T:
+        return self._queue.pop()
+
+    @override
+    def peek(self) -> T:
+        return self._queue.peek()
+
+    @override
+    def peek_priority(self) -> Any:
+        return self._queue.peek_priority()
+
+    @override
+    def remove(self, item: T) -> Any:
+        entries = self._queue.snapshot()
+
+        for index, (priority, current_item) in enumerate(entries):
+            if current_item == item:
+                break
+        else:
+            raise ValueError("Item not found in the priority queue")
+
+        # re-pushing in priority order keeps equal priorities FIFO
+        del entries[index]
+        self._queue.clear()
+        self._queue.push_many(entries)
+
+        return priority
+
+    @override
+    def entries(self) -> Iterable[Tuple[Any, T]]:
+        return iter(self._queue.snapshot())
+
+    @override
+    def clear(self) -> None:
+        self._queue.clear()
+
+    @override
+    def __len__(self) -> int:
+        return len(self._queue)
+
+
+ENGINES: Dict[str, Type[PriorityQueueEngineInterface]] = {
+    "heap": HeapEngine,
+    "linked_list": LinkedListEngine,
+    "native": NativeEngine,
+}
+
+
+def native_engine_available() -> bool:
+    """Check whether the Rust extension has been built."""
+    return NativePriorityQueue is not None
+
+
+def resolve_engine(name: str) -> str:
+    """Fall back from "native" to "heap" when the extension is not built."""
+    if name == "native" and not native_engine_available():
+        return "heap"
+    return name
+
+
+def create_engine(name: str) -> PriorityQueueEngineInterface:
+    """Instantiate the engine registered under the given name.
+
+    Raises:
+        ValueError: if no engine is registered under the name.
+        ImportError: if the native engine is requested but the extension is not built.
+    """
+    if name not in ENGINES:
+        raise ValueError(f"Unknown priority queue engine: {name!r}. Choose one of {sorted(ENGINES)}.")
+
+    return ENGINES[name]()
@@ -1,31 +1,73 @@
-from typing import override, Iterable
+from typing import Iterable, Optional, override
 
 from dsa_kuuking.types.errors.LinkedListEmptyException import LinkedListEmptyException
-from dsa_kuuking.linked_lists.linked_list.implementation.linked_list import LinkedList
+from dsa_kuuking.types.nodes.LinkedListNode import LinkedListNode as Node
 from dsa_kuuking.types.ResultType import ResultType
+from dsa_kuuking.types.enums.queue_event import QueueEvent
 from dsa_kuuking.interfaces.queue_interface import QueueInterface
+from dsa_kuuking.interfaces.queue_observer_interface import QueueObserverInterface
+from dsa_kuuking.queues.queue.implementation.queue_observers import NULL_OBSERVER
 
 
 class Queue[T](QueueInterface):
-    def __init__(self):
-        self._queue = LinkedList[T]()
+    """FIFO queue on a singly linked list of nodes with head and tail pointers.
+
+    Elements are enqueued after the tail and dequeued from the head, so both are
+    O(1) and a dequeued node is unlinked at once: memory follows the number of
+    queued elements, not the number of operations.
+    """
+
+    def __init__(self, observer: Optional[QueueObserverInterface] = None):
+        self._head: Optional[Node[T]] = None
+        self._tail: Optional[Node[T]] = None
+        self.count: int = 0
+        self.observer: QueueObserverInterface = observer or NULL_OBSERVER
 
     @override
     def enqueue(self, element: T) -> None:
-        result = self._queue.add_to_front(element)
+        node = Node(element)
 
-        if result.is_ok():
-            print("Success! The element has been enqueued!")
+        if self._tail is None:
+            self._head = node
         else:
-            print(f"An error occurred: {result.unwrap_err()}")
+            self._tail.next = node
+        self._tail = node
+
+        self.count += 1
+        self.observer.notify(QueueEvent.ENQUEUED, element, self.count)
+
+    def enqueue_many(self, elements: Iterable[T]) -> None:
+        """Enqueue the elements in order, linking the new chain to the tail once."""
+        elements = list(elements)
+        if not elements:
+            return
+
+        first = last = Node(elements[0])
+        for element in elements[1:]:
+            last.next = last = Node(element)
+
+        if self._tail is None:
+            self._head = first
+        else:
+            self._tail.next = first
+        self._tail = last
+
+        self.count += len(elements)
+        self.observer.notify(QueueEvent.ENQUEUED_MANY, elements, self.count)
 
     @override
     def dequeue(self) -> ResultType[T, str]:
-        result = self.get_peek()
-        if not result.is_ok():
-            raise LinkedListEmptyException(message=result.unwrap_err())
+        node = self._head
+        if node is None:
+            raise LinkedListEmptyException(message="Cannot dequeue from an empty queue!")
 
-        return result
+        self._head = node.next
+        if self._head is None:
+            self._tail = None
+
+        self.count -= 1
+        self.observer.notify(QueueEvent.DEQUEUED, node.data, self.count)
+        return ResultType(value=node.data)
 
     @override
     def peek(self) -> None:
@@ -38,21 +80,44 @@ class Queue[T](QueueInterface):
 
     @override
     def is_empty(self) -> bool:
-        return self._queue.is_empty()
+        return self._head is None
 
     @override
     def traverse(self) -> Iterable[T]:
-        for element in self._queue.traverse():
-            yield element
+        node = self._head
+        while node is not None:
+            yield node.data
+            node = node.next
 
     @override
     def display(self) -> None:
-        self._queue.display()
+        if self.is_empty():
+            print("Queue is empty: Queue()")
+
+        print("->".join(map(str, self.traverse())))
 
     @override
-    def manage_size(self, action: str) -> ResultType[str, str]:
-        raise NotImplemented("This method is not intended")
+    def manage_size(self, action: str = "") -> ResultType[str, str]:
+        """Report the count without changing it: only a linked or unlinked node changes it.
+
+        Returns:
+            ResultType[str, str]: always an error, so a caller cannot count a node that is not there.
+        """
+        match action:
+            case "enqueue" | "dequeue":
+                return ResultType(error=f"The linked queue counts its own nodes: {self.count}")
+            case _:
+                return ResultType(error="Wrong action!")
 
     @override
     def get_peek(self) -> ResultType[T, str]:
-        return ResultType(value=self._queue.get_head().unwrap())
+        if self._head is None:
+            return ResultType(error="Cannot retrieve the peek from empty queue!")
+
+        return ResultType(value=self._head.data)
+
+    def __contains__(self, element: T) -> bool:
+        return element in self.traverse()
+
+    def __len__(self) -> int:
+        return self.count
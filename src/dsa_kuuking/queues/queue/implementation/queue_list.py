@@ -1,25 +1,52 @@
-from typing import Set, override, List, Iterable
+from collections import Counter
+from typing import Optional, override, List, Iterable
 
 from dsa_kuuking.types.ResultType import ResultType
+from dsa_kuuking.types.enums.queue_event import QueueEvent
 from dsa_kuuking.types.errors.empty_queue_exception import EmptyQueueException
 from dsa_kuuking.types.errors.size_management_exception import SizeManagementException
 from dsa_kuuking.interfaces.queue_interface import QueueInterface
+from dsa_kuuking.interfaces.queue_observer_interface import QueueObserverInterface
+from dsa_kuuking.queues.queue.implementation.queue_observers import NULL_OBSERVER
 
 
 class Queue[T](QueueInterface):
-    def __init__(self):
+    """FIFO queue on a ring buffer: amortised O(1) enqueue and dequeue.
+
+    The elements live in a power-of-two sized list between _head and
+    _head + count (mod capacity), so an index wraps with a bit mask. The buffer
+    doubles when it is full and halves when it is down to a quarter.
+
+    Membership (`in`) scans the queue unless track_membership is set, in which
+    case a count per element makes it O(1) at the cost of memory and of
+    requiring hashable elements.
+
+    Every enqueue and dequeue is reported to the observer, a no-op by default;
+    see queue_observers for logging and counting observers.
+    """
+
+    MIN_CAPACITY = 8
+
+    def __init__(self, track_membership: bool = False, observer: Optional[QueueObserverInterface] = None):
         self.count = 0
-        self._hash_set: Set[T] = set()
-        self._queue: List[T] = []
+        self.observer: QueueObserverInterface = observer or NULL_OBSERVER
+        self._counts: Optional[Counter[T]] = Counter() if track_membership else None
+        self._queue: List[Optional[T]] = [None] * self.MIN_CAPACITY
+        self._head = 0
+        self._mask = self.MIN_CAPACITY - 1
 
     @override
     def enqueue(self, element: T) -> None:
+        if self.count == len(self._queue):
+            self._resize(2 * len(self._queue))
+        # store the element before the size changes, so a failed store leaves the queue as it was
+        self._queue[(self._head + self.count) & self._mask] = element
+
         # update the size
         result = self.manage_size(action="enqueue", value=element)
 
         if result.is_ok():
-            print(result.unwrap())
-            self._queue.insert(0, element)
+            self.observer.notify(QueueEvent.ENQUEUED, element, self.count)
         else:
             raise Exception(result.unwrap_err())
 
@@ -33,8 +60,9 @@ class Queue[T](QueueInterface):
             result = self.manage_size(action="dequeue", value=peek_result.unwrap())
 
             if result.is_ok():
-                print(result.unwrap())
-                return ResultType(value=self._queue.pop(0))
+                element = self._pop_head()
+                self.observer.notify(QueueEvent.DEQUEUED, element, self.count)
+                return ResultType(value=element)
             else:
                 # handle the error
                 raise SizeManagementException(result.unwrap_err())
@@ -47,7 +75,7 @@ class Queue[T](QueueInterface):
             return ResultType(error="Cannot retrieve the peek from empty queue!")
 
         # get the peek value
-        peek_value = self._queue[0]
+        peek_value = self._queue[self._head]
 
         if peek_value is None:
             return ResultType(error="Peek value is not defined")
@@ -71,35 +99,74 @@ class Queue[T](QueueInterface):
 
     @override
     def traverse(self) -> Iterable[T]:
-        for element in self._queue:
-            yield element
+        # front to back
+        queue, mask = self._queue, self._mask
+        for offset in range(self.count):
+            yield queue[(self._head + offset) & mask]
 
     @override
     def display(self) -> None:
         if self.is_empty():
             print("Queue is empty: Queue()")
 
-        print(self._queue)
+        print(list(self.traverse()))
 
     @override
     def manage_size(self, action: str = "", value: T = None) -> ResultType[str, str]:
         match action:
             case "enqueue":
+                # track first: an element that cannot be tracked leaves the count as it was
+                if self._counts is not None:
+                    self._counts[value] += 1
                 self.count += 1
-                self._hash_set.add(value)
                 return ResultType(value="Success! The value has been enqueued!")
             case "dequeue":
                 self.count -= 1
-                self._hash_set.remove(value)
+                if self._counts is not None:
+                    self._untrack(value)
                 return ResultType(value="Success! The value has been dequeued!")
             case _:
                 return ResultType(error="Wrong action!")
 
+    def _pop_head(self) -> T:
+        # manage_size has already decremented the count
+        element = self._queue[self._head]
+        self._queue[self._head] = None  # drop the reference
+        self._head = (self._head + 1) & self._mask
+        self._shrink()
+        return element
+
+    def _shrink(self) -> None:
+        capacity = len(self._queue)
+        if capacity > self.MIN_CAPACITY and self.count <= capacity // 4:
+            self._resize(capacity // 2)
+
+    def _resize(self, capacity: int) -> None:
+        # unroll the elements to the front of a new buffer (at most two slices)
+        head, end = self._head, self._head + self.count
+        if end <= len(self._queue):
+            elements = self._queue[head:end]
+        else:
+            elements = self._queue[head:] + self._queue[:end - len(self._queue)]
+        self._queue = elements + [None] * (capacity - len(elements))
+        self._head = 0
+        self._mask = capacity - 1
+
+    def _untrack(self, element: T) -> None:
+        # a duplicate keeps its count until its last copy leaves
+        remaining = self._counts[element] - 1
+        if remaining:
+            self._counts[element] = remaining
+        else:
+            del self._counts[element]
+
     def __contains__(self, element: T) -> bool:
-        return element in self._hash_set
+        if self._counts is not None:
+            return element in self._counts
+        return element in self.traverse()
 
     def __str__(self) -> str:
-        return "->".join(map(str, self._queue))
+        return "->".join(map(str, self.traverse()))
 
     def __len__(self) -> int:
         return self.count
@@ -0,0 +1,45 @@
+import logging
+from collections import Counter
+from typing import Any, Optional, override
+
+from dsa_kuuking.interfaces.queue_observer_interface import QueueObserverInterface
+from dsa_kuuking.types.enums.queue_event import QueueEvent
+
+
+class NullObserver(QueueObserverInterface):
+    """Ignores every event: the default, so that enqueue/dequeue do no I/O."""
+
+    @override
+    def notify(self, event: QueueEvent, element: Any, size: int) -> None:
+        pass
+
+
+class CountingObserver(QueueObserverInterface):
+    """Counts the events per kind, e.g. counts[QueueEvent.ENQUEUED]."""
+
+    def __init__(self):
+        self.counts: Counter[QueueEvent] = Counter()
+
+    @override
+    def notify(self, event: QueueEvent, element: Any, size: int) -> None:
+        self.counts[event] += 1
+
+
+class LoggingObserver(QueueObserverInterface):
+    """Sends every event to a logger (by default "dsa_kuuking.queues" at DEBUG level).
+
+    The record is only formatted when the logger is enabled for the level.
+    """
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.DEBUG):
+        self.logger: logging.Logger = logger or logging.getLogger("dsa_kuuking.queues")
+        self.level: int = level
+
+    @override
+    def notify(self, event: QueueEvent, element: Any, size: int) -> None:
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(self.level, "%s %r (size %d)", event.value, element, size)
+
+
+# shared by every queue created without an observer
+NULL_OBSERVER = NullObserver()
@@ -0,0 +1,224 @@
+import math
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+
+class TimerHandle[T]:
+    """A scheduled item, returned by TimingWheel.schedule and accepted by TimingWheel.cancel."""
+
+    __slots__ = ("item", "time", "deadline", "_slot", "_active")
+
+    def __init__(self, item: T, time: Any, deadline: int):
+        self.item: T = item
+        self.time: Any = time
+        self.deadline: int = deadline  # in ticks
+        # the wheel slot holding the handle, None once it is due
+        self._slot: Optional[Dict['TimerHandle[T]', None]] = None
+        # False once the handle is cancelled or dequeued
+        self._active: bool = True
+
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    def __repr__(self) -> str:
+        return f"TimerHandle({self.item!r}, time={self.time!r}, active={self._active})"
+
+
+class TimingWheel[T]:
+    """A hierarchical timing wheel: a scheduler for timeouts that are mostly cancelled.
+
+    Time is cut into ticks of `resolution`. Level 0 has one slot per tick for the
+    next `slots` ticks, level 1 one slot per `slots` ticks, and so on; timers
+    further out than every level wait in an overflow list. When level 0 wraps,
+    the next level-1 slot is cascaded down, and likewise up the levels.
+
+    - schedule/enqueue and cancel are O(1): a slot is a dict used as an ordered set
+    - advance(now) is amortised O(1) per tick and per timer (a timer is cascaded at most `levels` times)
+
+    Due timers move to a FIFO ready queue that dequeue/peek/pop_due read from.
+    A timer is never due before its time and at most one `resolution` after it.
+    Timers come out tick by tick, but within a tick they are not sorted by time.
+    """
+
+    def __init__(self, resolution: Any = 1.0, slots: int = 256, levels: int = 4, start: Any = 0):
+        """Create an empty wheel.
+
+        Args:
+            resolution: the length of a tick, in the unit of the times used: a
+                number for numeric times, a timedelta for datetimes.
+            slots (int): slots per level, a power of two.
+            levels (int): the number of levels; together they cover slots ** levels ticks.
+            start: the current time (a datetime when resolution is a timedelta).
+        """
+        if not resolution > resolution * 0:
+            raise ValueError("resolution must be positive")
+        if slots < 2 or slots & (slots - 1):
+            raise ValueError("slots must be a power of two")
+        if levels < 1:
+            raise ValueError("levels must be at least 1")
+
+        self.resolution: Any = resolution
+        self.origin: Any = start
+        self.now: Any = start
+        self._bits: int = slots.bit_length() - 1
+        self._mask: int = slots - 1
+        self._levels: int = levels
+        self._wheels: List[List[Dict[TimerHandle[T], None]]] = [
+            [{} for _ in range(slots)] for _ in range(levels)
+        ]
+        self._overflow: Dict[TimerHandle[T], None] = {}
+        self._ready: Deque[TimerHandle[T]] = deque()
+        self._tick: int = 0  # the last tick that was processed
+        self._scheduled: int = 0  # timers in the wheels and the overflow
+        self._ready_cancelled: int = 0  # cancelled handles still in the ready queue
+
+    def schedule(self, item: T, time: Any) -> TimerHandle[T]:
+        """Schedule an item to become due at the given time in O(1) and return its handle."""
+        handle = TimerHandle(item, time, math.ceil((time - self.origin) / self.resolution))
+        self._place(handle)
+        return handle
+
+    def enqueue(self, item: T, time: Any) -> TimerHandle[T]:
+        """Same as schedule."""
+        return self.schedule(item, time)
+
+    def cancel(self, handle: TimerHandle[T]) -> bool:
+        """Cancel a timer in O(1).
+
+        Returns:
+            bool: False if the timer was already cancelled or dequeued.
+        """
+        if not handle._active:
+            return False
+
+        handle._active = False
+        if handle._slot is None:
+            # already due: it is skipped when it reaches the front of the ready queue
+            self._ready_cancelled += 1
+        else:
+            del handle._slot[handle]
+            handle._slot = None
+            self._scheduled -= 1
+
+        return True
+
+    def advance(self, now: Any) -> int:
+        """Move the wheel's time forward and return the number of timers that became due."""
+        if now < self.now:
+            raise ValueError("time cannot go backwards")
+        self.now = now
+
+        target = math.floor((now - self.origin) / self.resolution)
+        ready_before = len(self._ready)
+
+        while self._tick < target:
+            if not self._scheduled:
+                # nothing left to fire, so there is no need to visit the ticks in between
+                self._tick = target
+                break
+
+            self._tick += 1
+            tick = self._tick
+            if not tick & self._mask:
+                self._cascade(tick)
+
+            slot = self._wheels[0][tick & self._mask]
+            if slot:
+                for handle in slot:
+                    handle._slot = None
+                self._ready.extend(slot)
+                self._scheduled -= len(slot)
+                slot.clear()
+
+        return len(self._ready) - ready_before
+
+    def dequeue(self) -> T:
+        """Remove and return the earliest due item."""
+        handle = self._front()
+        self._ready.popleft()
+        handle._active = False
+        return handle.item
+
+    def peek(self) -> T:
+        """Return the earliest due item without removing it."""
+        return self._front().item
+
+    def pop_due(self, now: Any = None) -> List[T]:
+        """Advance to now (if given) and remove and return every due item."""
+        if now is not None:
+            self.advance(now)
+
+        items = []
+        for handle in self._ready:
+            if handle._active:
+                handle._active = False
+                items.append(handle.item)
+
+        self._ready.clear()
+        self._ready_cancelled = 0
+        return items
+
+    def due(self) -> int:
+        """Return the number of due items waiting to be dequeued."""
+        return len(self._ready) - self._ready_cancelled
+
+    def is_empty(self) -> bool:
+        """Check if there are no scheduled or due items."""
+        return len(self) == 0
+
+    def _front(self) -> TimerHandle[T]:
+        ready = self._ready
+        while ready and not ready[0]._active:
+            ready.popleft()
+            self._ready_cancelled -= 1
+
+        if not ready:
+            raise IndexError("No due item in the timing wheel")
+        return ready[0]
+
+    def _place(self, handle: TimerHandle[T]) -> None:
+        delta = handle.deadline - self._tick
+        if delta <= 0:
+            handle._slot = None
+            self._ready.append(handle)
+            return
+
+        slot = self._overflow
+        for level in range(self._levels):
+            shift = self._bits * level
+            if delta >> shift <= self._mask:
+                slot = self._wheels[level][(handle.deadline >> shift) & self._mask]
+                break
+
+        slot[handle] = None
+        handle._slot = slot
+        self._scheduled += 1
+
+    def _cascade(self, tick: int) -> None:
+        # re-place the timers of every higher-level slot that starts at this tick,
+        # top level first; each lands in a lower level (or is due)
+        top = 1
+        while top + 1 < self._levels and not tick & ((1 << (self._bits * (top + 1))) - 1):
+            top += 1
+
+        buckets = []
+        if not tick & ((1 << (self._bits * self._levels)) - 1):
+            buckets.append(self._overflow)
+        for level in range(min(top, self._levels - 1), 0, -1):
+            buckets.append(self._wheels[level][(tick >> (self._bits * level)) & self._mask])
+
+        for bucket in buckets:
+            if not bucket:
+                continue
+            handles = list(bucket)
+            bucket.clear()
+            self._scheduled -= len(handles)
+            for handle in handles:
+                self._place(handle)
+
+    def __len__(self) -> int:
+        return self._scheduled + len(self._ready) - self._ready_cancelled
+
+    def __repr__(self) -> str:
+        return f"TimingWheel(now={self.now!r}, scheduled={self._scheduled}, due={self.due()})"
@@ -1,25 +1,42 @@
-from typing import List, override, Set, Iterable
+from collections import Counter
+from typing import List, Optional, override, Iterable
 
 from dsa_kuuking.interfaces.stack_interface import StackInterface
 
 
 class Stack[T](StackInterface):
-    def __init__(self):
+    def __init__(self, track_membership: bool = False):
+        """Create an empty stack.
+
+        Args:
+            track_membership (bool): keep a count per element so that `in` is
+                O(1) instead of a scan; needs hashable elements and more memory.
+        """
         self.size: int = 0
-        self._hash_set: Set[T] = set()
+        self._counts: Optional[Counter[T]] = Counter() if track_membership else None
         self._stack: List[T] = []
 
     @override
     def append(self, element: T) -> None:
         self._stack.append(element)
-        self._hash_set.add(element)
+        if self._counts is not None:
+            self._counts[element] += 1
         self.size += 1
 
     @override
     def pop(self) -> T:
-        self._hash_set.remove(self._stack[-1])
+        element = self._stack.pop()
         self.size -= 1
-        return self._stack.pop()
+
+        if self._counts is not None:
+            # a duplicate keeps its count until its last copy is popped
+            remaining = self._counts[element] - 1
+            if remaining:
+                self._counts[element] = remaining
+            else:
+                del self._counts[element]
+
+        return element
 
     @override
     def peek(self) -> None:
@@ -40,4 +57,6 @@ class Stack[T](StackInterface):
         return self.size == 0
 
     def __contains__(self, element: T) -> bool:
-        return element in self._hash_set
+        if self._counts is not None:
+            return element in self._counts
+        return element in self._stack
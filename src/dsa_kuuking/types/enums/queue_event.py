@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class QueueEvent(Enum):
+    ENQUEUED = "enqueued"
+    DEQUEUED = "dequeued"
+    # batch operations report one event with the list of elements
+    ENQUEUED_MANY = "enqueued many"
+    DEQUEUED_MANY = "dequeued many"
+    # the oldest elements dropped by an overwriting ring buffer, as a list
+    OVERWRITTEN = "overwritten"
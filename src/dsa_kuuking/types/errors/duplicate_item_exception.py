@@ -0,0 +1,13 @@
+class DuplicateItemException(Exception):
+    """
+    Raised when an item that is already stored is added to an indexed structure again.
+
+    Attributes:
+        item: The item that was added twice.
+        message (str): Explanation of the error.
+    """
+
+    def __init__(self, item, message: str = None) -> None:
+        self.item = item
+        self.message = message or f"Item {item!r} is already in the queue. Use change_priority to update it."
+        super().__init__(self.message)
@@ -0,0 +1,3 @@
+class QueueFullException(Exception):
+    def __init__(self, message: str = "Queue is full!"):
+        super().__init__(message)
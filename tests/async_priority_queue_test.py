@@ -0,0 +1,84 @@
+import asyncio
+import unittest
+
+from dsa_kuuking.queues.priority_queue.implementation.async_priority_queue import AsyncPriorityQueue
+from dsa_kuuking.queues.priority_queue.implementation.priority_queue_engines import native_engine_available
+
+
+class AsyncPriorityQueueTest(unittest.IsolatedAsyncioTestCase):
+    async def test_get_in_priority_order(self):
+        pq = AsyncPriorityQueue()
+        for item, priority in (("Person C", 3), ("Person A", 1), ("Person B", 1)):
+            await pq.put(item, priority)
+
+        self.assertEqual(pq.peek_nowait(), "Person A")
+        self.assertEqual([await pq.get() for _ in range(3)], ["Person A", "Person B", "Person C"])
+        self.assertTrue(pq.empty())
+
+    async def test_default_engine(self):
+        self.assertEqual(AsyncPriorityQueue().engine, "native" if native_engine_available() else "heap")
+        self.assertEqual(AsyncPriorityQueue(engine="linked_list").engine, "linked_list")
+
+    async def test_nowait_errors(self):
+        pq = AsyncPriorityQueue(maxsize=1)
+        with self.assertRaises(asyncio.QueueEmpty):
+            pq.get_nowait()
+
+        pq.put_nowait("Person A", 1)
+        self.assertTrue(pq.full())
+        with self.assertRaises(asyncio.QueueFull):
+            pq.put_nowait("Person B", 2)
+
+    async def test_get_waits_for_put(self):
+        pq = AsyncPriorityQueue()
+        getter = asyncio.create_task(pq.get())
+        await asyncio.sleep(0)
+        self.assertFalse(getter.done())
+
+        await pq.put("Person A", 1)
+        self.assertEqual(await asyncio.wait_for(getter, 1), "Person A")
+
+    async def test_maxsize_backpressure(self):
+        pq = AsyncPriorityQueue(maxsize=2)
+        await pq.put("Person B", 2)
+        await pq.put("Person C", 3)
+
+        putter = asyncio.create_task(pq.put("Person A", 1))
+        await asyncio.sleep(0)
+        self.assertFalse(putter.done())
+        self.assertEqual(pq.qsize(), 2)
+
+        self.assertEqual(await pq.get(), "Person B")
+        await asyncio.wait_for(putter, 1)
+        self.assertEqual([pq.get_nowait() for _ in range(2)], ["Person A", "Person C"])
+
+    async def test_cancelled_getter_passes_the_wake_up_on(self):
+        pq = AsyncPriorityQueue()
+        first = asyncio.create_task(pq.get())
+        second = asyncio.create_task(pq.get())
+        await asyncio.sleep(0)
+
+        pq.put_nowait("Person A", 1)
+        first.cancel()
+        self.assertEqual(await asyncio.wait_for(second, 1), "Person A")
+
+    async def test_producers_and_consumers(self):
+        pq = AsyncPriorityQueue(maxsize=4)
+        consumed = []
+
+        async def producer(offset):
+            for priority in range(offset, offset + 50):
+                await pq.put(priority, priority)
+
+        async def consumer():
+            for _ in range(50):
+                consumed.append(await pq.get())
+
+        await asyncio.gather(*(producer(offset) for offset in (0, 50, 100)), *(consumer() for _ in range(3)))
+
+        self.assertEqual(sorted(consumed), list(range(150)))
+        self.assertTrue(pq.empty())
+
+
+if __name__ == "__main__":
+    unittest.main()
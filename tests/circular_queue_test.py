@@ -0,0 +1,166 @@
+import unittest
+from typing import Any, override
+
+from dsa_kuuking.interfaces.queue_observer_interface import QueueObserverInterface
+from dsa_kuuking.queues.circular_queue.implementation.circular_queue_list import CircularQueue
+from dsa_kuuking.queues.queue.implementation.queue_observers import CountingObserver
+from dsa_kuuking.types.enums.queue_event import QueueEvent
+from dsa_kuuking.types.errors.empty_queue_exception import EmptyQueueException
+from dsa_kuuking.types.errors.queue_full_exception import QueueFullException
+
+
+class RecordingObserver(QueueObserverInterface):
+    def __init__(self):
+        self.events = []
+
+    @override
+    def notify(self, event: QueueEvent, element: Any, size: int) -> None:
+        self.events.append((event, element))
+
+
+class CircularQueueListTest(unittest.TestCase):
+    def test_wraps_around_with_duplicates(self):
+        queue = CircularQueue(maxsize=3)
+        for element in ("a", "b", "a"):
+            queue.enqueue(element)
+
+        self.assertTrue(queue.is_full())
+        self.assertEqual(queue.dequeue().unwrap(), "a")
+        queue.enqueue("c")
+
+        self.assertEqual(list(queue.traverse()), ["b", "a", "c"])
+        self.assertIn("a", queue)
+        self.assertNotIn("d", queue)
+
+    def test_track_membership_counts_duplicates(self):
+        queue = CircularQueue(maxsize=4, track_membership=True)
+        for element in ("a", "a", "b"):
+            queue.enqueue(element)
+
+        queue.dequeue()
+        self.assertIn("a", queue)
+        queue.dequeue()
+        self.assertNotIn("a", queue)
+        self.assertEqual(queue._counts, {"b": 1})
+
+    def test_unhashable_elements_leave_tracked_queue_as_it_was(self):
+        for mode in ("grow", "overwrite"):
+            queue = CircularQueue(maxsize=3, track_membership=True, mode=mode)
+            queue.enqueue_many("abc")
+
+            with self.assertRaises(TypeError):
+                queue.enqueue_many(["d", ["e"]])
+            with self.assertRaises(TypeError):
+                queue.enqueue(["e"])
+            self.assertEqual(list(queue.traverse()), ["a", "b", "c"], mode)
+            self.assertEqual(queue.size, 3, mode)
+            self.assertEqual(queue._counts, {"a": 1, "b": 1, "c": 1}, mode)
+
+    def test_observer(self):
+        observer = CountingObserver()
+        queue = CircularQueue(maxsize=2, observer=observer)
+        queue.enqueue("a")
+        queue.dequeue()
+
+        self.assertEqual(observer.counts, {QueueEvent.ENQUEUED: 1, QueueEvent.DEQUEUED: 1})
+
+    def test_fixed_mode_raises_when_full(self):
+        queue = CircularQueue(maxsize=2)
+        queue.enqueue_many(["a", "b"])
+
+        with self.assertRaises(QueueFullException):
+            queue.enqueue("c")
+        with self.assertRaises(QueueFullException):
+            queue.enqueue_many(["c"])
+        self.assertEqual(list(queue.traverse()), ["a", "b"])
+
+        self.assertEqual(queue.dequeue_many(5), ["a", "b"])
+        with self.assertRaises(EmptyQueueException):
+            queue.dequeue()
+
+    def test_grow_mode_doubles(self):
+        queue = CircularQueue(maxsize=3, mode="grow")
+        for element in range(3):
+            queue.enqueue(element)
+        queue.dequeue()
+
+        # wrap around the buffer before it grows
+        queue.enqueue_many(range(3, 20))
+
+        # 3 -> 6 -> 12 -> 24: the logical size doubles, the buffer is the next power of two
+        self.assertEqual(list(queue.traverse()), list(range(1, 20)))
+        self.assertEqual(queue.size, 24)
+        self.assertEqual(len(queue._queue), 32)
+        self.assertFalse(queue.is_full())
+
+    def test_grow_mode_single_enqueue(self):
+        queue = CircularQueue(maxsize=5, mode="grow")
+        for element in range(6):
+            queue.enqueue(element)
+
+        self.assertEqual(queue.size, 10)
+        self.assertEqual(len(queue._queue), 16)
+        self.assertEqual(list(queue.traverse()), list(range(6)))
+
+    def test_overwrite_mode_drops_the_oldest(self):
+        observer = CountingObserver()
+        queue = CircularQueue(maxsize=3, mode="overwrite", observer=observer, track_membership=True)
+        for element in range(5):
+            queue.enqueue(element)
+
+        self.assertEqual(list(queue.traverse()), [2, 3, 4])
+        self.assertEqual(observer.counts[QueueEvent.OVERWRITTEN], 2)
+        self.assertNotIn(0, queue)
+
+        queue.enqueue_many([5, 6])
+        self.assertEqual(list(queue.traverse()), [4, 5, 6])
+
+        queue.enqueue_many(range(7, 12))
+        self.assertEqual(list(queue.traverse()), [9, 10, 11])
+        self.assertEqual(queue._counts, {9: 1, 10: 1, 11: 1})
+
+    def test_overwrite_mode_reports_every_dropped_element(self):
+        observer = RecordingObserver()
+        queue = CircularQueue(maxsize=3, mode="overwrite", observer=observer)
+
+        # a batch longer than the ring on an empty queue: only its own prefix is dropped
+        queue.enqueue_many(range(5))
+        queue.enqueue_many([5, 6, 7, 8])
+
+        overwritten = [element for event, element in observer.events if event is QueueEvent.OVERWRITTEN]
+        self.assertEqual(overwritten, [[0, 1], [2, 3, 4, 5]])
+        self.assertEqual(list(queue.traverse()), [6, 7, 8])
+
+        # nothing dropped, nothing reported
+        queue.dequeue_many(3)
+        queue.enqueue_many([9, 10, 11])
+        self.assertEqual([event for event, _ in observer.events].count(QueueEvent.OVERWRITTEN), 2)
+
+    def test_batches_across_the_wrap(self):
+        queue = CircularQueue(maxsize=8)
+        expected = []
+        next_element = 0
+
+        for batch in (5, 3, 6, 2, 7, 1):
+            free = queue.size - len(queue)
+            elements = list(range(next_element, next_element + min(batch, free)))
+            next_element += len(elements)
+            queue.enqueue_many(elements)
+            expected.extend(elements)
+
+            dequeued = queue.dequeue_many(batch // 2 + 1)
+            self.assertEqual(dequeued, expected[:len(dequeued)])
+            del expected[:len(dequeued)]
+            self.assertEqual(list(queue.traverse()), expected)
+
+        self.assertEqual(queue._queue.count(None), len(queue._queue) - len(expected))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            CircularQueue(maxsize=0)
+        with self.assertRaises(ValueError):
+            CircularQueue(mode="ring")
+
+
+if __name__ == "__main__":
+    unittest.main()
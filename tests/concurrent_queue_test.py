@@ -0,0 +1,117 @@
+import threading
+import time
+import unittest
+
+from dsa_kuuking.queues.concurrent_queue.implementation.concurrent_queue import MPMCQueue, SPSCQueue
+from dsa_kuuking.types.errors.empty_queue_exception import EmptyQueueException
+from dsa_kuuking.types.errors.queue_full_exception import QueueFullException
+
+
+class SPSCQueueTest(unittest.TestCase):
+    def test_fifo_and_bounds(self):
+        queue = SPSCQueue(maxsize=3)
+        self.assertEqual(queue.maxsize, 4)
+
+        for item in range(4):
+            queue.put_nowait(item)
+        self.assertTrue(queue.full())
+        with self.assertRaises(QueueFullException):
+            queue.put_nowait(4)
+        with self.assertRaises(QueueFullException):
+            queue.put(4, timeout=0.01)
+
+        self.assertEqual([queue.get_nowait() for _ in range(4)], [0, 1, 2, 3])
+        with self.assertRaises(EmptyQueueException):
+            queue.get(timeout=0.01)
+        with self.assertRaises(EmptyQueueException):
+            queue.get(block=False)
+
+    def test_producer_and_consumer_threads(self):
+        queue = SPSCQueue(maxsize=8)
+        received = []
+
+        def consume():
+            for _ in range(20_000):
+                received.append(queue.get(timeout=5))
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        for item in range(20_000):
+            queue.put(item, timeout=5)
+        consumer.join(5)
+
+        self.assertEqual(received, list(range(20_000)))
+        self.assertTrue(queue.empty())
+
+    def test_blocked_put_is_woken_by_one_free_slot(self):
+        queue = SPSCQueue(maxsize=64)
+        for item in range(64):
+            queue.put_nowait(item)
+
+        timer = threading.Timer(0.1, queue.get_nowait)
+        timer.start()
+        start = time.monotonic()
+        queue.put("x", timeout=3)
+        elapsed = time.monotonic() - start
+        timer.join()
+
+        self.assertLess(elapsed, 1)
+        self.assertTrue(queue.full())
+        self.assertEqual(queue.get_nowait(), 1)
+
+
+class MPMCQueueTest(unittest.TestCase):
+    def test_fifo_and_bounds(self):
+        queue = MPMCQueue(maxsize=3)
+        for item in range(3):
+            queue.put(item)
+
+        with self.assertRaises(QueueFullException):
+            queue.put_nowait(3)
+        with self.assertRaises(QueueFullException):
+            queue.put(3, timeout=0.01)
+
+        self.assertEqual([queue.get() for _ in range(3)], [0, 1, 2])
+        with self.assertRaises(EmptyQueueException):
+            queue.get_nowait()
+        with self.assertRaises(EmptyQueueException):
+            queue.get(timeout=0.01)
+
+    def test_blocked_get_is_woken_by_put(self):
+        queue = MPMCQueue(maxsize=1)
+        result = []
+        getter = threading.Thread(target=lambda: result.append(queue.get(timeout=5)))
+        getter.start()
+
+        queue.put("a")
+        getter.join(5)
+        self.assertEqual(result, ["a"])
+
+    def test_many_producers_and_consumers(self):
+        queue = MPMCQueue(maxsize=4)
+        received = []
+        lock = threading.Lock()
+
+        def produce(offset):
+            for item in range(offset, offset + 2_000):
+                queue.put(item, timeout=5)
+
+        def consume():
+            for _ in range(2_000):
+                item = queue.get(timeout=5)
+                with lock:
+                    received.append(item)
+
+        threads = [threading.Thread(target=produce, args=(offset,)) for offset in range(0, 8_000, 2_000)]
+        threads += [threading.Thread(target=consume) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+
+        self.assertEqual(sorted(received), list(range(8_000)))
+        self.assertTrue(queue.empty())
+
+
+if __name__ == "__main__":
+    unittest.main()
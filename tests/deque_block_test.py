@@ -0,0 +1,99 @@
+import random
+import unittest
+from collections import deque
+
+from dsa_kuuking.queues.deque.implementation.deque_block import BLOCK_SIZE, Deque
+from dsa_kuuking.types.errors.empty_queue_exception import EmptyQueueException
+
+
+class DequeBlockTest(unittest.TestCase):
+    def test_both_ends(self):
+        dq = Deque()
+        dq.enqueue_rear(2)
+        dq.enqueue_front(1)
+        dq.enqueue_rear(3)
+
+        self.assertEqual(dq.get_peek_front().unwrap(), 1)
+        self.assertEqual(dq.get_peek_rear().unwrap(), 3)
+        self.assertEqual(dq.dequeue_rear().unwrap(), 3)
+        self.assertEqual(dq.dequeue_front().unwrap(), 1)
+        self.assertEqual(dq.dequeue().unwrap(), 2)
+        self.assertTrue(dq.is_empty())
+
+        with self.assertRaises(EmptyQueueException):
+            dq.dequeue_front()
+        with self.assertRaises(EmptyQueueException):
+            dq.dequeue_rear()
+        self.assertTrue(dq.get_peek_rear().is_err())
+
+    def test_matches_collections_deque(self):
+        rng = random.Random(7)
+        dq, reference = Deque(), deque()
+
+        for step in range(5000):
+            operation = rng.randrange(4) if reference else rng.randrange(2)
+            match operation:
+                case 0:
+                    dq.enqueue_rear(step)
+                    reference.append(step)
+                case 1:
+                    dq.enqueue_front(step)
+                    reference.appendleft(step)
+                case 2:
+                    self.assertEqual(dq.dequeue_rear().unwrap(), reference.pop())
+                case 3:
+                    self.assertEqual(dq.dequeue_front().unwrap(), reference.popleft())
+
+            self.assertEqual(len(dq), len(reference))
+
+        self.assertEqual(list(dq), list(reference))
+
+    def test_indexing_across_blocks(self):
+        elements = list(range(3 * BLOCK_SIZE + 5))
+        dq = Deque(elements)
+        dq.enqueue_front(-1)
+        elements.insert(0, -1)
+
+        for index in range(-len(elements), len(elements)):
+            self.assertEqual(dq[index], elements[index])
+
+        dq[BLOCK_SIZE] = "x"
+        dq[-2] = "y"
+        elements[BLOCK_SIZE] = "x"
+        elements[-2] = "y"
+        self.assertEqual(list(dq), elements)
+
+        with self.assertRaises(IndexError):
+            dq[len(elements)]
+        with self.assertRaises(IndexError):
+            Deque()[0]
+
+    def test_rotate(self):
+        for k in (0, 1, 3, -2, 150, -151, 1000):
+            dq, reference = Deque(range(200)), deque(range(200))
+            dq.rotate(k)
+            reference.rotate(k)
+            self.assertEqual(list(dq), list(reference))
+
+    def test_blocks_are_released(self):
+        dq = Deque(range(10 * BLOCK_SIZE))
+        for _ in range(10 * BLOCK_SIZE - 1):
+            dq.dequeue_front()
+
+        self.assertIs(dq._left, dq._right)
+        dq.dequeue_rear()
+        self.assertEqual(list(dq), [])
+        self.assertNotIn(0, dq)
+
+    def test_manage_size_leaves_the_length_alone(self):
+        dq = Deque(range(32))
+
+        for action in ("enqueue", "dequeue", "resize"):
+            self.assertTrue(dq.manage_size(action).is_err())
+        self.assertEqual(len(dq), 32)
+        self.assertEqual(list(dq), list(range(32)))
+        self.assertEqual(dq.dequeue_rear().unwrap(), 31)
+
+
+if __name__ == "__main__":
+    unittest.main()
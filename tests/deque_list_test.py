@@ -0,0 +1,96 @@
+import random
+import unittest
+from collections import deque
+
+from dsa_kuuking.queues.deque.implementation.deque_list import Deque
+from dsa_kuuking.queues.queue.implementation.queue_list import Queue
+from dsa_kuuking.types.errors.empty_queue_exception import EmptyQueueException
+
+
+class DequeListTest(unittest.TestCase):
+    def test_both_ends(self):
+        dq = Deque()
+        dq.enqueue_rear(2)
+        dq.enqueue_front(1)
+        dq.enqueue_rear(3)
+
+        self.assertEqual(dq.get_peek_front().unwrap(), 1)
+        self.assertEqual(dq.get_peek_rear().unwrap(), 3)
+        self.assertEqual(dq.dequeue_rear().unwrap(), 3)
+        self.assertEqual(dq.dequeue_front().unwrap(), 1)
+        self.assertEqual(dq.dequeue_rear().unwrap(), 2)
+
+        with self.assertRaises(EmptyQueueException):
+            dq.dequeue_rear()
+        with self.assertRaises(EmptyQueueException):
+            dq.dequeue_front()
+
+    def test_matches_collections_deque(self):
+        rng = random.Random(11)
+        dq, reference = Deque(track_membership=True), deque()
+
+        for step in range(5000):
+            operation = rng.randrange(6) if reference else rng.randrange(2)
+            match operation:
+                case 0:
+                    dq.enqueue_rear(step)
+                    reference.append(step)
+                case 1:
+                    dq.enqueue_front(step)
+                    reference.appendleft(step)
+                case 2 | 3:
+                    self.assertEqual(dq.dequeue_rear().unwrap(), reference.pop())
+                case 4 | 5:
+                    self.assertEqual(dq.dequeue_front().unwrap(), reference.popleft())
+
+            self.assertEqual(len(dq), len(reference))
+
+        self.assertEqual(list(dq.traverse()), list(reference))
+        self.assertEqual(set(dq._counts), set(reference))
+
+    def test_extend_resizes_once_per_batch(self):
+        dq = Deque()
+        dq.extend_rear([1, 2])
+        dq.enqueue_front(0)
+
+        resizes = []
+        original = dq._resize
+        dq._resize = lambda capacity: (resizes.append(capacity), original(capacity))
+
+        dq.extend_rear(range(3, 100))
+        dq.extend_front(range(-1, -50, -1))
+
+        self.assertEqual(resizes, [128, 256])
+        self.assertEqual(list(dq.traverse()), list(range(-49, 100)))
+        self.assertEqual(dq.get_peek_front().unwrap(), -49)
+        self.assertEqual(dq.get_peek_rear().unwrap(), 99)
+
+    def test_extend_front_reverses_like_extendleft(self):
+        dq = Deque()
+        dq.enqueue_rear("c")
+        dq.extend_front(["b", "a"])
+
+        self.assertEqual(list(dq.traverse()), ["a", "b", "c"])
+
+    def test_shrinks_from_the_rear(self):
+        dq = Deque()
+        dq.extend_rear(range(100))
+        for _ in range(100):
+            dq.dequeue_rear()
+
+        self.assertEqual(len(dq._queue), Queue.MIN_CAPACITY)
+
+
+    def test_unhashable_batch_leaves_tracked_deque_as_it_was(self):
+        dq = Deque(track_membership=True)
+        dq.extend_rear("ab")
+
+        for extend in (dq.extend_rear, dq.extend_front):
+            with self.assertRaises(TypeError):
+                extend(["c", ["d"]])
+            self.assertEqual(list(dq.traverse()), ["a", "b"])
+            self.assertEqual(dq.count, 2)
+            self.assertEqual(dq._counts, {"a": 1, "b": 1})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import random
+import unittest
+from typing import override
+
+from dsa_kuuking.queues.priority_queue.implementation.indexed_priority_queue import IndexedPriorityQueue
+from dsa_kuuking.types.errors.duplicate_item_exception import DuplicateItemException
+
+
+class IndexedPriorityQueueTest(unittest.TestCase):
+    @override
+    def setUp(self):
+        self.pq = IndexedPriorityQueue[str]()
+        self.pq.enqueue("Person A", 1)
+        self.pq.enqueue("Person B", 2)
+        self.pq.enqueue("Person C", 3)
+
+    def assertHeapConsistent(self):
+        heap = self.pq._heap._min_heap
+        positions = self.pq._heap._positions
+
+        self.assertEqual(len(heap), len(positions))
+        for index, (_, _, item) in enumerate(heap):
+            self.assertEqual(positions[item], index)
+            if index > 0:
+                self.assertLessEqual(heap[(index - 1) // 2], heap[index])
+
+    def test_duplicate_enqueue(self):
+        with self.assertRaises(DuplicateItemException) as context:
+            self.pq.enqueue("Person A", 5)
+
+        self.assertEqual(context.exception.item, "Person A")
+        self.assertEqual(self.pq.priority_of("Person A"), 1)
+
+    def test_contains(self):
+        self.assertTrue(self.pq.contains("Person B"))
+        self.assertIn("Person C", self.pq)
+        self.assertNotIn("Person D", self.pq)
+
+    def test_change_priority(self):
+        self.pq.change_priority("Person C", 0)
+        self.assertEqual(list(self.pq), ["Person C", "Person A", "Person B"])
+
+        self.pq.change_priority("Person C", 2)
+        self.assertEqual(list(self.pq), ["Person A", "Person B", "Person C"])
+        self.assertHeapConsistent()
+
+        with self.assertRaises(ValueError):
+            self.pq.change_priority("Person D", 1)
+
+    def test_remove(self):
+        self.assertEqual(self.pq.remove("Person A"), 1)
+        self.assertNotIn("Person A", self.pq)
+        self.assertEqual(self.pq.peek(), "Person B")
+
+        # the item can be enqueued again once removed
+        self.pq.enqueue("Person A", 4)
+        self.assertEqual(list(self.pq), ["Person B", "Person C", "Person A"])
+
+    def test_random_operations(self):
+        self.pq.clear()
+        expected = {}
+
+        for _ in range(2000):
+            action = random.random()
+            item = random.randint(0, 100)
+
+            if action < 0.4 and item not in expected:
+                priority = random.randint(0, 50)
+                self.pq.enqueue(item, priority)
+                expected[item] = priority
+            elif action < 0.6 and item in expected:
+                priority = random.randint(0, 50)
+                self.pq.change_priority(item, priority)
+                expected[item] = priority
+            elif action < 0.8 and item in expected:
+                self.assertEqual(self.pq.remove(item), expected.pop(item))
+            elif expected:
+                priority = expected.pop(self.pq.dequeue())
+                self.assertLessEqual(priority, min(expected.values(), default=priority))
+
+        self.assertHeapConsistent()
+        self.assertEqual(len(self.pq), len(expected))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import random
+import unittest
+from typing import override
+
+from dsa_kuuking.heaps.max_heap.implementation.max_heap import MaxHeap
+
+
+class MaxHeapTest(unittest.TestCase):
+    @override
+    def setUp(self):
+        self.data = [random.randint(0, 1000) for _ in range(500)]
+        self.heap = MaxHeap[int]()
+        self.heap.insert_many(self.data)
+
+    def test_pop_returns_largest_first(self):
+        self.assertEqual(self.heap.get_peek(), max(self.data))
+        self.assertEqual([self.heap.pop() for _ in self.data], sorted(self.data, reverse=True))
+        self.assertTrue(self.heap.is_empty())
+
+    def test_heap_property(self):
+        elements = self.heap._min_heap
+        for index in range(1, len(elements)):
+            self.assertGreaterEqual(elements[(index - 1) // 2], elements[index])
+
+    def test_get_largest_index(self):
+        heap = MaxHeap[int]().heapify([1, 5, 9])
+
+        self.assertEqual(heap.get_peek(), 9)
+        self.assertEqual(heap._min_heap[heap.get_largest_index(0)], 5)
+
+    def test_key_keeps_equal_keys_fifo(self):
+        heap = MaxHeap[tuple](key=lambda pair: pair[0])
+        heap.insert_many([(1, "a"), (3, "b"), (3, "c"), (2, "d")])
+
+        self.assertEqual([heap.pop()[1] for _ in range(4)], ["b", "c", "d", "a"])
+
+    def test_from_iterable(self):
+        heap = MaxHeap.from_iterable(value for value in self.data)
+
+        self.assertIsInstance(heap, MaxHeap)
+        self.assertEqual(heap.pop(), max(self.data))
+
+
+if __name__ == "__main__":
+    unittest.main()
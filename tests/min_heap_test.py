@@ -0,0 +1,149 @@
+import heapq
+import random
+import unittest
+from typing import override
+
+from dsa_kuuking.heaps.min_heap.implementation.indexed_min_heap import IndexedMinHeap
+from dsa_kuuking.heaps.min_heap.implementation.min_heap import MinHeap
+from dsa_kuuking.types.errors.duplicate_item_exception import DuplicateItemException
+
+
+class MinHeapTest(unittest.TestCase):
+    @override
+    def setUp(self):
+        self.data = [random.randint(0, 1000) for _ in range(500)]
+
+    def assertIsHeap(self, heap: MinHeap):
+        elements = heap._min_heap
+        for index in range(1, len(elements)):
+            self.assertLessEqual(elements[(index - 1) // 2], elements[index])
+
+    def test_insert_and_pop(self):
+        heap = MinHeap[int]()
+        heap.insert_many(self.data)
+
+        self.assertIsHeap(heap)
+        self.assertEqual([heap.pop() for _ in self.data], sorted(self.data))
+        self.assertTrue(heap.is_empty())
+
+    def test_heapify(self):
+        heap = MinHeap[int]().heapify([12, 15, 25, 16, 3])
+        self.assertEqual(heap._min_heap, [3, 12, 25, 16, 15])
+
+        # heapify into a non-empty heap keeps the old elements
+        heap.heapify(self.data)
+        self.assertIsHeap(heap)
+        self.assertEqual(heap.size(), len(self.data) + 5)
+        self.assertEqual([heap.pop() for _ in range(heap.size())], sorted(self.data + [12, 15, 25, 16, 3]))
+
+    def test_from_iterable_consumes_generator(self):
+        heap = MinHeap.from_iterable(value for value in self.data)
+
+        self.assertIsInstance(heap, MinHeap)
+        self.assertIsHeap(heap)
+        self.assertEqual(heap.get_peek(), min(self.data))
+
+    def test_from_iterable_empty(self):
+        self.assertTrue(MinHeap.from_iterable([]).is_empty())
+
+    def test_key_is_computed_once_per_element(self):
+        calls = []
+
+        def key(word: str) -> int:
+            calls.append(word)
+            return len(word)
+
+        words = ["pear", "fig", "banana", "kiwi", "apple", "plum"]
+        heap = MinHeap[str](key=key)
+        heap.insert_many(words)
+
+        # equal keys come out in insertion order
+        self.assertEqual([heap.pop() for _ in words], ["fig", "pear", "kiwi", "plum", "apple", "banana"])
+        self.assertEqual(len(calls), len(words))
+
+    def test_reverse(self):
+        heap = MinHeap.from_iterable(self.data, reverse=True)
+
+        self.assertEqual([heap.pop() for _ in self.data], sorted(self.data, reverse=True))
+
+    def test_key_with_incomparable_elements(self):
+        heap = MinHeap[dict](key=lambda task: task["priority"])
+        heap.heapify([{"priority": 2, "name": "b"}, {"priority": 1, "name": "a"}, {"priority": 2, "name": "c"}])
+
+        self.assertEqual([heap.pop()["name"] for _ in range(3)], ["a", "b", "c"])
+
+    def test_pushpop(self):
+        heap = MinHeap[int]().heapify([5, 7, 9])
+
+        # smaller than the top: returned without touching the heap
+        self.assertEqual(heap.pushpop(1), 1)
+        self.assertEqual(heap._min_heap, [5, 7, 9])
+
+        self.assertEqual(heap.pushpop(8), 5)
+        self.assertEqual([heap.pop() for _ in range(3)], [7, 8, 9])
+
+        # on an empty heap the element comes straight back
+        self.assertEqual(heap.pushpop(4), 4)
+
+    def test_replace(self):
+        heap = MinHeap[int]().heapify([5, 7, 9])
+
+        self.assertEqual(heap.replace(1), 5)
+        self.assertEqual([heap.pop() for _ in range(3)], [1, 7, 9])
+
+        with self.assertRaises(IndexError):
+            heap.replace(1)
+
+    def test_pushpop_and_replace_match_heapq(self):
+        heap = MinHeap[int]().heapify(self.data)
+        reference = list(self.data)
+        heapq.heapify(reference)
+
+        for value in range(0, 2000, 7):
+            self.assertEqual(heap.pushpop(value), heapq.heappushpop(reference, value))
+            self.assertEqual(heap.replace(value), heapq.heapreplace(reference, value))
+
+    def test_nsmallest(self):
+        stream = (value for value in self.data)
+
+        self.assertEqual(MinHeap.nsmallest(10, stream), sorted(self.data)[:10])
+        self.assertEqual(MinHeap.nsmallest(0, self.data), [])
+        self.assertEqual(MinHeap.nsmallest(1000, self.data), sorted(self.data))
+
+    def test_nsmallest_with_key_is_stable(self):
+        words = ["pear", "fig", "banana", "kiwi", "apple", "plum", "date"]
+
+        self.assertEqual(MinHeap.nsmallest(4, words, key=len), sorted(words, key=len)[:4])
+
+    def test_merge(self):
+        runs = [sorted(random.sample(range(1000), 50)) for _ in range(5)]
+        merged = MinHeap.merge(*(iter(run) for run in runs))
+
+        self.assertEqual(next(merged), min(run[0] for run in runs))
+        self.assertEqual(list(MinHeap.merge(*runs)), sorted(value for run in runs for value in run))
+        self.assertEqual(list(MinHeap.merge()), [])
+
+    def test_merge_with_key_prefers_earlier_runs(self):
+        first = [(1, "a"), (3, "a")]
+        second = [(1, "b"), (2, "b")]
+
+        self.assertEqual(list(MinHeap.merge(first, second, key=lambda pair: pair[0])),
+                         [(1, "a"), (1, "b"), (2, "b"), (3, "a")])
+
+
+
+class IndexedMinHeapTest(unittest.TestCase):
+    def test_heapify_with_a_duplicate_changes_nothing(self):
+        heap = IndexedMinHeap().heapify([5, 4, 3])
+
+        for batch in ([2, 9, 2], [1, 4]):
+            with self.assertRaises(DuplicateItemException):
+                heap.heapify(batch)
+            self.assertEqual(len(heap), 3)
+            self.assertNotIn(2, heap)
+
+        heap.heapify([2, 9])
+        self.assertEqual([heap.pop() for _ in range(5)], [2, 3, 4, 5, 9])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import random
+import unittest
+
+from dsa_kuuking.queues.circular_queue.implementation.circular_queue_list import MODES, CircularQueue
+from dsa_kuuking.queues.deque.implementation.deque_block import Deque
+from dsa_kuuking.types.ResultType import ResultType
+from dsa_kuuking.types.errors.empty_queue_exception import EmptyQueueException
+from dsa_kuuking.types.errors.queue_full_exception import QueueFullException
+
+try:
+    from dsa_kuuking.burmese_native import Deque as NativeDeque, RingBuffer
+except ImportError:
+    NativeDeque = RingBuffer = None
+
+
+@unittest.skipUnless(NativeDeque is not None, "the native extension is not built")
+class NativeDequeTest(unittest.TestCase):
+    def test_results_and_errors(self):
+        dq = NativeDeque([2])
+        dq.enqueue_front(1)
+        dq.enqueue(3)
+
+        result = dq.get_peek_rear()
+        self.assertIsInstance(result, ResultType)
+        self.assertEqual(result.unwrap(), 3)
+        self.assertEqual(dq.dequeue_rear().unwrap(), 3)
+        self.assertEqual(dq.dequeue().unwrap(), 1)
+        self.assertEqual(dq.dequeue_front().unwrap(), 2)
+
+        self.assertTrue(dq.get_peek().is_err())
+        with self.assertRaises(EmptyQueueException):
+            dq.dequeue_front()
+        with self.assertRaises(EmptyQueueException):
+            dq.dequeue_rear()
+
+    def test_matches_python_deque(self):
+        rng = random.Random(11)
+        native, python = NativeDeque(), Deque()
+
+        for i in range(5_000):
+            op = rng.randrange(6)
+            if op == 0:
+                native.enqueue_front(i)
+                python.enqueue_front(i)
+            elif op in (1, 2):
+                native.enqueue_rear(i)
+                python.enqueue_rear(i)
+            elif op == 3 and python:
+                self.assertEqual(native.dequeue_front().unwrap(), python.dequeue_front().unwrap())
+            elif op == 4 and python:
+                self.assertEqual(native.dequeue_rear().unwrap(), python.dequeue_rear().unwrap())
+            elif op == 5:
+                k = rng.randrange(-10, 10)
+                native.rotate(k)
+                python.rotate(k)
+
+        self.assertEqual(list(native), list(python))
+        self.assertEqual(str(native), str(python))
+        self.assertEqual(native[-1], python[-1])
+
+    def test_batches(self):
+        dq = NativeDeque()
+        dq.extend(range(5))
+        dq.extend_front("ab")
+
+        self.assertEqual(dq.traverse(), ["b", "a", 0, 1, 2, 3, 4])
+        self.assertEqual(dq.dequeue_many(3), ["b", "a", 0])
+        self.assertEqual(dq.drain(), [1, 2, 3, 4])
+        self.assertEqual(dq.dequeue_many(3), [])
+        self.assertFalse(dq)
+
+
+@unittest.skipUnless(RingBuffer is not None, "the native extension is not built")
+class NativeRingBufferTest(unittest.TestCase):
+    def test_modes_match_circular_queue(self):
+        for mode in MODES:
+            native, python = RingBuffer(maxsize=5, mode=mode), CircularQueue(maxsize=5, mode=mode)
+            for batch in ([1, 2, 3], [4, 5, 6, 7], [8], list(range(9, 21))):
+                for queue in (native, python):
+                    try:
+                        queue.enqueue_many(batch)
+                    except QueueFullException:
+                        pass
+
+            self.assertEqual(list(native), list(python.traverse()), mode)
+            self.assertEqual(native.size, python.size, mode)
+            self.assertEqual(native.mode, mode)
+
+    def test_fixed_mode_raises(self):
+        ring = RingBuffer(maxsize=2)
+        ring.enqueue(1)
+        ring.enqueue(2)
+
+        self.assertTrue(ring.is_full())
+        with self.assertRaises(QueueFullException):
+            ring.enqueue(3)
+        with self.assertRaises(QueueFullException):
+            ring.enqueue_many([3, 4])
+
+        self.assertEqual(ring.dequeue().unwrap(), 1)
+        self.assertEqual(ring.drain(), [2])
+        with self.assertRaises(EmptyQueueException):
+            ring.dequeue()
+        self.assertTrue(ring.get_peek().is_err())
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            RingBuffer(maxsize=0)
+        with self.assertRaises(ValueError):
+            RingBuffer(mode="circular")
+
+
+if __name__ == "__main__":
+    unittest.main()
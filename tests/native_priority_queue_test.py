@@ -0,0 +1,141 @@
+import math
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta
+from typing import override
+
+from dsa_kuuking.queues.priority_queue.implementation.priority_queue_engines import native_engine_available
+
+if native_engine_available():
+    from dsa_kuuking.burmese_native import PriorityQueue as NativePriorityQueue, QueueClosed
+
+
+@unittest.skipUnless(native_engine_available(), "the native extension is not built")
+class NativePriorityQueueTest(unittest.TestCase):
+    @override
+    def setUp(self):
+        self.pq = NativePriorityQueue()
+
+    def test_non_blocking_pop_on_empty(self):
+        self.assertIsNone(self.pq.pop())
+
+    def test_blocking_pop_times_out(self):
+        start = time.perf_counter()
+        self.assertIsNone(self.pq.pop(block=True, timeout=0.05))
+        self.assertGreaterEqual(time.perf_counter() - start, 0.04)
+
+        with self.assertRaises(ValueError):
+            self.pq.pop(block=True, timeout=-1)
+
+    def test_blocking_pop_wakes_on_push(self):
+        timer = threading.Timer(0.05, self.pq.push, args=(1, "Person A"))
+        timer.start()
+
+        self.assertEqual(self.pq.pop(block=True, timeout=5), "Person A")
+        timer.join()
+        self.assertEqual(self.pq.stats()["blocked_pops"], 1)
+
+    def test_close_wakes_waiters_and_drains(self):
+        self.pq.push(1, "Person A")
+        results = []
+        consumers = [threading.Thread(target=lambda: results.append(self.pq.pop(block=True))) for _ in range(3)]
+        for consumer in consumers:
+            consumer.start()
+
+        time.sleep(0.05)
+        self.pq.close()
+        for consumer in consumers:
+            consumer.join(timeout=5)
+
+        self.assertTrue(self.pq.closed)
+        self.assertEqual(sorted(results, key=str), ["Person A", None, None])
+        with self.assertRaises(QueueClosed):
+            self.pq.push(2, "Person B")
+
+    def test_producers_and_consumers(self):
+        per_producer = 2_000
+        popped = []
+
+        def producer(offset):
+            self.pq.push_many((priority, priority) for priority in range(offset, offset + per_producer))
+
+        def consumer():
+            while (item := self.pq.pop(block=True)) is not None:
+                popped.append(item)
+
+        producers = [threading.Thread(target=producer, args=(index * per_producer,)) for index in range(4)]
+        consumers = [threading.Thread(target=consumer) for _ in range(4)]
+        for thread in consumers + producers:
+            thread.start()
+        for thread in producers:
+            thread.join()
+        self.pq.close()
+        for thread in consumers:
+            thread.join()
+
+        self.assertEqual(sorted(popped), list(range(4 * per_producer)))
+        stats = self.pq.stats()
+        self.assertEqual((stats["pushes"], stats["pops"], stats["depth"]), (4 * per_producer, 4 * per_producer, 0))
+
+
+
+@unittest.skipUnless(native_engine_available(), "the native extension is not built")
+class NativeGenericPriorityTest(unittest.TestCase):
+    """Drive the Rust queue directly: the numeric fast path and the Python-comparison store."""
+
+    def assert_pops_in_order(self, priorities):
+        pq = NativePriorityQueue()
+        for index, priority in enumerate(priorities):
+            pq.push(priority, index)
+
+        # sorted() is stable, so equal priorities come out in push order
+        expected = [index for index, _ in sorted(enumerate(priorities), key=lambda pair: pair[1])]
+        self.assertEqual([priority for priority, _ in pq.snapshot()], sorted(priorities))
+        self.assertEqual([pq.pop() for _ in priorities], expected)
+        self.assertIsNone(pq.pop())
+
+    def test_ints_and_floats_compare_exactly(self):
+        # 2**53 + 1 is not representable as a float, so a lossy comparison would tie them
+        self.assert_pops_in_order([2**53 + 1, float(2**53), 1.5, 1, -0.0, 0, True, -(2**63)])
+
+    def test_nan_sorts_last(self):
+        pq = NativePriorityQueue()
+        pq.push(math.nan, "nan")
+        pq.push(math.inf, "inf")
+        pq.push(-5, "int")
+
+        self.assertEqual(pq.drain(), ["int", "inf", "nan"])
+
+    def test_python_comparisons(self):
+        start = datetime(2026, 1, 1)
+        self.assert_pops_in_order([start + timedelta(seconds=offset) for offset in (3, 1, 2, 1)])
+        self.assert_pops_in_order([(1, 2.0), (0, 5.0), (1, 1.0), (0, 5.0)])
+        # ints beyond 64 bits leave the fast path
+        self.assert_pops_in_order([10**30, 3, -(10**30), 2.5, 3])
+
+    def test_switching_stores(self):
+        pq = NativePriorityQueue()
+        pq.push_many([(3, "c"), (1, "a")])
+        # a big int moves the queued numbers into the Python-comparison store
+        pq.push(2**70, "z")
+        pq.push(2, "b")
+        self.assertEqual(pq.pop_many(2), ["a", "b"])
+        self.assertEqual(pq.drain(), ["c", "z"])
+
+        # empty again: datetimes can follow the numbers
+        pq.push(datetime(2026, 1, 2), "later")
+        pq.push(datetime(2026, 1, 1), "sooner")
+        self.assertEqual(pq.peek(), "sooner")
+        self.assertEqual(pq.drain(), ["sooner", "later"])
+
+    def test_incomparable_priorities(self):
+        pq = NativePriorityQueue()
+        pq.push(datetime(2026, 1, 1), "Person A")
+
+        with self.assertRaises(TypeError):
+            pq.push_many([(1, "Person B"), (2, "Person C")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,265 @@
+import random
+import unittest
+from datetime import datetime, timedelta
+from typing import override
+
+from dsa_kuuking.queues.priority_queue.implementation.priority_queue import (
+    DynamicPriorityQueue,
+    PriorityQueue,
+    PriorityQueueDatetime,
+)
+from dsa_kuuking.queues.priority_queue.implementation.priority_queue_engines import (
+    create_engine,
+    native_engine_available,
+)
+
+
+class PriorityQueueTest(unittest.TestCase):
+    @override
+    def setUp(self):
+        self.engines = ["heap", "linked_list"]
+        if native_engine_available():
+            self.engines.append("native")
+
+    def test_default_engine_is_heap(self):
+        self.assertEqual(PriorityQueue().engine, "heap")
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            PriorityQueue(engine="swamp")
+
+    def test_dequeue_in_priority_order(self):
+        priorities = [random.randint(0, 20) for _ in range(200)]
+
+        for engine in self.engines:
+            pq = PriorityQueue(engine=engine)
+            for index, priority in enumerate(priorities):
+                pq.enqueue(index, priority)
+
+            # sorted() is stable, so equal priorities must come out FIFO
+            expected = [index for index, _ in sorted(enumerate(priorities), key=lambda pair: pair[1])]
+
+            self.assertEqual(len(pq), len(priorities))
+            self.assertEqual(list(pq), expected, f"Iteration order of the {engine} engine")
+            self.assertEqual([pq.dequeue() for _ in priorities], expected, f"Dequeue order of the {engine} engine")
+            self.assertTrue(pq.is_empty())
+
+    def test_peek_and_empty_errors(self):
+        for engine in self.engines:
+            pq = PriorityQueue(engine=engine)
+
+            with self.assertRaises(IndexError):
+                pq.peek()
+            with self.assertRaises(IndexError):
+                pq.dequeue()
+
+            pq.enqueue("Person B", 2)
+            pq.enqueue("Person A", 1)
+            self.assertEqual(pq.peek(), "Person A")
+            self.assertEqual(len(pq), 2)
+
+    def test_clear(self):
+        for engine in self.engines:
+            pq = PriorityQueue(engine=engine)
+            pq.enqueue("Person A", 1)
+            pq.clear()
+
+            self.assertTrue(pq.is_empty())
+            self.assertEqual(list(pq), [])
+
+    def test_change_priority(self):
+        for engine in self.engines:
+            pq = PriorityQueue(engine=engine)
+            pq.enqueue("Person A", 1)
+            pq.enqueue("Person B", 2)
+            pq.enqueue("Person C", 3)
+
+            pq.change_priority("Person C", 0)
+            self.assertEqual(list(pq), ["Person C", "Person A", "Person B"])
+
+            with self.assertRaises(ValueError):
+                pq.change_priority("Person D", 1)
+
+    def test_push_many(self):
+        for engine_name in self.engines:
+            engine = create_engine(engine_name)
+            engine.push(0, 5)
+            engine.push_many([(3, 1), (5, 2), (1, 3), (3, 4)])
+
+            self.assertEqual(list(engine.entries()), [(1, 3), (3, 1), (3, 4), (5, 0), (5, 2)])
+            self.assertEqual((engine.peek_priority(), engine.peek()), (1, 3))
+
+    @unittest.skipIf(native_engine_available(), "the native extension is built")
+    def test_native_falls_back_to_heap(self):
+        pq = PriorityQueue(engine="native", migrate_threshold=2)
+        pq.enqueue("Person A", 1)
+        pq.enqueue("Person B", 2)
+
+        self.assertEqual(pq.engine, "heap")
+        self.assertIsNone(pq.migrate_threshold)
+        self.assertFalse(pq.migrate_to_rust())
+        self.assertEqual(list(pq), ["Person A", "Person B"])
+
+        with self.assertRaises(ImportError):
+            create_engine("native")
+
+    @unittest.skipUnless(native_engine_available(), "the native extension is not built")
+    def test_migrate_at_threshold(self):
+        pq = PriorityQueue(migrate_threshold=3)
+        pq.enqueue("Person B", 2)
+        pq.enqueue("Person A", 1)
+        self.assertEqual(pq.engine, "heap")
+
+        pq.enqueue("Person C", 1)
+        self.assertEqual(pq.engine, "native")
+
+        pq.enqueue("Person D", 0)
+        self.assertEqual(len(pq), 4)
+        self.assertEqual(pq.peek(), "Person D")
+        self.assertEqual(list(pq), ["Person D", "Person A", "Person C", "Person B"])
+        self.assertEqual([pq.dequeue() for _ in range(4)], ["Person D", "Person A", "Person C", "Person B"])
+        self.assertTrue(pq.is_empty())
+
+    def test_generic_priorities(self):
+        start = datetime(2026, 1, 1)
+        cases = [
+            [2.5, -1, 2.5, 0.5, 10**30, 3],
+            [(1, 2.0), (0, 5.0), (1, 1.0), (0, 5.0)],
+            [start + timedelta(seconds=offset) for offset in (3, 1, 2, 1)],
+        ]
+
+        for engine in self.engines:
+            for priorities in cases:
+                pq = PriorityQueue(engine=engine)
+                for index, priority in enumerate(priorities):
+                    pq.enqueue(index, priority)
+
+                expected = [index for index, _ in sorted(enumerate(priorities), key=lambda pair: pair[1])]
+                self.assertEqual(list(pq), expected, f"Iteration order of the {engine} engine")
+                self.assertEqual([pq.dequeue() for _ in priorities], expected, f"Dequeue order of the {engine} engine")
+
+    @unittest.skipUnless(native_engine_available(), "the native extension is not built")
+    def test_migrate_keeps_float_priorities(self):
+        pq = PriorityQueue()
+        pq.enqueue("Person B", 1.5)
+        pq.enqueue("Person A", 1)
+
+        self.assertTrue(pq.migrate_to_rust())
+        self.assertEqual(pq.engine, "native")
+        self.assertEqual(list(pq), ["Person A", "Person B"])
+
+    def test_datetime_queue_is_fifo(self):
+        for engine in self.engines:
+            pq = PriorityQueueDatetime(engine=engine)
+            for person in ("Person A", "Person B", "Person C"):
+                pq.enqueue(person)
+
+            self.assertEqual(pq.peek(), "Person A")
+            self.assertEqual([pq.dequeue() for _ in range(3)], ["Person A", "Person B", "Person C"])
+            self.assertTrue(pq.is_empty())
+
+            with self.assertRaises(IndexError):
+                pq.dequeue()
+
+    def test_datetime_queue_explicit_timestamps_and_pop_due(self):
+        start = datetime(2026, 1, 1)
+        for engine in self.engines:
+            pq = PriorityQueueDatetime(engine=engine)
+            for offset, item in ((5, "Event C"), (1, "Event A"), (3, "Event B"), (1, "Event A2")):
+                pq.enqueue(item, start + timedelta(seconds=offset))
+
+            # the timestamp is the priority, the item is stored as it is
+            self.assertEqual(next(iter(pq.queue.entries())), (start + timedelta(seconds=1), "Event A"))
+            self.assertEqual(pq.pop_due(start), [])
+            self.assertEqual(pq.pop_due(start + timedelta(seconds=3)), ["Event A", "Event A2", "Event B"])
+            self.assertEqual(len(pq), 1)
+            self.assertEqual(pq.pop_due(start + timedelta(days=1)), ["Event C"])
+            self.assertEqual(pq.pop_due(start + timedelta(days=1)), [])
+
+    def test_datetime_queue_clock(self):
+        now = [10.0]
+        pq = PriorityQueueDatetime(clock=lambda: now[0])
+        pq.enqueue("Event B")
+        now[0] = 5.0
+        pq.enqueue("Event A")
+        pq.enqueue("Event C", 20.0)
+
+        self.assertEqual(pq.peek(), "Event A")
+        now[0] = 15.0
+        self.assertEqual(pq.pop_due(), ["Event A", "Event B"])
+        self.assertEqual(pq.dequeue(), "Event C")
+
+    def test_dynamic_queue_step_aside(self):
+        for engine in self.engines:
+            pq = DynamicPriorityQueue(engine=engine)
+            pq.add_person("Person A", 1)
+            pq.add_person("Person B", 1)
+            pq.add_person("Person C", 2)
+
+            pq.step_aside("Person A")
+
+            # Person A keeps their arrival time, so they stay ahead of Person C
+            self.assertEqual(list(pq), ["Person B", "Person A", "Person C"])
+            self.assertEqual(pq.process(), "Person B")
+            self.assertEqual(len(pq), 2)
+
+    def test_dynamic_queue_step_aside_unknown_name(self):
+        pq = DynamicPriorityQueue()
+        pq.add_person("Person A", 1)
+
+        # like the list-backed queue, stepping aside is a no-op for somebody who is not queued
+        pq.step_aside("Person B")
+        self.assertEqual(list(pq), ["Person A"])
+        self.assertEqual(pq.stale, 0)
+
+    def test_dynamic_queue_add_queued_name_moves_them(self):
+        for engine in self.engines:
+            pq = DynamicPriorityQueue(engine=engine)
+            pq.add_person("Person A", 1)
+            pq.add_person("Person B", 3)
+            pq.add_person("Person A", 3)
+
+            # one entry per name: Person A is moved behind Person B, not queued twice
+            self.assertEqual(len(pq), 2)
+            self.assertEqual(list(pq), ["Person B", "Person A"])
+            self.assertEqual([pq.process() for _ in range(3)], ["Person B", "Person A", None])
+
+    def test_dynamic_queue_reprioritise_and_remove(self):
+        for engine in self.engines:
+            pq = DynamicPriorityQueue(engine=engine, compaction_threshold=0.5)
+            for index, name in enumerate(("Person A", "Person B", "Person C", "Person D")):
+                pq.add_person(name, index)
+
+            pq.reprioritise("Person D", -1)
+            self.assertEqual(pq.remove("Person B"), 1)
+            self.assertNotIn("Person B", pq)
+
+            with self.assertRaises(ValueError):
+                pq.remove("Person B")
+            with self.assertRaises(ValueError):
+                pq.reprioritise("Person E", 0)
+
+            self.assertEqual(list(pq), ["Person D", "Person A", "Person C"])
+            self.assertEqual([pq.process() for _ in range(4)], ["Person D", "Person A", "Person C", None])
+            self.assertEqual(len(pq), 0)
+
+    def test_dynamic_queue_compaction(self):
+        pq = DynamicPriorityQueue(compaction_threshold=0.25)
+        for index in range(100):
+            pq.add_person(index, index)
+
+        for round_ in range(10):
+            for index in range(100):
+                pq.reprioritise(index, round_ * 100 + index)
+
+            # tombstones never make up more than the threshold of the heap
+            self.assertLess(pq.stale, 0.25 * len(pq.queue))
+
+        self.assertEqual(list(pq), list(range(100)))
+
+        with self.assertRaises(ValueError):
+            DynamicPriorityQueue(compaction_threshold=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from dsa_kuuking.queues.deque.implementation.deque_linked_list import Deque
+from dsa_kuuking.queues.queue.implementation.queue_linked_list import Queue
+from dsa_kuuking.queues.queue.implementation.queue_observers import CountingObserver
+from dsa_kuuking.types.enums.queue_event import QueueEvent
+from dsa_kuuking.types.errors.LinkedListEmptyException import LinkedListEmptyException
+
+
+class QueueLinkedListTest(unittest.TestCase):
+    def test_fifo(self):
+        queue = Queue()
+        for element in range(3):
+            queue.enqueue(element)
+
+        self.assertEqual(queue.get_peek().unwrap(), 0)
+        self.assertEqual([queue.dequeue().unwrap() for _ in range(3)], [0, 1, 2])
+        self.assertTrue(queue.is_empty())
+        self.assertIsNone(queue._tail)
+
+        with self.assertRaises(LinkedListEmptyException):
+            queue.dequeue()
+        self.assertTrue(queue.get_peek().is_err())
+
+    def test_dequeue_removes(self):
+        queue = Queue()
+        queue.enqueue("a")
+        queue.enqueue("b")
+        queue.dequeue()
+
+        self.assertEqual(list(queue.traverse()), ["b"])
+        self.assertEqual(len(queue), 1)
+        self.assertNotIn("a", queue)
+
+    def test_enqueue_many(self):
+        queue = Queue()
+        queue.enqueue_many([])
+        queue.enqueue(0)
+        queue.enqueue_many(range(1, 5))
+        queue.enqueue(5)
+
+        self.assertEqual(list(queue.traverse()), [0, 1, 2, 3, 4, 5])
+        self.assertEqual(len(queue), 6)
+        self.assertEqual(queue._tail.data, 5)
+
+        empty = Queue()
+        empty.enqueue_many("ab")
+        self.assertEqual([empty.dequeue().unwrap(), empty.dequeue().unwrap()], ["a", "b"])
+
+    def test_manage_size_leaves_the_count_alone(self):
+        queue = Queue()
+
+        for action in ("enqueue", "dequeue", "resize"):
+            self.assertTrue(queue.manage_size(action).is_err())
+        self.assertEqual(len(queue), 0)
+        self.assertTrue(queue.is_empty())
+
+
+    def test_linked_deque_is_quiet(self):
+        observer = CountingObserver()
+        dq = Deque(observer=observer)
+
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            dq.enqueue_front(1)
+            dq.enqueue_rear(2)
+            self.assertEqual(dq.dequeue_front().unwrap().data, 1)
+
+        self.assertEqual(stdout.getvalue(), "")
+        self.assertEqual(observer.counts, {QueueEvent.ENQUEUED: 2, QueueEvent.DEQUEUED: 1})
+
+if __name__ == "__main__":
+    unittest.main()
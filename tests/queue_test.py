@@ -0,0 +1,122 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+from typing import override
+
+from dsa_kuuking.queues.queue.implementation.queue_list import Queue
+from dsa_kuuking.queues.queue.implementation.queue_observers import CountingObserver, LoggingObserver
+from dsa_kuuking.types.enums.queue_event import QueueEvent
+from dsa_kuuking.types.errors.empty_queue_exception import EmptyQueueException
+
+
+class QueueListTest(unittest.TestCase):
+    @override
+    def setUp(self):
+        self.queue = Queue()
+
+    def test_fifo(self):
+        for element in range(5):
+            self.queue.enqueue(element)
+
+        self.assertEqual(self.queue.get_peek().unwrap(), 0)
+        self.assertEqual([self.queue.dequeue().unwrap() for _ in range(5)], [0, 1, 2, 3, 4])
+        self.assertTrue(self.queue.is_empty())
+
+        with self.assertRaises(EmptyQueueException):
+            self.queue.dequeue()
+        self.assertTrue(self.queue.get_peek().is_err())
+
+    def test_wraps_grows_and_shrinks(self):
+        expected = []
+        next_element = 0
+
+        # interleave so that the head walks around the buffer while it resizes
+        for round_ in range(6):
+            for _ in range(40 if round_ % 2 == 0 else 5):
+                self.queue.enqueue(next_element)
+                expected.append(next_element)
+                next_element += 1
+            for _ in range(30 if round_ % 2 == 0 else 3):
+                self.assertEqual(self.queue.dequeue().unwrap(), expected.pop(0))
+
+            self.assertEqual(list(self.queue.traverse()), expected)
+            self.assertEqual(len(self.queue), len(expected))
+
+        capacity = len(self.queue._queue)
+        while expected:
+            self.assertEqual(self.queue.dequeue().unwrap(), expected.pop(0))
+
+        self.assertLess(len(self.queue._queue), capacity)
+        self.assertEqual(len(self.queue._queue), Queue.MIN_CAPACITY)
+
+    def test_contains_and_str(self):
+        for element in ("a", "b", "c"):
+            self.queue.enqueue(element)
+        self.queue.dequeue()
+
+        self.assertNotIn("a", self.queue)
+        self.assertIn("c", self.queue)
+        self.assertEqual(str(self.queue), "b->c")
+
+    def test_enqueue_and_dequeue_are_quiet(self):
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            self.queue.enqueue("a")
+            self.queue.dequeue()
+
+        self.assertEqual(stdout.getvalue(), "")
+
+    def test_counting_observer(self):
+        observer = CountingObserver()
+        queue = Queue(observer=observer)
+        for element in range(3):
+            queue.enqueue(element)
+        queue.dequeue()
+
+        self.assertEqual(observer.counts, {QueueEvent.ENQUEUED: 3, QueueEvent.DEQUEUED: 1})
+
+    def test_logging_observer(self):
+        queue = Queue(observer=LoggingObserver())
+        with self.assertLogs("dsa_kuuking.queues", level="DEBUG") as logs:
+            queue.enqueue("a")
+            queue.dequeue()
+
+        self.assertEqual(logs.output, [
+            "DEBUG:dsa_kuuking.queues:enqueued 'a' (size 1)",
+            "DEBUG:dsa_kuuking.queues:dequeued 'a' (size 0)",
+        ])
+
+    def test_duplicates_and_unhashable_elements(self):
+        for element in ("a", "a", ["b"]):
+            self.queue.enqueue(element)
+
+        self.assertEqual(self.queue.dequeue().unwrap(), "a")
+        self.assertIn("a", self.queue)
+        self.assertIn(["b"], self.queue)
+        self.assertEqual(self.queue.dequeue().unwrap(), "a")
+        self.assertNotIn("a", self.queue)
+
+    def test_track_membership_counts_duplicates(self):
+        queue = Queue(track_membership=True)
+        for element in ("a", "a", "b"):
+            queue.enqueue(element)
+
+        self.assertEqual(queue._counts, {"a": 2, "b": 1})
+        queue.dequeue()
+        self.assertIn("a", queue)
+        queue.dequeue()
+        self.assertNotIn("a", queue)
+        self.assertEqual(queue._counts, {"b": 1})
+
+
+    def test_unhashable_element_leaves_tracked_queue_as_it_was(self):
+        queue = Queue(track_membership=True)
+        queue.enqueue("a")
+
+        with self.assertRaises(TypeError):
+            queue.enqueue(["b"])
+        self.assertEqual(list(queue.traverse()), ["a"])
+        self.assertEqual(queue._counts, {"a": 1})
+
+if __name__ == "__main__":
+    unittest.main()
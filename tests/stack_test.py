@@ -0,0 +1,40 @@
+import unittest
+
+from dsa_kuuking.stacks.implementation.stack_list import Stack
+
+
+class StackListTest(unittest.TestCase):
+    def test_lifo_with_duplicates(self):
+        stack = Stack()
+        for element in ("a", "b", "a"):
+            stack.append(element)
+
+        self.assertEqual(stack.pop(), "a")
+        self.assertIn("a", stack)
+        self.assertEqual([stack.pop(), stack.pop()], ["b", "a"])
+        self.assertNotIn("a", stack)
+        self.assertTrue(stack.is_empty())
+
+    def test_unhashable_elements(self):
+        stack = Stack()
+        stack.append(["a"])
+
+        self.assertIn(["a"], stack)
+        self.assertEqual(stack.pop(), ["a"])
+
+    def test_track_membership_counts_duplicates(self):
+        stack = Stack(track_membership=True)
+        for element in ("a", "b", "a"):
+            stack.append(element)
+
+        self.assertEqual(stack._counts, {"a": 2, "b": 1})
+        stack.pop()
+        self.assertIn("a", stack)
+        stack.pop()
+        stack.pop()
+        self.assertNotIn("a", stack)
+        self.assertEqual(stack._counts, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
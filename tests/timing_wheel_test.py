@@ -0,0 +1,99 @@
+import random
+import unittest
+from datetime import datetime, timedelta
+from typing import override
+
+from dsa_kuuking.queues.timing_wheel.implementation.timing_wheel import TimingWheel
+
+
+class TimingWheelTest(unittest.TestCase):
+    @override
+    def setUp(self):
+        # small wheels, so that short tests cascade through every level and the overflow
+        self.wheel = TimingWheel(resolution=1, slots=4, levels=2)
+
+    def test_fires_at_the_right_tick(self):
+        for time in (1, 3, 4, 5, 15, 16, 17, 40, 100):
+            self.wheel.schedule(time, time)
+
+        fired = {}
+        for now in range(101):
+            for item in self.wheel.pop_due(now):
+                fired[item] = now
+
+        self.assertEqual(fired, {time: time for time in (1, 3, 4, 5, 15, 16, 17, 40, 100)})
+        self.assertTrue(self.wheel.is_empty())
+
+    def test_matches_a_sorted_schedule(self):
+        times = [random.uniform(0, 500) for _ in range(2_000)]
+        handles = [self.wheel.schedule(index, time) for index, time in enumerate(times)]
+        cancelled = set(random.sample(range(len(times)), 1_500))
+        for index in cancelled:
+            self.assertTrue(self.wheel.cancel(handles[index]))
+            self.assertFalse(self.wheel.cancel(handles[index]))
+
+        self.assertEqual(len(self.wheel), 500)
+        now = 0.0
+        while now < 510:
+            now += random.uniform(0, 7)
+            for item in self.wheel.pop_due(now):
+                # never early, and at most one tick late
+                self.assertLessEqual(times[item], now)
+                self.assertGreater(times[item], now - 8)
+                self.assertNotIn(item, cancelled)
+                cancelled.add(item)
+
+        self.assertEqual(len(cancelled), len(times))
+
+    def test_enqueue_dequeue_peek(self):
+        first = self.wheel.enqueue("Timeout A", 2)
+        self.wheel.enqueue("Timeout B", 2)
+        self.wheel.enqueue("Timeout C", 9)
+
+        with self.assertRaises(IndexError):
+            self.wheel.dequeue()
+
+        self.assertEqual(self.wheel.advance(2), 2)
+        self.assertEqual(self.wheel.due(), 2)
+        self.assertEqual(self.wheel.peek(), "Timeout A")
+
+        # a due timer can still be cancelled
+        self.assertTrue(self.wheel.cancel(first))
+        self.assertEqual(self.wheel.peek(), "Timeout B")
+        self.assertEqual(self.wheel.dequeue(), "Timeout B")
+        self.assertEqual(len(self.wheel), 1)
+
+        with self.assertRaises(ValueError):
+            self.wheel.advance(1)
+
+    def test_past_and_far_future(self):
+        self.wheel.advance(10)
+        self.wheel.schedule("Past", 5)
+        far = self.wheel.schedule("Far", 10**6)
+
+        self.assertEqual(self.wheel.dequeue(), "Past")
+        self.assertEqual(self.wheel.pop_due(10**6 - 1), [])
+        self.assertTrue(far.active)
+        self.assertEqual(self.wheel.pop_due(10**6), ["Far"])
+        self.assertFalse(far.active)
+
+    def test_datetimes(self):
+        start = datetime(2026, 1, 1)
+        wheel = TimingWheel(resolution=timedelta(milliseconds=10), start=start)
+        wheel.schedule("Timeout A", start + timedelta(seconds=2))
+        wheel.schedule("Timeout B", start + timedelta(seconds=1))
+
+        self.assertEqual(wheel.pop_due(start + timedelta(milliseconds=999)), [])
+        self.assertEqual(wheel.pop_due(start + timedelta(seconds=5)), ["Timeout B", "Timeout A"])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            TimingWheel(slots=6)
+        with self.assertRaises(ValueError):
+            TimingWheel(resolution=0)
+        with self.assertRaises(ValueError):
+            TimingWheel(levels=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+
+from dsa_kuuking.queues.circular_queue.implementation import typed_circular_queue
+from dsa_kuuking.queues.circular_queue.implementation.typed_circular_queue import TypedCircularQueue
+from dsa_kuuking.queues.queue.implementation.queue_observers import CountingObserver
+from dsa_kuuking.types.enums.queue_event import QueueEvent
+from dsa_kuuking.types.errors.queue_full_exception import QueueFullException
+
+
+class TypedCircularQueueTest(unittest.TestCase):
+    backend = "array"
+
+    def test_fifo_and_batches(self):
+        queue = TypedCircularQueue(maxsize=8, backend=self.backend)
+        queue.enqueue(1.5)
+        queue.enqueue_many([2.5, 3.5])
+
+        self.assertEqual(queue.dequeue().unwrap(), 1.5)
+        self.assertEqual(queue.dequeue_many(5), [2.5, 3.5])
+        self.assertTrue(queue.is_empty())
+
+    def test_segments_are_views_split_at_the_wrap(self):
+        queue = TypedCircularQueue(maxsize=8, backend=self.backend)
+        self.assertEqual(queue.segments(), ())
+
+        queue.enqueue_many(range(6))
+        self.assertEqual([segment.tolist() for segment in queue.segments()], [[0.0, 1.0, 2.0, 3.0, 4.0, 5.0]])
+
+        queue.dequeue_many(4)
+        queue.enqueue_many(range(6, 10))
+        segments = queue.segments()
+        self.assertEqual([segment.tolist() for segment in segments], [[4.0, 5.0, 6.0, 7.0], [8.0, 9.0]])
+        self.assertEqual(segments[0].format, "d")
+
+        # a view, not a copy
+        queue._queue[4] = 40.0
+        self.assertEqual(segments[0][0], 40.0)
+
+    def test_wrong_type_is_rejected_before_enqueue(self):
+        queue = TypedCircularQueue(maxsize=4, typecode="i", backend=self.backend)
+        queue.enqueue(1)
+
+        with self.assertRaises((TypeError, ValueError)):
+            queue.enqueue("a")
+        with self.assertRaises((TypeError, ValueError)):
+            queue.enqueue_many([2, "b"])
+        self.assertEqual(list(queue.traverse()), [1])
+
+    def test_wrong_type_is_rejected_before_a_full_queue_makes_room(self):
+        for mode in ("grow", "overwrite"):
+            observer = CountingObserver()
+            queue = TypedCircularQueue(maxsize=2, backend=self.backend, observer=observer, mode=mode)
+            queue.enqueue_many([1.0, 2.0])
+
+            with self.assertRaises((TypeError, ValueError)):
+                queue.enqueue("x")
+            self.assertEqual(list(queue.traverse()), [1.0, 2.0], mode)
+            self.assertEqual(queue.size, 2, mode)
+            self.assertEqual(observer.counts[QueueEvent.OVERWRITTEN], 0, mode)
+
+    def test_modes(self):
+        grow = TypedCircularQueue(maxsize=2, mode="grow", backend=self.backend)
+        grow.enqueue_many([1.0, 2.0])
+        grow.dequeue()
+        grow.enqueue_many(range(3, 8))
+        self.assertEqual(list(grow.traverse()), [2.0, 3.0, 4.0, 5.0, 6.0, 7.0])
+
+        self.assertEqual(grow.size, 8)
+
+        observer = CountingObserver()
+        overwrite = TypedCircularQueue(maxsize=3, mode="overwrite", backend=self.backend, observer=observer)
+        overwrite.enqueue_many(range(5))
+        overwrite.enqueue(5.0)
+        self.assertEqual(list(overwrite.traverse()), [3.0, 4.0, 5.0])
+        self.assertEqual(observer.counts[QueueEvent.OVERWRITTEN], 2)
+
+        fixed = TypedCircularQueue(maxsize=1, backend=self.backend)
+        fixed.enqueue(1.0)
+        with self.assertRaises(QueueFullException):
+            fixed.enqueue(2.0)
+
+    def test_hands_out_python_numbers(self):
+        queue = TypedCircularQueue(maxsize=4, typecode="q", backend=self.backend)
+        queue.enqueue_many([1, 2, 3])
+
+        self.assertIs(type(queue.get_peek().unwrap()), int)
+        self.assertEqual([type(element) for element in queue.traverse()], [int, int, int])
+        self.assertIs(type(queue.dequeue().unwrap()), int)
+        self.assertEqual(str(queue), "2->3")
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            TypedCircularQueue(backend="list")
+
+    def test_unknown_typecode(self):
+        with self.assertRaises(ValueError):
+            TypedCircularQueue(typecode="float64", backend=self.backend)
+
+
+@unittest.skipIf(typed_circular_queue.numpy is None, "NumPy is not installed")
+class NumpyTypedCircularQueueTest(TypedCircularQueueTest):
+    backend = "numpy"
+
+    def test_typecode_without_a_numpy_dtype(self):
+        with self.assertRaises(ValueError):
+            TypedCircularQueue(typecode="u", backend=self.backend)
+
+
+if __name__ == "__main__":
+    unittest.main()